@@ -5,5 +5,9 @@
 """
 
 from .carrier_list_pane import CarrierListPane
+from .carrier_list_store import (
+    CarrierListStore,
+    get_carrier_list_store,
+)
 
-__all__ = ["CarrierListPane"]
+__all__ = ["CarrierListPane", "CarrierListStore", "get_carrier_list_store"]
@@ -23,6 +23,7 @@
     CustomTitleBarWidget,
 )
 
+from .carrier_list_store import get_carrier_list_store
 from .db.carrier_db_manager import CarrierDBManager
 from .models.carrier_list_proxy_model import CarrierListProxyModel
 from .models.pandas_table_model import PandasTableModel
@@ -81,6 +82,7 @@ def __init__(
         )
         self.db_manager = CarrierDBManager(mandates_db_path, self.eightbox_db_path)
         self.json_path = "carrier_list.json"
+        self.carrier_list_store = get_carrier_list_store(self.json_path)
 
         # Create ignored_carriers table if it doesn't exist
         self.db_manager.create_ignored_carriers_table()
@@ -406,7 +408,7 @@ def remove_carrier(self):
 
                 # Update the JSON file
                 try:
-                    self.main_model.df.to_json(self.json_path, orient="records")
+                    self.carrier_list_store.save(self.main_model.df)
                 except Exception as e:
                     CustomErrorDialog.error(
                         self, "Error", f"Failed to update the JSON file: {e}"
@@ -490,7 +492,7 @@ def reset_carrier_list(self):
     def save_to_json(self):
         """Save the current carrier list to JSON file."""
         try:
-            self.main_model.df.to_json(self.json_path, orient="records")
+            self.carrier_list_store.save(self.main_model.df)
             CustomNotificationDialog.show_notification(
                 self, "Success", "Carrier list has been saved."
             )
@@ -605,7 +607,7 @@ def show_new_carriers_dialog(self, new_carriers, new_carrier_names, df):
 
             # Save the updated list to JSON immediately
             try:
-                updated_df.to_json(self.json_path, orient="records")
+                self.carrier_list_store.save(updated_df)
 
                 # Emit signals to update the main application
                 self.carrier_list_updated.emit(updated_df)
@@ -0,0 +1,153 @@
+"""Shared in-memory cache of the saved carrier list.
+
+The carrier list is persisted in carrier_list.json and read by the date range
+processing, moves cleaning and clock ring fetching code. This module parses
+the file once, keeps it with normalized carrier names and dtypes, and only
+re-reads it after it has been written.
+"""
+
+import json
+import os
+import threading
+
+import pandas as pd
+from PyQt5.QtCore import (
+    QObject,
+    pyqtSignal,
+)
+
+
+class CarrierListStore(QObject):
+    """Cached, normalized view of a carrier list JSON file.
+
+    The cached frame has:
+        - carrier_name: Stripped and lowercased carrier name
+        - list_status: Stripped and lowercased list status
+        - hour_limit (float): Numeric hour limit
+
+    The file is re-read when its modification time or size changes, so writes
+    that bypass save() are still picked up.
+
+    Signals:
+        carrier_list_changed: Emitted with the new carrier list after save()
+    """
+
+    carrier_list_changed = pyqtSignal(pd.DataFrame)
+
+    def __init__(self, json_path="carrier_list.json", parent=None):
+        """Initialize the store.
+
+        Args:
+            json_path (str): Path to the carrier list JSON file
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self.json_path = json_path
+        self._frame = None
+        self._file_state = None
+
+        # Date range processing reads the list from a worker thread
+        self._lock = threading.Lock()
+
+    def exists(self):
+        """bool: True if the carrier list file exists."""
+        return os.path.exists(self.json_path)
+
+    def get_frame(self):
+        """Get the carrier list.
+
+        Returns:
+            pd.DataFrame: A copy of the cached carrier list, so callers can
+                modify it freely without affecting the cache
+
+        Raises:
+            FileNotFoundError: If the carrier list file does not exist
+            json.JSONDecodeError: If the carrier list file is corrupted
+        """
+        with self._lock:
+            file_state = self.get_file_state()
+            if file_state is None:
+                self._frame = None
+                self._file_state = None
+                raise FileNotFoundError(self.json_path)
+
+            if self._frame is None or file_state != self._file_state:
+                with open(self.json_path, "r", encoding="utf-8") as json_file:
+                    self._frame = self.normalize(pd.DataFrame(json.load(json_file)))
+                self._file_state = file_state
+
+            return self._frame.copy()
+
+    def save(self, carrier_list):
+        """Write the carrier list to disk and notify listeners.
+
+        Args:
+            carrier_list (pd.DataFrame): Carrier list as edited in the UI
+        """
+        with self._lock:
+            carrier_list.to_json(self.json_path, orient="records")
+            self._frame = self.normalize(carrier_list)
+            self._file_state = self.get_file_state()
+            frame = self._frame.copy()
+        self.carrier_list_changed.emit(frame)
+
+    def invalidate(self):
+        """Drop the cached carrier list so the next read reloads the file."""
+        with self._lock:
+            self._frame = None
+            self._file_state = None
+
+    @staticmethod
+    def normalize(carrier_list):
+        """Normalize carrier names and column dtypes.
+
+        Args:
+            carrier_list (pd.DataFrame): Raw carrier list
+
+        Returns:
+            pd.DataFrame: Normalized copy of carrier_list
+        """
+        carrier_list = carrier_list.reset_index(drop=True)
+        if "carrier_name" in carrier_list.columns:
+            carrier_list["carrier_name"] = (
+                carrier_list["carrier_name"].str.strip().str.lower()
+            )
+        if "list_status" in carrier_list.columns:
+            carrier_list["list_status"] = (
+                carrier_list["list_status"].str.strip().str.lower()
+            )
+        if "hour_limit" in carrier_list.columns:
+            carrier_list["hour_limit"] = pd.to_numeric(
+                carrier_list["hour_limit"], errors="coerce"
+            )
+        return carrier_list
+
+    def get_file_state(self):
+        """Get the modification time and size of the carrier list file.
+
+        Returns:
+            tuple: (mtime_ns, size), or None if the file does not exist
+        """
+        try:
+            stat = os.stat(self.json_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+_carrier_list_stores = {}
+
+
+def get_carrier_list_store(json_path="carrier_list.json"):
+    """Get the shared store for a carrier list file.
+
+    Args:
+        json_path (str): Path to the carrier list JSON file
+
+    Returns:
+        CarrierListStore: The store shared by all callers using json_path
+    """
+    key = os.path.abspath(json_path)
+    if key not in _carrier_list_stores:
+        _carrier_list_stores[key] = CarrierListStore(json_path)
+    return _carrier_list_stores[key]
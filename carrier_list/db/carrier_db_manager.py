@@ -1,10 +1,9 @@
 """Database operations for carrier list management."""
 
-import sqlite3
-
 import pandas as pd
 
 from custom_widgets import CustomNotificationDialog
+from database.connections import get_connection_pool
 
 
 class CarrierDBManager:
@@ -21,9 +20,11 @@ def __init__(self, mandates_db_path, eightbox_db_path):
         self.eightbox_db_path = eightbox_db_path
 
     def fetch_carrier_data(self):
-        """Fetch carrier data from the mandates database.
+        """Fetch current carrier data from the eightbox database.
 
-        Retrieves carrier information excluding those with 'out of station' status.
+        Retrieves each carrier's latest record from carriers_current, which the
+        sync keeps up to date with the mandates database, excluding carriers
+        with 'out of station' status.
 
         Returns:
             pd.DataFrame: Carrier data with columns for name, effective date,
@@ -33,35 +34,32 @@ def fetch_carrier_data(self):
         SELECT
             carrier_name,
             -- Format effective_date to exclude timestamp
-            DATE(MAX(effective_date)) AS effective_date,
+            DATE(effective_date) AS effective_date,
             list_status,
             route_s,
             station
-        FROM carriers
-        GROUP BY carrier_name
+        FROM carriers_current
         """
         try:
-            with sqlite3.connect(self.mandates_db_path) as conn:
-                df = pd.read_sql_query(query, conn)
+            conn = get_connection_pool().read(self.eightbox_db_path)
+            df = pd.read_sql_query(query, conn)
 
-                # Filter out carriers with "out of station"
-                df = df[
-                    ~df["station"].str.contains("out of station", case=False, na=False)
-                ]
+            # Filter out carriers with "out of station"
+            df = df[~df["station"].str.contains("out of station", case=False, na=False)]
 
-                # Convert effective_date to string (YYYY-MM-DD) for uniform formatting
-                df["effective_date"] = pd.to_datetime(df["effective_date"]).dt.strftime(
-                    "%Y-%m-%d"
-                )
+            # Convert effective_date to string (YYYY-MM-DD) for uniform formatting
+            df["effective_date"] = pd.to_datetime(df["effective_date"]).dt.strftime(
+                "%Y-%m-%d"
+            )
 
-                # Drop the station column after filtering to maintain the original structure
-                df.drop(columns=["station"], inplace=True)
+            # Drop the station column after filtering to maintain the original structure
+            df.drop(columns=["station"], inplace=True)
 
-                # Add hour_limit column with default value of 12.00
-                if "hour_limit" not in df.columns:
-                    df["hour_limit"] = 12.00
+            # Add hour_limit column with default value of 12.00
+            if "hour_limit" not in df.columns:
+                df["hour_limit"] = 12.00
 
-                return df
+            return df
 
         except Exception as e:
             CustomNotificationDialog.show_notification(None, "Database Error", str(e))
@@ -79,7 +77,7 @@ def fetch_carrier_data(self):
 
     def create_ignored_carriers_table(self):
         """Create the ignored_carriers table if it doesn't exist."""
-        with sqlite3.connect(self.eightbox_db_path) as conn:
+        with get_connection_pool().write(self.eightbox_db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -88,7 +86,6 @@ def create_ignored_carriers_table(self):
                 )
                 """
             )
-            conn.commit()
 
     def get_ignored_carriers(self):
         """Get list of ignored carriers.
@@ -96,10 +93,9 @@ def get_ignored_carriers(self):
         Returns:
             list: List of ignored carrier names
         """
-        with sqlite3.connect(self.eightbox_db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT carrier_name FROM ignored_carriers")
-            return [row[0] for row in cursor.fetchall()]
+        cursor = get_connection_pool().read(self.eightbox_db_path).cursor()
+        cursor.execute("SELECT carrier_name FROM ignored_carriers")
+        return [row[0] for row in cursor.fetchall()]
 
     def add_to_ignored_carriers(self, carrier_names):
         """Add carriers to the ignored list.
@@ -107,10 +103,9 @@ def add_to_ignored_carriers(self, carrier_names):
         Args:
             carrier_names (list): List of carrier names to ignore
         """
-        with sqlite3.connect(self.eightbox_db_path) as conn:
+        with get_connection_pool().write(self.eightbox_db_path) as conn:
             cursor = conn.cursor()
             cursor.executemany(
                 "INSERT OR IGNORE INTO ignored_carriers (carrier_name) VALUES (?)",
                 [(name,) for name in carrier_names],
             )
-            conn.commit()
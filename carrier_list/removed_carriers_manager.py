@@ -4,8 +4,6 @@
 removed from the carrier list.
 """
 
-import sqlite3
-
 import pandas as pd
 from PyQt5.QtCore import (
     QAbstractTableModel,
@@ -27,8 +25,11 @@
     CustomTitleBarWidget,
     CustomWarningDialog,
 )
+from database.connections import get_connection_pool
 from theme import REMOVED_CARRIERS_STYLE
 
+from .carrier_list_store import get_carrier_list_store
+
 
 class RemovedCarriersTableModel(QAbstractTableModel):
     """Table model for displaying removed carriers data."""
@@ -157,33 +158,31 @@ def __init__(self, eightbox_db_path, parent=None):
     def load_removed_carriers(self):
         """Load removed carriers from the database."""
         try:
-            with sqlite3.connect(self.eightbox_db_path) as conn:
-                query = """
-                    SELECT carrier_name
-                    FROM ignored_carriers
-                    ORDER BY carrier_name ASC
-                """
-                df = pd.read_sql_query(query, conn)
-
-                # Create and set the model
-                model = RemovedCarriersTableModel(df, self)
-                self.table_view.setModel(model)
-
-                # Disconnect any existing selection signals to prevent multiple connections
-                try:
-                    self.table_view.selectionModel().selectionChanged.disconnect()
-                except (
-                    TypeError
-                ):  # This occurs when there are no connections to disconnect
-                    pass
-
-                # Connect selection signal to update button state
-                self.table_view.selectionModel().selectionChanged.connect(
-                    self.on_selection_changed
-                )
+            conn = get_connection_pool().read(self.eightbox_db_path)
+            query = """
+                SELECT carrier_name
+                FROM ignored_carriers
+                ORDER BY carrier_name ASC
+            """
+            df = pd.read_sql_query(query, conn)
+
+            # Create and set the model
+            model = RemovedCarriersTableModel(df, self)
+            self.table_view.setModel(model)
+
+            # Disconnect any existing selection signals to prevent multiple connections
+            try:
+                self.table_view.selectionModel().selectionChanged.disconnect()
+            except TypeError:  # This occurs when there are no connections to disconnect
+                pass
 
-                # Update button state
-                self.restore_button.setEnabled(False)
+            # Connect selection signal to update button state
+            self.table_view.selectionModel().selectionChanged.connect(
+                self.on_selection_changed
+            )
+
+            # Update button state
+            self.restore_button.setEnabled(False)
 
         except Exception as e:
             CustomWarningDialog.warning(
@@ -205,13 +204,12 @@ def restore_selected_carriers(self):
 
         try:
             # First, remove from ignored list
-            with sqlite3.connect(self.eightbox_db_path) as conn:
+            with get_connection_pool().write(self.eightbox_db_path) as conn:
                 cursor = conn.cursor()
                 cursor.executemany(
                     "DELETE FROM ignored_carriers WHERE carrier_name = ?",
                     [(carrier,) for carrier in carriers_to_restore],
                 )
-                conn.commit()
 
             try:
                 # Load current carrier list
@@ -244,7 +242,7 @@ def restore_selected_carriers(self):
             )
 
             # Save updated carrier list
-            updated_carriers.to_json("carrier_list.json", orient="records")
+            get_carrier_list_store(self.json_path).save(updated_carriers)
 
             # Emit signal to update carrier list if parent has the signal
             if hasattr(self.parent_widget, "carrier_list_updated"):
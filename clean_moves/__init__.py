@@ -15,11 +15,12 @@
 from clean_moves.utils.clean_moves_utils import (
     detect_invalid_moves,
     format_moves_breakdown,
-    get_valid_routes,
     parse_moves_entry,
+    route_type,
     update_moves_in_database,
     validate_move_times,
-    validate_route_number,
+    validate_routes,
+    write_back_moves,
 )
 
 __all__ = [
@@ -29,9 +30,10 @@
     "MovesManager",
     "detect_invalid_moves",
     "format_moves_breakdown",
-    "get_valid_routes",
     "parse_moves_entry",
+    "route_type",
     "update_moves_in_database",
     "validate_move_times",
-    "validate_route_number",
+    "validate_routes",
+    "write_back_moves",
 ]
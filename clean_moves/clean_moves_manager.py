@@ -6,20 +6,14 @@
 3. Coordinating between the UI and database operations
 """
 
-import json
-
-import pandas as pd
 from PyQt5.QtCore import (
     QObject,
     Qt,
 )
-from PyQt5.QtWidgets import QApplication
 
+from carrier_list.carrier_list_store import get_carrier_list_store
 from clean_moves.ui.clean_moves_dialog import CleanMovesDialog
-from clean_moves.utils.clean_moves_utils import (
-    detect_invalid_moves,
-    get_valid_routes,
-)
+from clean_moves.utils.clean_moves_utils import detect_invalid_moves
 from custom_widgets import (
     CustomInfoDialog,
     CustomProgressDialog,
@@ -56,26 +50,15 @@ def show_clean_moves_dialog(self):
             )
             return
 
-        # Get valid routes
-        valid_routes = get_valid_routes(self.main_app.eightbox_db_path)
-        if not valid_routes:
-            CustomWarningDialog.warning(
-                self.main_app,
-                "Error",
-                "Failed to get valid route numbers from database.",
-            )
-            return
-
         # Load carrier list
         try:
-            with open("carrier_list.json", "r", encoding="utf-8") as f:
-                carrier_list = json.load(f)
-                # Only include WAL and NL carriers
-                valid_carriers = {
-                    carrier["carrier_name"].lower()
-                    for carrier in carrier_list
-                    if carrier["list_status"].lower() in ["wal", "nl"]
-                }
+            carrier_list = get_carrier_list_store().get_frame()
+            # Only include WAL and NL carriers
+            valid_carriers = set(
+                carrier_list.loc[
+                    carrier_list["list_status"].isin(["wal", "nl"]), "carrier_name"
+                ]
+            )
         except Exception as e:
             CustomWarningDialog.warning(
                 self.main_app, "Error", f"Failed to load carrier list: {str(e)}"
@@ -83,9 +66,7 @@ def show_clean_moves_dialog(self):
             return
 
         # Detect invalid moves
-        invalid_moves = detect_invalid_moves(
-            current_data, self.main_app.eightbox_db_path
-        )
+        invalid_moves = detect_invalid_moves(current_data)
         if invalid_moves.empty:
             CustomInfoDialog.information(
                 self.main_app,
@@ -108,117 +89,42 @@ def show_clean_moves_dialog(self):
             return
 
         # Create and show dialog
-        dialog = CleanMovesDialog(invalid_moves, valid_routes, self.main_app)
-        dialog.moves_cleaned.connect(
-            lambda cleaned: self.handle_cleaned_moves(cleaned, current_data)
-        )
+        dialog = CleanMovesDialog(invalid_moves, self.main_app)
+        dialog.moves_cleaned.connect(self.handle_cleaned_moves)
         dialog.exec_()
 
-    def handle_cleaned_moves(self, cleaned_moves, current_data):
+    def handle_cleaned_moves(self, cleaned_moves):
         """Handle cleaned moves data from the dialog.
 
+        The dialog has already written the cleaned moves to the database.
+
         Args:
             cleaned_moves: Dictionary mapping (carrier, date) to cleaned moves string
-            current_data: The current DataFrame of clock ring data
         """
         if not cleaned_moves:
             return
 
-        # Create progress dialog
-        progress = self.create_progress_dialog(
-            "Updating Moves", "Applying cleaned moves data..."
-        )
-        progress.show()
-
+        # Patch only the edited carrier-days when the processed data allows it
         try:
-            # Phase 1: Update moves (0-30%)
-            progress.setLabelText("Updating moves data...")
-            progress.setValue(10)
-            QApplication.processEvents()
-
-            for (carrier, date), moves in cleaned_moves.items():
-                mask = (current_data["carrier_name"] == carrier) & (
-                    current_data["rings_date"] == date
-                )
-                current_data.loc[mask, "moves"] = moves
-
-            progress.setValue(30)
-            QApplication.processEvents()
-
-            # Phase 1.5: Merge carrier list data (30-50%)
-            progress.setLabelText("Updating carrier data...")
-            progress.setValue(40)
-            QApplication.processEvents()
-
-            try:
-                with open("carrier_list.json", "r", encoding="utf-8") as json_file:
-                    carrier_list = pd.DataFrame(json.load(json_file))
-
-                # Normalize carrier names
-                carrier_list["carrier_name"] = (
-                    carrier_list["carrier_name"].str.strip().str.lower()
-                )
-                current_data["carrier_name"] = (
-                    current_data["carrier_name"].str.strip().str.lower()
+            if self.main_app.date_range_manager.update_moves_for_carrier_days(
+                cleaned_moves
+            ):
+                CustomInfoDialog.information(
+                    self.main_app,
+                    "Success",
+                    "Moves data has been cleaned and violations reprocessed.",
                 )
-
-                # Drop existing list_status and hour_limit columns if they exist
-                columns_to_drop = [
-                    "list_status",
-                    "list_status_x",
-                    "list_status_y",
-                    "hour_limit",
-                ]
-                for col in columns_to_drop:
-                    if col in current_data.columns:
-                        current_data = current_data.drop(columns=[col])
-
-                # Merge with carrier list data
-                current_data = current_data.merge(
-                    carrier_list[["carrier_name", "list_status", "hour_limit"]],
-                    on="carrier_name",
-                    how="left",
-                )
-
-            except Exception as e:
-                print(f"Error merging carrier list data: {e}")
-                current_data["list_status"] = "unknown"
-                current_data["hour_limit"] = 12.00
-
-            progress.setValue(50)
-            QApplication.processEvents()
-
-            # Phase 2: Reprocess violations (50-90%)
-            progress.setLabelText("Reprocessing violations...")
-            progress.setValue(60)
-            QApplication.processEvents()
-
-            self.main_app.update_violations_and_remedies(current_data)
-
-            progress.setValue(90)
-            QApplication.processEvents()
-
-            # Phase 3: Cleanup (90-100%)
-            progress.setLabelText("Finalizing changes...")
-            progress.setValue(100)
-            QApplication.processEvents()
-
+                return
         except Exception as e:
-            # Clean up progress dialog before showing error
-            self.cleanup_progress_dialog(progress)
-            CustomWarningDialog.warning(
-                self.main_app, "Error", f"Failed to process cleaned moves: {str(e)}"
-            )
-            return
-
-        # Clean up progress dialog before showing success
-        self.cleanup_progress_dialog(progress)
+            print(f"Error updating cleaned moves incrementally: {e}")
 
-        # Show success message after progress dialog is cleaned up
+        # Otherwise process the date range again on the thread pool, reading
+        # the cleaned moves back from the database
+        self.main_app.date_range_manager.rerun_pipeline()
         CustomInfoDialog.information(
             self.main_app,
             "Success",
-            "Moves data has been cleaned and violations reprocessed.",
+            "Moves data has been cleaned. Violations are being reprocessed.",
         )
 
     def create_progress_dialog(self, title="Processing...", initial_text=""):
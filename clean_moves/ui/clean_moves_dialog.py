@@ -30,8 +30,8 @@
 from clean_moves.utils.clean_moves_utils import (
     format_moves_breakdown,
     parse_moves_entry,
+    route_type,
     update_moves_in_database,
-    validate_route_number,
     validate_time_input,
 )
 from custom_widgets import (
@@ -224,7 +224,7 @@ def validate_inputs(self):
                     break
 
                 # Validate route
-                if not validate_route_number(route, set()):
+                if route_type(route) is None:
                     valid = False
                     break
 
@@ -292,11 +292,10 @@ def validate_and_accept(self):
 class EditMovesDialog(QDialog):
     """Dialog for editing individual moves."""
 
-    def __init__(self, moves_str, valid_routes, parent=None):
+    def __init__(self, moves_str, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
         self.setWindowModality(Qt.ApplicationModal)
-        self.valid_routes = valid_routes
 
         # Parse moves
         self.moves = parse_moves_entry(moves_str)
@@ -469,7 +468,7 @@ def validate_inputs(self):
                     break
 
                 # Validate route
-                if not validate_route_number(route, self.valid_routes):
+                if route_type(route) is None:
                     valid = False
                     break
 
@@ -527,7 +526,7 @@ def validate_and_accept(self):
                     break
 
                 # Validate route
-                if not validate_route_number(route, self.valid_routes):
+                if route_type(route) is None:
                     valid = False
                     break
 
@@ -562,17 +561,15 @@ class CleanMovesDialog(QDialog):
 
     moves_cleaned = pyqtSignal(dict)  # Signal emitted when moves are cleaned
 
-    def __init__(self, invalid_moves_df, valid_routes, parent=None):
+    def __init__(self, invalid_moves_df, parent=None):
         """Initialize the dialog.
 
         Args:
             invalid_moves_df: DataFrame containing moves entries with invalid routes
-            valid_routes: Set of valid route numbers
             parent: Parent widget
         """
         super().__init__(parent)
         self.invalid_moves = invalid_moves_df
-        self.valid_routes = valid_routes
         self.cleaned_moves = {}  # Store cleaned moves data
         self.current_row = None  # Currently selected row
 
@@ -936,7 +933,7 @@ def edit_moves(self):
         moves = self.table.item(self.current_row, 2).text()
 
         # Show edit dialog
-        dialog = EditMovesDialog(moves, self.valid_routes, self)
+        dialog = EditMovesDialog(moves, self)
         if dialog.exec_() == QDialog.Accepted:
             # Get the edited moves
             new_moves = dialog.get_result()
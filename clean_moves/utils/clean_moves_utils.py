@@ -2,53 +2,56 @@
 
 This module provides functionality to:
 1. Detect moves with invalid route numbers (0000)
-2. Validate route numbers against the carriers table
+2. Validate route numbers, one at a time or a whole column at once
 3. Clean and format moves data
 """
 
 import re
-import sqlite3
 from typing import (
     Dict,
     List,
-    Set,
+    Optional,
     Tuple,
 )
 
+import numpy as np
 import pandas as pd
 
-
-def get_valid_routes(db_path: str) -> Set[str]:
-    """Get set of valid route numbers from carriers table.
-
-    Args:
-        db_path: Path to the database
-
-    Returns:
-        Set of valid route numbers from route_s column
-    """
-    try:
-        with sqlite3.connect(db_path) as conn:
-            query = """
-                SELECT DISTINCT route_s
-                FROM carriers
-                WHERE route_s IS NOT NULL AND route_s != ''
-            """
-            df = pd.read_sql_query(query, conn)
-            # Convert route_s to 4-digit format and remove any invalid formats
-            routes = set()
-            for route in df["route_s"].dropna():
-                try:
-                    # Convert to 4-digit format
-                    route_num = int(route)
-                    if 0 < route_num < 10000:  # Valid range
-                        routes.add(f"{route_num:04d}")
-                except ValueError:
-                    continue
-            return routes
-    except Exception as e:
-        print(f"Error getting valid routes: {e}")
-        return set()
+from database.connections import get_connection_pool
+from violation_formulas.formula_utils import explode_moves
+
+ROUTE_TYPE_REGULAR = "regular"
+ROUTE_TYPE_COLLECTION = "collection"
+
+# Patterns a route code must fully match, by route type: a regular route is
+# 4 digits other than 0000 and a collection route 5 digits starting with 0
+ROUTE_PATTERNS = {
+    ROUTE_TYPE_REGULAR: r"(?!0000)[0-9]{4}",
+    ROUTE_TYPE_COLLECTION: r"0[0-9]{4}",
+}
+
+_COMPILED_ROUTE_PATTERNS = {
+    route_type: re.compile(pattern) for route_type, pattern in ROUTE_PATTERNS.items()
+}
+
+# Hours above which a single move or a day's moves are flagged
+MAX_MOVES_HOURS = 4.25
+
+# Issues a moves entry can be flagged for, in the order they are reported
+ISSUE_LABELS = [
+    "Invalid route(s)",
+    "Single move > 4.25 hrs",
+    "Total moves > 4.25 hrs",
+]
+
+# Issue text for every combination of ISSUE_LABELS, indexed by a bit mask
+ISSUE_DESCRIPTIONS = np.array(
+    [
+        ", ".join(label for bit, label in enumerate(ISSUE_LABELS) if code & (1 << bit))
+        for code in range(2 ** len(ISSUE_LABELS))
+    ],
+    dtype=object,
+)
 
 
 def format_moves_breakdown(moves_str):
@@ -79,12 +82,45 @@ def format_moves_breakdown(moves_str):
     return ", ".join(breakdowns)
 
 
-def detect_invalid_moves(moves_data: pd.DataFrame, db_path: str) -> pd.DataFrame:
+def route_type(route: str) -> Optional[str]:
+    """Get the type of a route code.
+
+    Args:
+        route: Route code
+
+    Returns:
+        ROUTE_TYPE_REGULAR or ROUTE_TYPE_COLLECTION, or None if the code is
+        not a valid route
+    """
+    if not isinstance(route, str):
+        return None
+    for route_type_name, pattern in _COMPILED_ROUTE_PATTERNS.items():
+        if pattern.fullmatch(route):
+            return route_type_name
+    return None
+
+
+def validate_routes(routes: pd.Series) -> pd.Series:
+    """Check every route code in a column.
+
+    Args:
+        routes: Route codes
+
+    Returns:
+        Boolean mask of regular and collection routes, with the index of routes
+    """
+    return routes.astype(str).str.fullmatch("|".join(ROUTE_PATTERNS.values()))
+
+
+def detect_invalid_moves(moves_data: pd.DataFrame) -> pd.DataFrame:
     """Detect moves entries with invalid route numbers or excessive hours.
 
+    Every moves string is exploded once into individual moves, the same way
+    violation detection parses them, and all checks run as column operations
+    over the exploded moves. Strings that cannot be parsed are not flagged.
+
     Args:
         moves_data: DataFrame containing moves data
-        db_path: Path to the database
 
     Returns:
         DataFrame containing entries with:
@@ -93,86 +129,73 @@ def detect_invalid_moves(moves_data: pd.DataFrame, db_path: str) -> pd.DataFrame
         - Individual moves > 4.25 hours
         - Combined moves > 4.25 hours for the day
     """
+    if moves_data.empty:
+        return pd.DataFrame()
 
-    def check_moves_validity(moves_str: str) -> Tuple[bool, str, float]:
-        """Check moves string for invalid routes and excessive hours.
-
-        Returns:
-            Tuple of (has_issues, reason, total_moves_hours)
-        """
-        if not isinstance(moves_str, str) or moves_str.strip().lower() in [
-            "none",
-            "",
-            "no moves",
-        ]:
-            return False, "", 0.0
-
-        try:
-            # Split moves into components
-            parts = [x.strip() for x in moves_str.split(",")]
-            total_moves_hours = 0.0
-            has_invalid_route = False
-            excessive_single_move = False
-
-            # Process in groups of 3 (start, end, route)
-            for i in range(0, len(parts), 3):
-                start = float(parts[i])
-                end = float(parts[i + 1])
-                route = parts[i + 2]
+    n_rows = len(moves_data)
+    moves = explode_moves(moves_data["moves"])
+    if moves.empty:
+        return pd.DataFrame()
 
-                # Calculate hours for this move
-                hours = end - start
-                total_moves_hours += hours
-
-                # Check for invalid route format
-                if route == "0000" or not (
-                    (len(route) == 4 and route.isdigit())
-                    or (  # Regular route
-                        len(route) == 5 and route[0] == "0" and route.isdigit()
-                    )  # Collection route
-                ):
-                    has_invalid_route = True
-
-                # Check for excessive single move
-                if hours > 4.25:
-                    excessive_single_move = True
-
-            # Determine reason for flagging
-            reason = []
-            if has_invalid_route:
-                reason.append("Invalid route(s)")
-            if excessive_single_move:
-                reason.append("Single move > 4.25 hrs")
-            if total_moves_hours > 4.25:
-                reason.append("Total moves > 4.25 hrs")
-
-            return bool(reason), ", ".join(reason), total_moves_hours
-
-        except Exception:
-            return False, "Error parsing moves", 0.0
-
-    # Apply validity check to moves data
-    invalid_moves = []
-
-    for _, row in moves_data.iterrows():
-        has_issues, reason, total_hours = check_moves_validity(row["moves"])
-        if has_issues:
-            invalid_move = row.copy()
-            invalid_move["Issue"] = reason
-            invalid_move["Total Moves Hours"] = total_hours
-            invalid_moves.append(invalid_move)
-
-    if not invalid_moves:
+    row_ids = moves["row_id"].to_numpy()
+    hours = (moves["end"] - moves["start"]).to_numpy()
+    is_invalid_route = (~validate_routes(moves["route"])).to_numpy()
+
+    # Summed in move order, like a running total over each moves string
+    total_hours = np.bincount(row_ids, weights=hours, minlength=n_rows)
+    has_invalid_route = np.bincount(row_ids, weights=is_invalid_route, minlength=n_rows)
+    has_long_move = np.bincount(
+        row_ids, weights=hours > MAX_MOVES_HOURS, minlength=n_rows
+    )
+
+    issue_codes = (
+        (has_invalid_route > 0) * 1
+        + (has_long_move > 0) * 2
+        + (total_hours > MAX_MOVES_HOURS) * 4
+    )
+    flagged = np.flatnonzero(issue_codes)
+    if len(flagged) == 0:
         return pd.DataFrame()
 
-    result = pd.DataFrame(invalid_moves)
+    result = moves_data.iloc[flagged].copy()
+    result["Issue"] = ISSUE_DESCRIPTIONS[issue_codes[flagged]]
+    result["Total Moves Hours"] = total_hours[flagged]
 
     # Add human-readable breakdown column
-    result["Moves Breakdown"] = result["moves"].apply(format_moves_breakdown)
+    result["Moves Breakdown"] = _format_moves_breakdowns(
+        moves[np.isin(row_ids, flagged)], flagged
+    )
 
     return result
 
 
+def _format_moves_breakdowns(moves: pd.DataFrame, row_ids: np.ndarray) -> list:
+    """Build format_moves_breakdown text for many rows from exploded moves.
+
+    Args:
+        moves: Exploded moves from explode_moves
+        row_ids: Rows to build text for, in output order
+
+    Returns:
+        Breakdown text for each of row_ids, "" when a row has no valid moves
+    """
+    # Skip moves that parse_moves_entry rejects
+    is_valid = (
+        moves["start"].between(0, 24)
+        & moves["end"].between(0, 24)
+        & moves["route"].astype(str).str.isdigit()
+    )
+    moves = moves[is_valid]
+
+    hours = moves["end"] - moves["start"]
+    hours = hours.where(hours >= 0, hours + 24)  # Moves crossing midnight
+    text = (
+        "rt" + moves["route"].astype(str) + " (" + hours.map("{:.2f}".format) + " hrs)"
+    )
+    breakdowns = text.groupby(moves["row_id"]).agg(", ".join)
+    return breakdowns.reindex(row_ids, fill_value="").tolist()
+
+
 def parse_moves_entry(moves_str: str) -> List[Tuple[float, float, str]]:
     """Parse a moves string into a list of (start, end, route) tuples.
 
@@ -226,34 +249,6 @@ def parse_moves_entry(moves_str: str) -> List[Tuple[float, float, str]]:
         return []
 
 
-def validate_route_number(route: str, valid_routes: Set[str]) -> bool:
-    """Validate a route number.
-
-    Args:
-        route: Route number to validate
-        valid_routes: Set of valid route numbers
-
-    Returns:
-        True if route is valid, False otherwise
-    """
-    if not route or route == "0000":
-        return False
-
-    # Must be 4 or 5 digits
-    if not (len(route) in [4, 5] and route.isdigit()):
-        return False
-
-    # Collection routes start with '0' and are 5 digits
-    if len(route) == 5 and route[0] == "0":
-        return True  # Allow any 5-digit route starting with 0
-
-    # Allow 4-digit routes regardless of leading zero
-    if len(route) == 4:
-        return True
-
-    return False
-
-
 def validate_move_times(start: float, end: float) -> bool:
     """Validate move start and end times in centesimal format.
 
@@ -298,6 +293,112 @@ def validate_move_times(start: float, end: float) -> bool:
         return False
 
 
+def write_back_moves(
+    db_path: str, cleaned_moves: Dict[Tuple[str, str], str]
+) -> Dict[Tuple[str, str], str]:
+    """Write cleaned moves to the database in one transaction.
+
+    The cleaned values are staged in a temporary table with a single prepared
+    statement and applied with one UPDATE ... FROM that looks up each clock
+    ring through the (carrier_name, rings_date) index. Cleaned moves must
+    only work valid routes, like the Clean Moves dialogs require.
+
+    Args:
+        db_path: Path to the database
+        cleaned_moves: Dictionary mapping (carrier_name, date) to cleaned moves string
+
+    Returns:
+        Dictionary mapping each key of cleaned_moves to its outcome:
+        - "updated": The clock ring's moves were changed
+        - "unchanged": The clock ring already had the cleaned moves
+        - "not_found": No clock ring exists for the carrier and date
+
+    Raises:
+        ValueError: If cleaned moves work an invalid route; no moves are changed
+        sqlite3.Error: If the update fails; no moves are changed
+    """
+    if not cleaned_moves:
+        return {}
+
+    routes = explode_moves(pd.Series(list(cleaned_moves.values())))["route"]
+    invalid_routes = sorted(set(routes[~validate_routes(routes)]))
+    if invalid_routes:
+        raise ValueError(f"Invalid route(s) in cleaned moves: {invalid_routes}")
+
+    keys = list(cleaned_moves)
+    with get_connection_pool().write(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TEMP TABLE moves_updates (
+                id INTEGER PRIMARY KEY,
+                carrier_name varchar,
+                rings_date TEXT,
+                moves varchar,
+                matched INTEGER,
+                changed INTEGER
+            )
+        """
+        )
+        try:
+            conn.executemany(
+                """
+                INSERT INTO temp.moves_updates (id, carrier_name, rings_date, moves)
+                VALUES (?, ?, DATE(?), ?)
+            """,
+                (
+                    (i, carrier_name, date, moves)
+                    for i, ((carrier_name, date), moves) in enumerate(
+                        cleaned_moves.items()
+                    )
+                ),
+            )
+
+            # Record outcomes before the update makes every match unchanged
+            conn.execute(
+                """
+                UPDATE temp.moves_updates AS u
+                SET matched = s.matched, changed = s.changed
+                FROM (
+                    SELECT
+                        u.id,
+                        COUNT(r.rowid) AS matched,
+                        COUNT(r.rowid) FILTER (WHERE r.moves IS NOT u.moves) AS changed
+                    FROM temp.moves_updates u
+                    LEFT JOIN rings3 r
+                    ON r.carrier_name = u.carrier_name AND r.rings_date = u.rings_date
+                    GROUP BY u.id
+                ) AS s
+                WHERE s.id = u.id
+            """
+            )
+            conn.execute(
+                """
+                UPDATE rings3 AS r
+                SET moves = u.moves
+                FROM temp.moves_updates AS u
+                WHERE r.carrier_name = u.carrier_name
+                AND r.rings_date = u.rings_date
+                AND r.moves IS NOT u.moves
+            """
+            )
+
+            outcomes = {}
+            for row_id, matched, changed in conn.execute(
+                "SELECT id, matched, changed FROM temp.moves_updates"
+            ):
+                if changed:
+                    outcome = "updated"
+                elif matched:
+                    outcome = "unchanged"
+                else:
+                    outcome = "not_found"
+                outcomes[keys[row_id]] = outcome
+        finally:
+            conn.execute("DROP TABLE temp.moves_updates")
+
+    return outcomes
+
+
 def update_moves_in_database(
     db_path: str, cleaned_moves: Dict[Tuple[str, str], str]
 ) -> bool:
@@ -311,27 +412,16 @@ def update_moves_in_database(
         True if update successful, False otherwise
     """
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-
-            # Update each cleaned move
-            for (carrier_name, date), moves in cleaned_moves.items():
-                cursor.execute(
-                    """
-                    UPDATE rings3
-                    SET moves = ?
-                    WHERE carrier_name = ? AND DATE(rings_date) = ?
-                """,
-                    (moves, carrier_name, date),
-                )
-
-            conn.commit()
-            return True
-
+        outcomes = write_back_moves(db_path, cleaned_moves)
     except Exception as e:
         print(f"Error updating moves in database: {e}")
         return False
 
+    for (carrier_name, date), outcome in outcomes.items():
+        if outcome == "not_found":
+            print(f"No clock ring found for {carrier_name} on {date}")
+    return True
+
 
 def validate_time_input(time_str):
     """Validate time input in postal centesimal format (HH.HH)."""
@@ -0,0 +1,248 @@
+"""Background synchronization from the Klusterbox database.
+
+This module watches the Klusterbox mandates database for changes and applies
+them to the Eightbox database without user interaction. Polling is cheap: the
+source file's mtime and size and its PRAGMA data_version are compared with the
+values seen at the last sync, and the database is only read when they differ.
+The sync itself runs on a worker thread using sync_databases, and afterwards
+only the cached clock ring frames covering changed dates are invalidated.
+Syncs requested by the user run through the same service, so only one sync
+writes the Eightbox database at a time and every change is reported.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+from PyQt5.QtCore import (
+    QObject,
+    QThread,
+    QTimer,
+    pyqtSignal,
+)
+
+from violation_formulas.violation_worker import BaseWorker
+
+from .sync import sync_databases
+
+# Milliseconds between checks of the source database for changes
+AUTO_SYNC_INTERVAL_MS = 5000
+
+
+class SyncWorker(BaseWorker):
+    """Worker that syncs the source database into the target database."""
+
+    def __init__(self, source_path, target_path):
+        super().__init__()
+        self.source_path = source_path
+        self.target_path = target_path
+
+    def run(self):
+        """Run the sync and emit its statistics."""
+        try:
+            self.result.emit(sync_databases(self.source_path, self.target_path))
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            self.finished.emit()
+
+
+class AutoSyncService(QObject):
+    """Polls the source database and syncs changes in the background.
+
+    Signals:
+        sync_completed: Emitted with the sync statistics from sync_databases
+            after a sync that changed the target database
+        sync_failed: Emitted with an error message when a sync fails; the
+            sync is retried at the next poll
+        manual_sync_finished: Emitted with the sync statistics after a sync
+            started by sync_now(), whether or not it changed the target
+        manual_sync_failed: Emitted with an error message when a sync
+            started by sync_now() fails
+    """
+
+    sync_completed = pyqtSignal(dict)
+    sync_failed = pyqtSignal(str)
+    manual_sync_finished = pyqtSignal(dict)
+    manual_sync_failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        source_path,
+        target_path,
+        db_service=None,
+        interval_ms=AUTO_SYNC_INTERVAL_MS,
+        parent=None,
+    ):
+        """Initialize the service.
+
+        Args:
+            source_path (str): Path to the Klusterbox mandates database
+            target_path (str): Path to the Eightbox database
+            db_service (DatabaseService, optional): Service whose clock ring
+                cache is invalidated after each sync
+            interval_ms (int): Milliseconds between polls
+            parent (QObject, optional): Parent object
+        """
+        super().__init__(parent)
+        self.source_path = source_path
+        self.target_path = target_path
+        self.db_service = db_service
+
+        self._fingerprint = None
+        self._watch_connection = None
+        self._thread = None
+        self._worker = None
+
+        # Source fingerprint and target version taken when the running sync
+        # started
+        self._pending_fingerprint = None
+        self._pending_version = None
+
+        # Whether the running sync was started by sync_now(), and whether
+        # sync_now() was called while another sync was running
+        self._manual = False
+        self._manual_requested = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.poll)
+
+    def start(self):
+        """Start polling, treating the source's current state as synced."""
+        self._fingerprint = self._get_source_fingerprint()
+        self._timer.start()
+
+    def stop(self):
+        """Stop polling and wait for a running sync to finish."""
+        self._timer.stop()
+        self._manual_requested = False
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+        self._close_watch_connection()
+
+    def poll(self):
+        """Start a sync if the source database changed since the last one."""
+        if self._thread is not None:
+            return
+
+        fingerprint = self._get_source_fingerprint()
+        if fingerprint is None or fingerprint == self._fingerprint:
+            return
+
+        self._start_sync(fingerprint, manual=False)
+
+    def sync_now(self):
+        """Sync now, whether or not the source changed since the last sync.
+
+        A sync already running may have read the source before the latest
+        changes, so another sync starts once it finishes.
+        """
+        if self._thread is not None:
+            self._manual_requested = True
+            return
+
+        self._start_sync(self._get_source_fingerprint(), manual=True)
+
+    def _start_sync(self, fingerprint, manual):
+        """Start a sync on a worker thread.
+
+        Args:
+            fingerprint (tuple): Source fingerprint the sync starts from
+            manual (bool): Whether the sync was started by sync_now()
+        """
+        self._manual = manual
+        self._pending_fingerprint = fingerprint
+        self._pending_version = None
+        if self.db_service is not None:
+            self._pending_version = self.db_service.get_database_version(
+                self.target_path
+            )
+
+        self._thread = QThread()
+        self._worker = SyncWorker(self.source_path, self.target_path)
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.run)
+        self._worker.result.connect(self._on_sync_result)
+        self._worker.error.connect(self._on_sync_error)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.finished.connect(self._on_thread_finished)
+
+        self._thread.start()
+
+    def _on_sync_result(self, stats):
+        """Record the synced source state and invalidate affected cache entries.
+
+        Args:
+            stats (dict): Statistics returned by sync_databases
+        """
+        self._fingerprint = self._pending_fingerprint
+        if any(stats.values()):
+            if self.db_service is not None:
+                # Carriers apply to every date, so a carrier change stales
+                # them all
+                carriers_changed = (
+                    stats["carriers_added"] or stats["carriers_modified"]
+                )
+                self.db_service.invalidate_dates(
+                    self.target_path,
+                    None if carriers_changed else stats["rings_dates"],
+                    self._pending_version,
+                )
+
+            self.sync_completed.emit(stats)
+
+        if self._manual:
+            self.manual_sync_finished.emit(stats)
+
+    def _on_sync_error(self, message):
+        """Report a failed sync.
+
+        Args:
+            message (str): Error message from the worker
+        """
+        self.sync_failed.emit(message)
+        if self._manual:
+            self.manual_sync_failed.emit(message)
+
+    def _on_thread_finished(self):
+        """Allow the next poll to start a sync, or start a requested one."""
+        self._thread = None
+        self._worker = None
+        if self._manual_requested:
+            self._manual_requested = False
+            self._start_sync(self._get_source_fingerprint(), manual=True)
+
+    def _get_source_fingerprint(self):
+        """Get a token that changes whenever the source database is written.
+
+        Returns:
+            tuple: (mtime_ns, size, data_version), or None if the source
+                cannot be read
+        """
+        if not self.source_path:
+            return None
+
+        try:
+            stat = os.stat(self.source_path)
+            if self._watch_connection is None:
+                uri = Path(self.source_path).resolve().as_uri() + "?mode=ro"
+                self._watch_connection = sqlite3.connect(uri, uri=True)
+            data_version = self._watch_connection.execute(
+                "PRAGMA data_version"
+            ).fetchone()[0]
+        except (OSError, sqlite3.Error):
+            self._close_watch_connection()
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, data_version
+
+    def _close_watch_connection(self):
+        """Close the connection used to read the source's data_version."""
+        if self._watch_connection is not None:
+            self._watch_connection.close()
+            self._watch_connection = None
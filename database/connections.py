@@ -0,0 +1,187 @@
+"""Pooled SQLite connections.
+
+Opening a SQLite connection and checking its tables costs more than most of
+the short interactive queries the application runs. This module keeps one
+read-only and one read-write connection per database file and thread, opened
+with tuned pragmas, and caches table validation results until the database
+file changes.
+
+Read connections use mode=ro URIs and PRAGMA query_only, so they can also be
+used on the Klusterbox database without any risk of writing to it. Write
+connections switch the database to WAL mode, which lets the pooled readers
+keep reading while a write is in progress.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# Pragmas applied to every pooled connection
+CONNECTION_PRAGMAS = (
+    ("mmap_size", 256 * 1024 * 1024),
+    ("cache_size", -32000),  # Negative values are KiB
+)
+
+
+class ConnectionPool:
+    """Per-thread pool of read-only and read-write SQLite connections.
+
+    Connections are reused for as long as the database file they were opened
+    on exists; a database that is deleted and recreated gets a fresh
+    connection. Pooled connections must not be closed by callers.
+    """
+
+    def __init__(self):
+        """Initialize the pool."""
+        self._local = threading.local()
+        self._validation_cache = {}
+        self._lock = threading.Lock()
+
+    def read(self, db_path):
+        """Get this thread's read-only connection to a database.
+
+        The connection is in autocommit mode, so every query sees the latest
+        committed data.
+
+        Args:
+            db_path (str): Path to the database
+
+        Returns:
+            sqlite3.Connection: Pooled read-only connection
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        return self._get_connection(db_path, read_only=True)
+
+    @contextmanager
+    def write(self, db_path):
+        """Use this thread's read-write connection to a database.
+
+        Commits when the block exits normally and rolls back if it raises.
+
+        Args:
+            db_path (str): Path to the database
+
+        Yields:
+            sqlite3.Connection: Pooled read-write connection
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        conn = self._get_connection(db_path, read_only=False)
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def validate(self, db_path, required_tables):
+        """Check that a database exists and has the required tables.
+
+        Results are cached until the database file's size or modification
+        time changes.
+
+        Args:
+            db_path (str): Path to the database
+            required_tables (Iterable[str]): Table names that must exist
+
+        Returns:
+            bool: True if the database has all required tables
+        """
+        if not db_path:
+            return False
+        try:
+            stat = os.stat(db_path)
+        except OSError:
+            return False
+
+        required_tables = frozenset(required_tables)
+        cache_key = (os.path.abspath(db_path), required_tables)
+        fingerprint = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._validation_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        try:
+            cursor = self.read(db_path).execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+            tables = {row[0] for row in cursor.fetchall()}
+            valid = required_tables.issubset(tables)
+        except sqlite3.Error:
+            valid = False
+
+        with self._lock:
+            self._validation_cache[cache_key] = (fingerprint, valid)
+        return valid
+
+    def close_all(self):
+        """Close this thread's pooled connections."""
+        connections = getattr(self._local, "connections", {})
+        for _, conn in connections.values():
+            conn.close()
+        connections.clear()
+
+    def _get_connection(self, db_path, read_only):
+        """Get or open this thread's pooled connection to a database.
+
+        Args:
+            db_path (str): Path to the database
+            read_only (bool): Whether to get the read-only connection
+
+        Returns:
+            sqlite3.Connection: Pooled connection
+        """
+        if not hasattr(self._local, "connections"):
+            self._local.connections = {}
+        connections = self._local.connections
+
+        path = Path(db_path).resolve()
+        key = (str(path), read_only)
+        try:
+            stat = os.stat(path)
+            file_id = (stat.st_dev, stat.st_ino)
+        except OSError:
+            file_id = None
+
+        pooled = connections.get(key)
+        if pooled is not None:
+            if pooled[0] == file_id:
+                return pooled[1]
+            pooled[1].close()
+            del connections[key]
+
+        if read_only:
+            conn = sqlite3.connect(
+                path.as_uri() + "?mode=ro", uri=True, isolation_level=None
+            )
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(str(path))
+            conn.execute("PRAGMA journal_mode = WAL")
+        for pragma, value in CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+        # A new database file has no identity until the connection creates it
+        if file_id is None:
+            stat = os.stat(path)
+            file_id = (stat.st_dev, stat.st_ino)
+        connections[key] = (file_id, conn)
+        return conn
+
+
+_connection_pool = ConnectionPool()
+
+
+def get_connection_pool():
+    """Get the connection pool shared by the application.
+
+    Returns:
+        ConnectionPool: The shared pool
+    """
+    return _connection_pool
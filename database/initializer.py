@@ -6,11 +6,13 @@
 
 import os
 import sqlite3
-from datetime import datetime
-
-import pandas as pd
 
 from custom_widgets import CustomWarningDialog
+from database.migrations import (
+    SCHEMA_VERSION,
+    migrate,
+)
+from database.sync import sync_databases
 
 
 class DatabaseInitializer:
@@ -56,179 +58,34 @@ def initialize(self):
                 cursor = conn.cursor()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
                 tables = {row[0] for row in cursor.fetchall()}
+                conn.close()
                 required_tables = {"rings3", "carriers", "sync_log"}
                 if required_tables.issubset(tables):
-                    conn.close()
+                    # Upgrade databases created by older versions
+                    conn = sqlite3.connect(self.target_path)
+                    try:
+                        migrate(conn)
+                    finally:
+                        conn.close()
+
                     # Perform sync if source_db_path is provided
                     if self.source_db_path and os.path.exists(self.source_db_path):
                         try:
-                            # Connect to both databases
-                            source_conn = sqlite3.connect(self.source_db_path)
-                            target_conn = sqlite3.connect(self.target_path)
-
-                            try:
-                                # Start transaction
-                                target_conn.execute("BEGIN TRANSACTION")
-                                stats = {
-                                    "rings3_added": 0,
-                                    "carriers_added": 0,
-                                    "carriers_modified": 0,
-                                }
-
-                                # Get new rings3 records
-                                source_cursor = source_conn.cursor()
-                                target_cursor = target_conn.cursor()
-
-                                source_cursor.execute(
-                                    """
-                                    SELECT DISTINCT s.*
-                                    FROM rings3 s
-                                    ORDER BY s.rings_date DESC, s.carrier_name
-                                """
-                                )
-                                source_records = source_cursor.fetchall()
-
-                                # Check each source record against target
-                                new_records = []
-                                for record in source_records:
-                                    rings_date, carrier_name = record[0], record[1]
-                                    target_cursor.execute(
-                                        """
-                                        SELECT 1 FROM rings3
-                                        WHERE rings_date = ?
-                                        AND carrier_name = ?
-                                    """,
-                                        (rings_date, carrier_name),
-                                    )
-
-                                    if not target_cursor.fetchone():
-                                        new_records.append(record)
-
-                                if new_records:
-                                    target_conn.executemany(
-                                        """
-                                        INSERT INTO rings3 (
-                                            rings_date, carrier_name, total, rs, code,
-                                            moves, leave_type, leave_time, refusals,
-                                            bt, et
-                                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                    """,
-                                        new_records,
-                                    )
-                                    stats["rings3_added"] = len(new_records)
-
-                                # Handle carriers table
-                                source_cursor.execute(
-                                    """
-                                    SELECT DISTINCT s.*
-                                    FROM carriers s
-                                    ORDER BY s.effective_date DESC, s.carrier_name
-                                """
+                            stats = sync_databases(
+                                self.source_db_path, self.target_path
+                            )
+
+                            # Just log to console for debugging
+                            if any(stats.values()):
+                                print(
+                                    f"Initial sync completed successfully.\n"
+                                    f"Added {stats['rings3_added']} new clock rings\n"
+                                    f"Updated {stats['rings3_modified']} clock rings\n"
+                                    f"Added {stats['carriers_added']} new carrier records\n"
+                                    f"Updated {stats['carriers_modified']} carrier records"
                                 )
-                                source_carrier_records = source_cursor.fetchall()
-
-                                # Check each source carrier record against target
-                                new_carrier_records = []
-                                for record in source_carrier_records:
-                                    effective_date, carrier_name = record[0], record[1]
-                                    target_cursor.execute(
-                                        """
-                                        SELECT 1 FROM carriers
-                                        WHERE effective_date = ?
-                                        AND carrier_name = ?
-                                    """,
-                                        (effective_date, carrier_name),
-                                    )
-
-                                    if not target_cursor.fetchone():
-                                        new_carrier_records.append(record)
-
-                                if new_carrier_records:
-                                    target_conn.executemany(
-                                        """
-                                        INSERT INTO carriers (
-                                            effective_date, carrier_name, list_status,
-                                            ns_day, route_s, station
-                                        ) VALUES (?, ?, ?, ?, ?, ?)
-                                    """,
-                                        new_carrier_records,
-                                    )
-                                    stats["carriers_added"] = len(new_carrier_records)
-
-                                # Check for modified carrier records
-                                modified_carriers = pd.read_sql_query(
-                                    """
-                                    SELECT s.*
-                                    FROM carriers s
-                                    JOIN carriers t ON
-                                        s.effective_date = t.effective_date AND
-                                        s.carrier_name = t.carrier_name
-                                    WHERE COALESCE(s.list_status,'') != COALESCE(t.list_status,'')
-                                       OR COALESCE(s.ns_day,'') != COALESCE(t.ns_day,'')
-                                       OR COALESCE(s.route_s,'') != COALESCE(t.route_s,'')
-                                       OR COALESCE(s.station,'') != COALESCE(t.station,'')
-                                """,
-                                    source_conn,
-                                )
-
-                                if not modified_carriers.empty:
-                                    for _, record in modified_carriers.iterrows():
-                                        target_conn.execute(
-                                            """
-                                            UPDATE carriers
-                                            SET list_status = ?, ns_day = ?,
-                                                route_s = ?, station = ?
-                                            WHERE effective_date = ? AND carrier_name = ?
-                                        """,
-                                            (
-                                                record["list_status"],
-                                                record["ns_day"],
-                                                record["route_s"],
-                                                record["station"],
-                                                record["effective_date"],
-                                                record["carrier_name"],
-                                            ),
-                                        )
-                                    stats["carriers_modified"] = len(modified_carriers)
-
-                                # If we added any records, update the sync log
-                                if (
-                                    stats["rings3_added"] > 0
-                                    or stats["carriers_added"] > 0
-                                    or stats["carriers_modified"] > 0
-                                ):
-                                    now = datetime.now().isoformat()
-                                    target_conn.execute(
-                                        """
-                                        INSERT INTO sync_log (
-                                            sync_date,
-                                            rows_added_rings3,
-                                            rows_added_carriers
-                                        ) VALUES (?, ?, ?)
-                                    """,
-                                        (
-                                            now,
-                                            stats["rings3_added"],
-                                            stats["carriers_added"],
-                                        ),
-                                    )
-
-                                    target_conn.commit()
-
-                                    # Just log to console for debugging
-                                    print(
-                                        f"Initial sync completed successfully.\n"
-                                        f"Added {stats['rings3_added']} new clock rings\n"
-                                        f"Added {stats['carriers_added']} new carrier records\n"
-                                        f"Updated {stats['carriers_modified']} carrier records"
-                                    )
-                                else:
-                                    target_conn.rollback()
-                                    print("No new records to sync")
-
-                            finally:
-                                source_conn.close()
-                                target_conn.close()
+                            else:
+                                print("No new records to sync")
 
                         except Exception as e:
                             print(f"Error during initial sync: {str(e)}")
@@ -242,45 +99,24 @@ def initialize(self):
 
             # Create new database
             conn = sqlite3.connect(self.target_path)
-            cursor = conn.cursor()
+            try:
+                cursor = conn.cursor()
 
-            # Create tables
-            self._create_tables(cursor)
+                # Create tables
+                self._create_tables(cursor)
 
-            # Create recommended indexes
-            self._create_indexes(cursor)
+                # Create recommended indexes
+                self._create_indexes(cursor)
+
+                conn.commit()
+            finally:
+                conn.close()
 
             # If source database provided, copy data
             if self.source_db_path and os.path.exists(self.source_db_path):
-                cursor.execute("ATTACH DATABASE ? AS source", (self.source_db_path,))
-
-                # Copy data in a transaction
-                cursor.execute("BEGIN TRANSACTION")
-                try:
-                    cursor.execute("INSERT INTO carriers SELECT * FROM source.carriers")
-                    cursor.execute("INSERT INTO rings3 SELECT * FROM source.rings3")
-                    cursor.execute("COMMIT")
-                except Exception:
-                    cursor.execute("ROLLBACK")
-                    raise
-                finally:
-                    cursor.execute("DETACH DATABASE source")
-
-                # Add initial sync log entry
-                now = datetime.now().isoformat()
-                cursor.execute(
-                    """
-                    INSERT INTO sync_log (
-                        sync_date,
-                        rows_added_rings3,
-                        rows_added_carriers,
-                        backup_path
-                    ) VALUES (?, 0, 0, NULL)
-                """,
-                    (now,),
-                )
-
-                return True
+                sync_databases(self.source_db_path, self.target_path)
+
+            return True
 
         except Exception as e:
             print(f"Error initializing database: {e}")
@@ -308,17 +144,44 @@ def _create_tables(self, cursor):
         cursor.execute(
             """
             CREATE TABLE rings3 (
-                rings_date date,
+                rings_date TEXT,
                 carrier_name varchar,
-                total varchar,
-                rs varchar,
+                total REAL,
+                rs REAL,
                 code varchar,
                 moves varchar,
                 leave_type varchar,
-                leave_time varchar,
+                leave_time REAL,
                 refusals varchar,
-                bt varchar,
-                et varchar
+                bt REAL,
+                et REAL
+            )
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE TABLE carriers_current (
+                carrier_name varchar PRIMARY KEY,
+                effective_date date,
+                list_status varchar,
+                ns_day varchar,
+                route_s varchar,
+                station varchar
+            )
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE TABLE carrier_status_periods (
+                carrier_name varchar,
+                start_date TEXT,
+                end_date TEXT,
+                list_status varchar,
+                ns_day varchar,
+                route_s varchar,
+                station varchar
             )
         """
         )
@@ -329,7 +192,12 @@ def _create_tables(self, cursor):
                 sync_date TEXT NOT NULL,
                 rows_added_rings3 INTEGER,
                 rows_added_carriers INTEGER,
-                backup_path TEXT
+                backup_path TEXT,
+                source_path TEXT,
+                rings3_high_water INTEGER,
+                carriers_high_water INTEGER,
+                rings3_high_water_key TEXT,
+                carriers_high_water_key TEXT
             )
         """
         )
@@ -343,17 +211,35 @@ def _create_tables(self, cursor):
         """
         )
 
+        # The tables above already have the latest schema
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     def _create_indexes(self, cursor):
         """Create the recommended database indexes.
 
         Args:
             cursor: SQLite cursor object
         """
-        cursor.execute("CREATE INDEX idx_rings3_date ON rings3(rings_date)")
-        cursor.execute("CREATE INDEX idx_carrier_name ON carriers(carrier_name)")
+        cursor.execute(
+            """
+            CREATE INDEX idx_rings3_date_covering ON rings3(
+                rings_date, carrier_name, total, code, leave_type, leave_time, moves
+            )
+        """
+        )
+        cursor.execute(
+            "CREATE INDEX idx_carriers_name_date ON carriers(carrier_name, effective_date)"
+        )
         cursor.execute(
             "CREATE INDEX idx_rings3_carrier_date ON rings3(carrier_name, rings_date)"
         )
+        cursor.execute(
+            """
+            CREATE INDEX idx_carrier_status_periods ON carrier_status_periods(
+                carrier_name, start_date, end_date, list_status, station
+            )
+        """
+        )
         cursor.execute(
             "CREATE INDEX idx_ignored_carriers_name ON ignored_carriers(carrier_name)"
         )
@@ -0,0 +1,297 @@
+"""Versioned schema migrations for the Eightbox database.
+
+The schema version of a database is stored in PRAGMA user_version. migrate()
+applies every migration newer than that version in order, each in its own
+transaction together with the version bump, so an interrupted upgrade resumes
+at the first migration that did not commit.
+
+New databases are created with the current schema by DatabaseInitializer and
+start at SCHEMA_VERSION.
+"""
+
+# Clock ring columns stored as REAL instead of Klusterbox's text
+RINGS3_REAL_COLUMNS = ("total", "rs", "leave_time", "bt", "et")
+
+RINGS3_COLUMNS = (
+    "rings_date",
+    "carrier_name",
+    "total",
+    "rs",
+    "code",
+    "moves",
+    "leave_type",
+    "leave_time",
+    "refusals",
+    "bt",
+    "et",
+)
+
+
+def rings3_select_expressions(alias):
+    """Get expressions converting Klusterbox clock ring values to the typed schema.
+
+    Klusterbox stores rings_date as 'YYYY-MM-DD HH:MM:SS' text and times as
+    text, with '' for missing values. The typed schema stores rings_date as a
+    'YYYY-MM-DD' string, so range predicates can use the rings_date indexes,
+    and times as REAL, with NULL for missing values.
+
+    Args:
+        alias (str): Alias of the table holding the untyped rows
+
+    Returns:
+        list: One SQL expression per column in RINGS3_COLUMNS
+    """
+    expressions = []
+    for column in RINGS3_COLUMNS:
+        if column == "rings_date":
+            expressions.append(f"DATE({alias}.rings_date)")
+        elif column in RINGS3_REAL_COLUMNS:
+            expressions.append(f"CAST(NULLIF(TRIM({alias}.{column}), '') AS REAL)")
+        else:
+            expressions.append(f"{alias}.{column}")
+    return expressions
+
+
+def refresh_carriers_current(conn):
+    """Rebuild carriers_current from the carriers table.
+
+    carriers_current holds the latest carriers row (by effective_date) for
+    each carrier, so readers can resolve a carrier's current status with a
+    primary key lookup instead of aggregating carriers on every query.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+    """
+    conn.execute("DELETE FROM carriers_current")
+    # SQLite takes bare columns from the row holding the MAX()
+    conn.execute(
+        """
+        INSERT INTO carriers_current (
+            carrier_name, effective_date, list_status, ns_day, route_s, station
+        )
+        SELECT
+            carrier_name,
+            MAX(effective_date),
+            list_status,
+            ns_day,
+            route_s,
+            station
+        FROM carriers
+        GROUP BY carrier_name
+    """
+    )
+
+
+def refresh_carrier_status_periods(conn):
+    """Rebuild carrier_status_periods from the carriers table.
+
+    Each row holds the carrier record in effect from start_date through
+    end_date, inclusive, so a clock ring resolves to the status its carrier
+    had on the ring's date with a range join. A period ends the day before
+    the carrier's next effective date and the latest one is open ended. The
+    earliest period also covers all earlier dates, so rings recorded before
+    a carrier's first effective date still resolve.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+    """
+    conn.execute("DELETE FROM carrier_status_periods")
+    # When a carrier has several records for one day, the last one wins
+    conn.execute(
+        """
+        INSERT INTO carrier_status_periods (
+            carrier_name,
+            start_date,
+            end_date,
+            list_status,
+            ns_day,
+            route_s,
+            station
+        )
+        SELECT
+            carrier_name,
+            CASE
+                WHEN ROW_NUMBER() OVER w = 1 THEN '0001-01-01'
+                ELSE effective_day
+            END,
+            COALESCE(DATE(LEAD(effective_day) OVER w, '-1 day'), '9999-12-31'),
+            list_status,
+            ns_day,
+            route_s,
+            station
+        FROM (
+            SELECT
+                carrier_name,
+                DATE(effective_date) AS effective_day,
+                list_status,
+                ns_day,
+                route_s,
+                station,
+                MAX(rowid) AS latest_rowid
+            FROM carriers
+            GROUP BY carrier_name, DATE(effective_date)
+        )
+        WINDOW w AS (PARTITION BY carrier_name ORDER BY effective_day)
+    """
+    )
+
+
+def _add_sync_log_marks(conn):
+    """Add the source path and high-water mark columns to sync_log.
+
+    Each mark is stored with the key of the source row at it, so a sync can
+    tell when the row at the mark was deleted and its rowid reused.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+    """
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(sync_log)")}
+    for column, column_type in (
+        ("source_path", "TEXT"),
+        ("rings3_high_water", "INTEGER"),
+        ("rings3_high_water_key", "TEXT"),
+        ("carriers_high_water", "INTEGER"),
+        ("carriers_high_water_key", "TEXT"),
+    ):
+        if column not in existing:
+            conn.execute(f"ALTER TABLE sync_log ADD COLUMN {column} {column_type}")
+
+
+def _type_rings3_columns(conn):
+    """Rebuild rings3 with ISO date and REAL columns and a covering index.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+    """
+    conn.execute(
+        """
+        CREATE TABLE rings3_typed (
+            rings_date TEXT,
+            carrier_name varchar,
+            total REAL,
+            rs REAL,
+            code varchar,
+            moves varchar,
+            leave_type varchar,
+            leave_time REAL,
+            refusals varchar,
+            bt REAL,
+            et REAL
+        )
+    """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO rings3_typed ({", ".join(RINGS3_COLUMNS)})
+        SELECT {", ".join(rings3_select_expressions("r"))}
+        FROM rings3 r
+        ORDER BY r.rowid
+    """
+    )
+    conn.execute("DROP TABLE rings3")
+    conn.execute("ALTER TABLE rings3_typed RENAME TO rings3")
+    conn.execute(
+        "CREATE INDEX idx_rings3_carrier_date ON rings3(carrier_name, rings_date)"
+    )
+    conn.execute(
+        """
+        CREATE INDEX idx_rings3_date_covering ON rings3(
+            rings_date, carrier_name, total, code, leave_type, leave_time, moves
+        )
+    """
+    )
+
+
+def _add_carriers_current(conn):
+    """Add the carriers_current table and index carriers by name and date.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_carrier_name")
+    conn.execute(
+        "CREATE INDEX idx_carriers_name_date ON carriers(carrier_name, effective_date)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE carriers_current (
+            carrier_name varchar PRIMARY KEY,
+            effective_date date,
+            list_status varchar,
+            ns_day varchar,
+            route_s varchar,
+            station varchar
+        )
+    """
+    )
+    refresh_carriers_current(conn)
+
+
+def _add_carrier_status_periods(conn):
+    """Add the carrier_status_periods interval table.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+    """
+    conn.execute(
+        """
+        CREATE TABLE carrier_status_periods (
+            carrier_name varchar,
+            start_date TEXT,
+            end_date TEXT,
+            list_status varchar,
+            ns_day varchar,
+            route_s varchar,
+            station varchar
+        )
+    """
+    )
+    conn.execute(
+        """
+        CREATE INDEX idx_carrier_status_periods ON carrier_status_periods(
+            carrier_name, start_date, end_date, list_status, station
+        )
+    """
+    )
+    refresh_carrier_status_periods(conn)
+
+
+# (version, migration) pairs in the order they must be applied
+MIGRATIONS = [
+    (1, _add_sync_log_marks),
+    (2, _type_rings3_columns),
+    (3, _add_carriers_current),
+    (4, _add_carrier_status_periods),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate(conn):
+    """Bring a database up to SCHEMA_VERSION.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database, with
+            no transaction open
+
+    Returns:
+        int: The schema version before migrating
+
+    Raises:
+        sqlite3.Error: If a migration fails; it is rolled back and the
+            database keeps the last committed version
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target_version, migration in MIGRATIONS:
+        if version >= target_version:
+            continue
+        conn.execute("BEGIN")
+        try:
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {target_version}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        print(f"Migrated database schema to version {target_version}")
+    return version
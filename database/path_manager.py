@@ -1,7 +1,8 @@
 """Manages database path configuration and validation."""
 
 import os
-import sqlite3
+
+from .connections import get_connection_pool
 
 
 class DatabasePathManager:
@@ -37,20 +38,4 @@ def validate_database_path(self, path):
         Returns:
             bool: True if valid, False otherwise
         """
-        if not path or not os.path.exists(path):
-            return False
-
-        try:
-            conn = sqlite3.connect(path)
-            cursor = conn.cursor()
-
-            # Check for required tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = {row[0] for row in cursor.fetchall()}
-            conn.close()
-
-            required_tables = {"rings3", "carriers"}
-            return required_tables.issubset(tables)
-
-        except Exception:
-            return False
+        return get_connection_pool().validate(path, {"rings3", "carriers"})
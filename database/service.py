@@ -4,9 +4,10 @@
 database operations and data fetching.
 """
 
-import json
 import os
 import sqlite3
+import threading
+from collections import OrderedDict
 from typing import (
     Callable,
     Optional,
@@ -16,13 +17,18 @@
 
 import pandas as pd
 
-from utils import set_display
+from carrier_list.carrier_list_store import get_carrier_list_store
+from utils import get_display_indicators
 
+from .connections import get_connection_pool
 from .models import (
     ClockRingQueryParams,
     DatabaseError,
 )
 
+# Number of prepared clock ring frames kept in memory
+CLOCK_RING_CACHE_SIZE = 8
+
 
 class DatabaseService:
     """Handles all database operations and data fetching."""
@@ -36,6 +42,18 @@ def __init__(self, error_handler: Optional[Callable] = None):
         """
         self.error_handler = error_handler
 
+        # LRU cache of prepared clock ring frames:
+        # (start, end, db path, carrier list path) -> (database state, frame)
+        self._clock_ring_cache = OrderedDict()
+
+        # Long-lived connections used only to read PRAGMA data_version, which
+        # changes when another connection commits to the database
+        self._watch_connections = {}
+
+        # Guards the cache and watch connections, which date range processing
+        # uses from a worker thread
+        self._lock = threading.RLock()
+
     def fetch_clock_ring_data(
         self, params: ClockRingQueryParams
     ) -> Union[Tuple[pd.DataFrame, None], Tuple[None, DatabaseError]]:
@@ -60,6 +78,22 @@ def fetch_clock_ring_data(
             if isinstance(params.end_date, str):
                 params.end_date = pd.to_datetime(params.end_date).date()
 
+            # Serve repeated requests for the same range from the cache
+            cache_key = (
+                params.start_date,
+                params.end_date,
+                os.path.abspath(params.db_path),
+                params.carrier_list_path,
+            )
+            with self._lock:
+                state = self._get_database_state(
+                    params.db_path, params.carrier_list_path
+                )
+                cached = self._clock_ring_cache.get(cache_key)
+                if cached is not None and state is not None and cached[0] == state:
+                    self._clock_ring_cache.move_to_end(cache_key)
+                    return cached[1].copy(), None
+
             # Validate database path
             if not self._validate_database_path(params.db_path):
                 return None, DatabaseError(
@@ -79,6 +113,14 @@ def fetch_clock_ring_data(
             # Add display indicators
             data = self._add_display_indicators(data)
 
+            # Cache a private copy so callers can modify the returned frame
+            if state is not None:
+                with self._lock:
+                    self._clock_ring_cache[cache_key] = (state, data.copy())
+                    self._clock_ring_cache.move_to_end(cache_key)
+                    while len(self._clock_ring_cache) > CLOCK_RING_CACHE_SIZE:
+                        self._clock_ring_cache.popitem(last=False)
+
             return data, None
 
         except Exception as e:
@@ -92,9 +134,120 @@ def fetch_clock_ring_data(
 
             return None, error
 
+    def clear_cache(self) -> None:
+        """Drop all cached clock ring frames and close watch connections."""
+        with self._lock:
+            self._clock_ring_cache.clear()
+            for conn in self._watch_connections.values():
+                conn.close()
+            self._watch_connections.clear()
+
+    def invalidate_dates(
+        self, db_path: str, dates: Optional[list], previous_version: Optional[tuple]
+    ) -> None:
+        """Drop cached frames made stale by a write that touched the given dates.
+
+        Frames for ranges that do not include any of dates were valid at
+        previous_version and are unaffected by the write, so they are
+        re-stamped with the current database version instead of dropped.
+
+        Args:
+            db_path: Path to the database that was written
+            dates: YYYY-MM-DD dates whose rows changed, or None if rows for
+                every date may have changed
+            previous_version: Result of get_database_version taken before the
+                write started
+        """
+        db_key = os.path.abspath(db_path)
+        changed_dates = (
+            None if dates is None else {pd.to_datetime(d).date() for d in dates}
+        )
+        with self._lock:
+            current_version = self.get_database_version(db_path)
+
+            for cache_key in list(self._clock_ring_cache):
+                start_date, end_date, cached_path, _ = cache_key
+                if cached_path != db_key:
+                    continue
+
+                state, data = self._clock_ring_cache[cache_key]
+                if (
+                    changed_dates is None
+                    or current_version is None
+                    or state[:-1] != previous_version
+                    or any(start_date <= d <= end_date for d in changed_dates)
+                ):
+                    del self._clock_ring_cache[cache_key]
+                else:
+                    self._clock_ring_cache[cache_key] = (
+                        current_version + state[-1:],
+                        data,
+                    )
+
+    def get_database_version(self, db_path: str) -> Optional[tuple]:
+        """Get a token that changes whenever the database is written.
+
+        Combines the database file's mtime and size, its PRAGMA data_version
+        and the latest sync_log row.
+
+        Args:
+            db_path: Path to the database
+
+        Returns:
+            tuple: Version token, or None if the database cannot be read
+        """
+        try:
+            stat = os.stat(db_path)
+            with self._lock:
+                conn = self._watch_connections.get(db_path)
+                if conn is None:
+                    conn = sqlite3.connect(db_path, check_same_thread=False)
+                    self._watch_connections[db_path] = conn
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                try:
+                    last_sync = conn.execute(
+                        "SELECT MAX(rowid) FROM sync_log"
+                    ).fetchone()[0]
+                except sqlite3.Error:
+                    last_sync = None
+        except (OSError, sqlite3.Error):
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, data_version, last_sync
+
+    def _get_database_state(
+        self, db_path: str, carrier_list_path: Optional[str]
+    ) -> Optional[tuple]:
+        """Get a token that changes whenever cached clock ring data goes stale.
+
+        Combines the database version from get_database_version with the
+        carrier list file state.
+
+        Args:
+            db_path: Path to the database
+            carrier_list_path: Path to carrier list JSON
+
+        Returns:
+            tuple: State token, or None if the database cannot be read
+        """
+        version = self.get_database_version(db_path)
+        if version is None:
+            return None
+
+        carrier_list_state = None
+        if carrier_list_path:
+            carrier_list_state = get_carrier_list_store(
+                carrier_list_path
+            ).get_file_state()
+
+        return version + (carrier_list_state,)
+
     def _execute_clock_ring_query(self, params: ClockRingQueryParams) -> pd.DataFrame:
         """Execute the main clock ring query.
 
+        Each clock ring gets the list status and station its carrier had on
+        the ring's date.
+
         Args:
             params: Query parameters
 
@@ -107,7 +260,7 @@ def _execute_clock_ring_query(self, params: ClockRingQueryParams) -> pd.DataFram
         query = """
         SELECT
             r.carrier_name,
-            DATE(r.rings_date) AS rings_date,
+            r.rings_date,
             c.list_status,
             c.station,
             r.total,
@@ -116,26 +269,15 @@ def _execute_clock_ring_query(self, params: ClockRingQueryParams) -> pd.DataFram
             r.leave_type,
             r.leave_time
         FROM rings3 r
-        JOIN (
-            SELECT carrier_name, list_status, station
-            FROM carriers
-            WHERE (carrier_name, effective_date) IN (
-                SELECT carrier_name, MAX(effective_date)
-                FROM carriers
-                GROUP BY carrier_name
-            )
-        ) c ON r.carrier_name = c.carrier_name
-        WHERE r.rings_date >= DATE(?)
-        AND r.rings_date < DATE(?, '+1 day')
+        JOIN carrier_status_periods c ON r.carrier_name = c.carrier_name
+        AND r.rings_date BETWEEN c.start_date AND c.end_date
+        WHERE r.rings_date BETWEEN ? AND ?
         """
 
-        # Connect to database
-        conn = sqlite3.connect(params.db_path)
-
-        # Execute query and load into DataFrame
+        # Execute query on the pooled read connection and load into DataFrame
         db_data = pd.read_sql_query(
             query,
-            conn,
+            get_connection_pool().read(params.db_path),
             params=(
                 params.start_date.strftime("%Y-%m-%d"),
                 params.end_date.strftime("%Y-%m-%d"),
@@ -143,9 +285,6 @@ def _execute_clock_ring_query(self, params: ClockRingQueryParams) -> pd.DataFram
             parse_dates=["rings_date"],
         )
 
-        # Close connection
-        conn.close()
-
         # Filter out carriers with "out of station"
         db_data = db_data[
             ~db_data["station"].str.contains("out of station", case=False, na=False)
@@ -174,8 +313,10 @@ def _process_carrier_list(
             DataFrame with carrier list data merged in
         """
         try:
-            with open(carrier_list_path, "r") as json_file:
-                carrier_list_df = pd.DataFrame(json.load(json_file))
+            carrier_list_df = get_carrier_list_store(carrier_list_path).get_frame()
+
+            # Match on the normalized names served by the carrier list store
+            data["carrier_name"] = data["carrier_name"].str.strip().str.lower()
 
             # Create a mapping of carrier names to their current list status
             carrier_status_map = carrier_list_df.set_index("carrier_name")[
@@ -243,7 +384,7 @@ def _add_display_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         Returns:
             DataFrame with display_indicator column added
         """
-        data["display_indicator"] = data.apply(set_display, axis=1)
+        data["display_indicator"] = get_display_indicators(data)
         return data
 
     def _validate_database_path(self, path: str) -> bool:
@@ -255,23 +396,7 @@ def _validate_database_path(self, path: str) -> bool:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not os.path.exists(path):
-            return False
-
-        try:
-            conn = sqlite3.connect(path)
-            cursor = conn.cursor()
-
-            # Check for required tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = {row[0] for row in cursor.fetchall()}
-            required_tables = {"rings3", "carriers"}
-
-            conn.close()
-            return required_tables.issubset(tables)
-
-        except sqlite3.Error:
-            return False
+        return get_connection_pool().validate(path, {"rings3", "carriers"})
 
     def get_empty_clock_ring_frame(self) -> pd.DataFrame:
         """Get an empty DataFrame with the correct clock ring schema.
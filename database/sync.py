@@ -0,0 +1,354 @@
+"""Set-based synchronization from the Klusterbox database.
+
+This module copies new clock rings and carrier records from the source
+mandates database into the Eightbox database. The source is attached to the
+target connection so new rows are found with an anti-join in SQL instead of
+one lookup per source row, and modified clock rings and carriers are each
+updated with a single UPDATE ... FROM.
+
+Clock rings are edited in Klusterbox when moves, times or leave are
+corrected, so every sync compares all source clock rings with the target;
+only the search for new rows is limited by the high-water marks. Every sync
+that changes the target records the source's highest rowids in
+sync_log, with the key of the row at each of them. The next sync from the
+same source only scans rows above that high-water mark. Klusterbox tables
+have no AUTOINCREMENT, so SQLite reuses the highest rowid after that row is
+deleted; when the row at a mark no longer has the recorded key, the whole
+table is scanned instead. carriers_current and carrier_status_periods are
+rebuilt whenever carriers change.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from .migrations import (
+    RINGS3_COLUMNS,
+    migrate,
+    refresh_carrier_status_periods,
+    refresh_carriers_current,
+    rings3_select_expressions,
+)
+
+CARRIERS_COLUMNS = [
+    "effective_date",
+    "carrier_name",
+    "list_status",
+    "ns_day",
+    "route_s",
+    "station",
+]
+
+# Columns identifying a source row, used to insert new rows and to check
+# that the row at a high-water mark is still the one that was synced
+KEY_COLUMNS = {
+    "rings3": ["rings_date", "carrier_name"],
+    "carriers": ["effective_date", "carrier_name"],
+}
+
+
+def sync_databases(source_path, target_path):
+    """Copy new and modified records from the source into the target database.
+
+    Args:
+        source_path (str): Path to the Klusterbox mandates database
+        target_path (str): Path to the Eightbox database
+
+    Returns:
+        dict: Sync statistics with rings3_added, rings3_modified,
+            carriers_added and carriers_modified counts, and rings_dates, the
+            sorted YYYY-MM-DD dates of the clock rings that were added or
+            modified
+
+    Raises:
+        sqlite3.Error: If either database cannot be read or written
+    """
+    stats = {
+        "rings3_added": 0,
+        "rings3_modified": 0,
+        "carriers_added": 0,
+        "carriers_modified": 0,
+    }
+    rings_dates = set()
+    source_key = os.path.abspath(source_path)
+
+    conn = sqlite3.connect(target_path)
+    try:
+        migrate(conn)
+        conn.execute("ATTACH DATABASE ? AS source", (source_path,))
+        try:
+            marks = _get_high_water_marks(conn, source_key)
+            rings3_mark = _check_high_water_mark(conn, "rings3", *marks["rings3"])
+            carriers_mark = _check_high_water_mark(
+                conn, "carriers", *marks["carriers"]
+            )
+            rings3_max = _get_max_rowid(conn, "rings3")
+            carriers_max = _get_max_rowid(conn, "carriers")
+
+            conn.execute("BEGIN")
+            try:
+                target_max = conn.execute(
+                    "SELECT MAX(rowid) FROM main.rings3"
+                ).fetchone()[0]
+                stats["rings3_modified"], rings_dates = _update_modified_rings(conn)
+                stats["rings3_added"] = _insert_new_rows(
+                    conn,
+                    "rings3",
+                    RINGS3_COLUMNS,
+                    rings3_select_expressions("s"),
+                    KEY_COLUMNS["rings3"],
+                    rings3_mark,
+                )
+                stats["carriers_added"] = _insert_new_rows(
+                    conn,
+                    "carriers",
+                    CARRIERS_COLUMNS,
+                    [f"s.{column}" for column in CARRIERS_COLUMNS],
+                    KEY_COLUMNS["carriers"],
+                    carriers_mark,
+                )
+                stats["carriers_modified"] = _update_modified_carriers(conn)
+                if stats["carriers_added"] or stats["carriers_modified"]:
+                    refresh_carriers_current(conn)
+                    refresh_carrier_status_periods(conn)
+
+                # Inserted rows get rowids above the previous maximum
+                if stats["rings3_added"]:
+                    rings_dates.update(
+                        row[0]
+                        for row in conn.execute(
+                            """
+                            SELECT DISTINCT rings_date
+                            FROM main.rings3
+                            WHERE rowid > ?
+                        """,
+                            (target_max or 0,),
+                        )
+                    )
+
+                if any(stats.values()):
+                    conn.execute(
+                        """
+                        INSERT INTO sync_log (
+                            sync_date,
+                            rows_added_rings3,
+                            rows_added_carriers,
+                            source_path,
+                            rings3_high_water,
+                            carriers_high_water,
+                            rings3_high_water_key,
+                            carriers_high_water_key
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                        (
+                            datetime.now().isoformat(),
+                            stats["rings3_added"],
+                            stats["carriers_added"],
+                            source_key,
+                            rings3_max,
+                            carriers_max,
+                            _get_row_key(conn, "rings3", rings3_max),
+                            _get_row_key(conn, "carriers", carriers_max),
+                        ),
+                    )
+                    conn.execute("COMMIT")
+                else:
+                    conn.execute("ROLLBACK")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.execute("DETACH DATABASE source")
+    finally:
+        conn.close()
+
+    stats["rings_dates"] = sorted(rings_dates)
+    return stats
+
+
+def _get_high_water_marks(conn, source_key):
+    """Get the source rowids already synced from this source database.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the Eightbox database
+        source_key (str): Absolute path of the source database
+
+    Returns:
+        dict: (mark, key) for rings3 and carriers; the mark is 0 and the key
+            None when never synced
+    """
+    row = conn.execute(
+        """
+        SELECT
+            rings3_high_water,
+            carriers_high_water,
+            rings3_high_water_key,
+            carriers_high_water_key
+        FROM sync_log
+        WHERE source_path = ? AND rings3_high_water IS NOT NULL
+        ORDER BY rowid DESC
+        LIMIT 1
+    """,
+        (source_key,),
+    ).fetchone()
+    if row is None:
+        return {"rings3": (0, None), "carriers": (0, None)}
+    return {"rings3": (row[0] or 0, row[2]), "carriers": (row[1] or 0, row[3])}
+
+
+def _get_row_key(conn, table, rowid):
+    """Get the key of a source row, to recognize it on the next sync.
+
+    Args:
+        conn (sqlite3.Connection): Connection with the source attached
+        table (str): Table name in the source database
+        rowid (int): Rowid of the row
+
+    Returns:
+        str: JSON list of the row's KEY_COLUMNS values, or None if there is
+            no row with that rowid
+    """
+    row = conn.execute(
+        f"SELECT {', '.join(KEY_COLUMNS[table])} FROM source.{table} WHERE rowid = ?",
+        (rowid,),
+    ).fetchone()
+    return None if row is None else json.dumps(list(row))
+
+
+def _check_high_water_mark(conn, table, mark, key):
+    """Check that the rows up to a high-water mark are still the synced ones.
+
+    The row at the mark must still have the key recorded when it was synced.
+    If it was deleted, its rowid may have been reused by a new row, and the
+    table may have been rebuilt.
+
+    Args:
+        conn (sqlite3.Connection): Connection with the source attached
+        table (str): Table name in the source database
+        mark (int): Highest source rowid already synced
+        key (str): Key recorded for the row at mark, None if not recorded
+
+    Returns:
+        int: mark, or 0 to scan the whole table
+    """
+    if mark and _get_row_key(conn, table, mark) != key:
+        return 0
+    return mark
+
+
+def _get_max_rowid(conn, table):
+    """Get the highest rowid of a source table.
+
+    Args:
+        conn (sqlite3.Connection): Connection with the source attached
+        table (str): Table name in the source database
+
+    Returns:
+        int: Highest rowid, 0 for an empty table
+    """
+    return conn.execute(f"SELECT MAX(rowid) FROM source.{table}").fetchone()[0] or 0
+
+
+def _insert_new_rows(conn, table, columns, expressions, key_columns, high_water):
+    """Insert source rows above the high-water mark whose key is not in the target.
+
+    Args:
+        conn (sqlite3.Connection): Connection with the source attached
+        table (str): Table name, the same in both databases
+        columns (list): Target columns to fill
+        expressions (list): Expression over the source row (aliased s) for
+            each column
+        key_columns (list): Columns identifying a row
+        high_water (int): Highest source rowid already synced
+
+    Returns:
+        int: Number of rows inserted
+    """
+    source_values = dict(zip(columns, expressions))
+    key_match = " AND ".join(
+        f"t.{column} = {source_values[column]}" for column in key_columns
+    )
+    cursor = conn.execute(
+        f"""
+        INSERT INTO main.{table} ({", ".join(columns)})
+        SELECT DISTINCT {", ".join(expressions)}
+        FROM source.{table} s
+        WHERE s.rowid > ?
+        AND NOT EXISTS (
+            SELECT 1 FROM main.{table} t
+            WHERE {key_match}
+        )
+    """,
+        (high_water,),
+    )
+    return cursor.rowcount
+
+
+def _update_modified_rings(conn):
+    """Copy edited clock ring values from the source in one statement.
+
+    Clock rings are matched by their key. This runs before new clock rings
+    are inserted, so only clock rings synced earlier are compared.
+
+    Args:
+        conn (sqlite3.Connection): Connection with the source attached
+
+    Returns:
+        tuple: (number of clock rings updated, set of their YYYY-MM-DD dates)
+    """
+    source_values = dict(zip(RINGS3_COLUMNS, rings3_select_expressions("s")))
+    value_columns = [
+        column for column in RINGS3_COLUMNS if column not in KEY_COLUMNS["rings3"]
+    ]
+    assignments = ",\n            ".join(
+        f"{column} = {source_values[column]}" for column in value_columns
+    )
+    changed = "\n            OR ".join(
+        f"t.{column} IS NOT {source_values[column]}" for column in value_columns
+    )
+    cursor = conn.execute(
+        f"""
+        UPDATE main.rings3 AS t
+        SET {assignments}
+        FROM source.rings3 AS s
+        WHERE t.rings_date = {source_values["rings_date"]}
+        AND t.carrier_name = s.carrier_name
+        AND (
+            {changed}
+        )
+        RETURNING rings_date
+    """
+    )
+    dates = [row[0] for row in cursor]
+    return len(dates), set(dates)
+
+
+def _update_modified_carriers(conn):
+    """Copy changed carrier attributes from the source in one statement.
+
+    Args:
+        conn (sqlite3.Connection): Connection with the source attached
+
+    Returns:
+        int: Number of carrier records updated
+    """
+    cursor = conn.execute(
+        """
+        UPDATE main.carriers AS t
+        SET list_status = s.list_status,
+            ns_day = s.ns_day,
+            route_s = s.route_s,
+            station = s.station
+        FROM source.carriers AS s
+        WHERE s.effective_date = t.effective_date
+        AND s.carrier_name = t.carrier_name
+        AND (
+            COALESCE(s.list_status, '') != COALESCE(t.list_status, '')
+            OR COALESCE(s.ns_day, '') != COALESCE(t.ns_day, '')
+            OR COALESCE(s.route_s, '') != COALESCE(t.route_s, '')
+            OR COALESCE(s.station, '') != COALESCE(t.station, '')
+        )
+    """
+    )
+    return cursor.rowcount
@@ -1,7 +1,8 @@
 """Date range management and processing functionality.
 
 This module handles all date range related operations including:
-- Applying date ranges and processing violations
+- Applying date ranges and processing violations on a worker thread
+- Updating the applied range after background syncs
 - Updating OTDL violations
 - Managing maximization status changes
 - Handling carrier data updates
@@ -11,27 +12,36 @@
 import json
 import os
 import traceback
+from functools import partial
 
 import pandas as pd
 from PyQt5.QtCore import (
     QObject,
-    Qt,
+    QThreadPool,
     QTimer,
 )
-from PyQt5.QtWidgets import (
-    QApplication,
-    QMessageBox,
-)
+from PyQt5.QtWidgets import QMessageBox
 
+from carrier_list.carrier_list_store import get_carrier_list_store
 from custom_widgets import (
     CustomInfoDialog,
-    CustomProgressDialog,
+    CustomWarningDialog,
 )
+from database.models import ClockRingQueryParams
 from otdl_maximization_pane import OTDLMaximizationPane
 from violation_detection import (
+    MOVES_EDIT,
+    OTDL_STATUS_CHANGE,
+    SCOPE_DAY,
+    detect_all_violations,
     detect_violations,
     get_violation_remedies,
+    get_violation_types,
+    invalidated_violation_types,
+    violation_detectors,
 )
+from violation_formulas.prepared_rings import PreparedRings
+from violation_formulas.violation_worker import PipelineRunnable
 
 
 class DateRangeManager(QObject):
@@ -50,6 +60,98 @@ def __init__(self, main_app):
         self.main_app = main_app
         self.violations = {}
 
+        # Prepared rings and OTDL status from the last full processing run,
+        # kept so OTDL changes and moves edits can be re-evaluated in place
+        self.clock_ring_data = None
+        self.prepared_rings = None
+        self.date_maximized_status = {}
+
+        # (start, end) YYYY-MM-DD strings of the range shown in the tabs
+        self.applied_range = None
+
+        # Wall time in seconds of each detector in the last full detection run
+        self.detection_timings = {}
+
+        # Date range pipeline running on the thread pool and its progress dialog
+        self.pipeline = None
+        self.pipeline_progress = None
+
+        # Shared carrier list cache; prepared rings carry carrier list columns,
+        # so drop them whenever the list is saved
+        self.carrier_list_store = get_carrier_list_store()
+        self.carrier_list_store.carrier_list_changed.connect(
+            self.on_carrier_list_changed
+        )
+
+    def on_carrier_list_changed(self, _):
+        """Forget prepared rings built from the previous carrier list."""
+        self.clock_ring_data = None
+        self.prepared_rings = None
+
+    def on_source_synced(self, stats):
+        """Process the shown date range again when a background sync changed it.
+
+        The sync has already invalidated the cached clock rings of the synced
+        dates, so syncs outside the range need nothing more. Changed carriers
+        apply to every date.
+
+        Args:
+            stats (dict): Sync statistics from sync_databases
+        """
+        if self.pipeline is not None:
+            start_date = self.pipeline.state["start_date"]
+            end_date = self.pipeline.state["end_date"]
+        elif self.applied_range is not None:
+            start_date, end_date = self.applied_range
+        else:
+            return
+
+        if (
+            stats["carriers_added"]
+            or stats["carriers_modified"]
+            or any(start_date <= date <= end_date for date in stats["rings_dates"])
+        ):
+            self.rerun_pipeline()
+
+    def rerun_pipeline(self, changes=None):
+        """Process the shown date range again with the current data.
+
+        A running pipeline may have read its clock rings or OTDL status
+        before the change, so it is restarted for its own range and keeps its
+        progress dialog. Otherwise the applied range is processed again in
+        the background. Either way the run keeps its OTDL status.
+
+        Args:
+            changes (dict, optional): Date-keyed OTDL status changes to apply
+        """
+        try:
+            carrier_list = self.carrier_list_store.get_frame()
+        except Exception as e:
+            print(f"Error reading carrier list: {str(e)}")
+            return
+        if carrier_list.empty:
+            return
+
+        progress = None
+        if self.pipeline is not None:
+            state = self.pipeline.state
+            start_date, end_date = state["start_date"], state["end_date"]
+            date_maximized_status = dict(state["date_maximized_status"])
+            progress = self.pipeline_progress
+            self.pipeline.cancel()
+            self.pipeline = None
+            self.pipeline_progress = None
+        elif self.applied_range is not None:
+            start_date, end_date = self.applied_range
+            date_maximized_status = dict(self.date_maximized_status)
+        else:
+            return
+
+        date_maximized_status.update(changes or {})
+        self._start_pipeline(
+            start_date, end_date, carrier_list, progress, date_maximized_status
+        )
+
     def retry_apply_date_range(self):
         """Retry apply_date_range after carrier list is saved."""
         # Disconnect the one-time signal
@@ -63,15 +165,12 @@ def retry_apply_date_range(self):
                 pass
 
         # Check if carrier_list.json exists and is valid before proceeding
-        if os.path.exists("carrier_list.json"):
+        if self.carrier_list_store.exists():
             try:
-                with open(
-                    "carrier_list.json", "r", encoding="utf-8"
-                ) as json_file:  # Added encoding
-                    carrier_list = pd.DataFrame(json.load(json_file))
-                    if not carrier_list.empty:
-                        # Small delay to ensure UI updates are complete
-                        QTimer.singleShot(100, self.apply_date_range)
+                carrier_list = self.carrier_list_store.get_frame()
+                if not carrier_list.empty:
+                    # Small delay to ensure UI updates are complete
+                    QTimer.singleShot(100, self.apply_date_range)
             except Exception:
                 pass  # If there's an error, just don't retry
 
@@ -96,19 +195,23 @@ def clear_tabs_and_data(self):
         # Reset other associated data
         self.main_app.current_data = pd.DataFrame()
         self.violations = None
+        self.clock_ring_data = None
+        self.prepared_rings = None
+        self.date_maximized_status = {}
+        self.applied_range = None
 
     def on_carrier_data_updated(self, _):
         """Handle updates to the carrier list and refresh all tabs.
 
         Actually uses the JSON file for applying updates to the fetched clock ring data.
         Just updating the data without clicking 'Save Carrier List' will not update the views.
+        The shown date range is processed again on the thread pool.
         """
         print("DateRangeManager: Received data_updated signal.")
 
         # Load the most up-to-date carrier data from the JSON file
         try:
-            with open("carrier_list.json", "r", encoding="utf-8") as json_file:
-                carrier_list = pd.DataFrame(json.load(json_file))
+            self.carrier_list_store.get_frame()
         except FileNotFoundError:
             QMessageBox.critical(self.main_app, "Error", "carrier_list.json not found.")
             return
@@ -118,34 +221,7 @@ def on_carrier_data_updated(self, _):
             )
             return
 
-        # Fetch clock ring data from the database
-        clock_ring_data = self.main_app.fetch_clock_ring_data()
-        if not clock_ring_data.empty:
-            # Merge clock ring data with the carrier list from JSON
-            clock_ring_data = clock_ring_data.merge(
-                carrier_list[["carrier_name", "list_status"]],
-                on="carrier_name",
-                how="left",
-                suffixes=("_db", "_updated"),
-            )
-
-            # Consolidate list_status
-            clock_ring_data["list_status"] = clock_ring_data[
-                "list_status_updated"
-            ].combine_first(clock_ring_data["list_status_db"])
-            clock_ring_data.drop(
-                columns=["list_status_db", "list_status_updated"], inplace=True
-            )
-
-        # Refresh other components
-        if self.main_app.otdl_maximization_pane:
-            print("Refreshing OTDLMaximizationPane with updated data.")
-            self.main_app.otdl_maximization_pane.refresh_data(
-                clock_ring_data, carrier_list
-            )
-
-        # Update violations and remedies
-        self.update_violations_and_remedies(clock_ring_data)
+        self.rerun_pipeline()
 
     def apply_date_range(self):
         """Apply the selected date range and process violations."""
@@ -168,7 +244,7 @@ def apply_date_range(self):
             return
 
         # Second check: Carrier List validation
-        if not os.path.exists("carrier_list.json"):
+        if not self.carrier_list_store.exists():
             CustomInfoDialog.information(
                 self.main_app,
                 "Carrier List Required",
@@ -192,17 +268,16 @@ def apply_date_range(self):
 
         # Third check: Carrier List content validation
         try:
-            with open("carrier_list.json", "r", encoding="utf-8") as f:
-                carrier_list = pd.DataFrame(json.load(f))
-                if carrier_list.empty:
-                    CustomInfoDialog.information(
-                        self.main_app,
-                        "Empty Carrier List",
-                        "The carrier list is empty. Please add carriers before proceeding.",
-                    )
-                    self.main_app.carrier_list_button.setChecked(True)
-                    self.main_app.toggle_carrier_list_pane()
-                    return
+            carrier_list = self.carrier_list_store.get_frame()
+            if carrier_list.empty:
+                CustomInfoDialog.information(
+                    self.main_app,
+                    "Empty Carrier List",
+                    "The carrier list is empty. Please add carriers before proceeding.",
+                )
+                self.main_app.carrier_list_button.setChecked(True)
+                self.main_app.toggle_carrier_list_pane()
+                return
         except (json.JSONDecodeError, pd.errors.EmptyDataError):
             CustomInfoDialog.information(
                 self.main_app,
@@ -218,24 +293,16 @@ def apply_date_range(self):
             )
             return
 
+        # Cancel a run still in progress; its results are no longer wanted
+        self.cancel_pipeline()
+
         # Create and show custom progress dialog
         progress = self.main_app.create_progress_dialog(
             "Processing Date Range", "Processing data..."
         )
         progress.show()
 
-        def update_progress(value, message):
-            progress.setValue(value)
-            progress.setLabelText(message)
-            QApplication.processEvents()
-            return progress.was_canceled()
-
         try:
-            # Initial setup (10%)
-            if update_progress(0, "Initializing..."):
-                return
-            QApplication.processEvents()
-
             # Validate the date selection
             if (
                 not hasattr(self.main_app, "date_selection_pane")
@@ -253,96 +320,237 @@ def update_progress(value, message):
             start_date, end_date = self.main_app.date_selection_pane.selected_range
             start_date_str = start_date.strftime("%Y-%m-%d")
             end_date_str = end_date.strftime("%Y-%m-%d")
-
-            # Fetch clock ring data (20%)
-            if update_progress(10, "Fetching clock ring data..."):
-                return
             self.main_app.update_date_range_display(start_date_str, end_date_str)
-            clock_ring_data = self.main_app.fetch_clock_ring_data(
-                start_date_str, end_date_str
-            )
-
-            # Process carrier list (30%)
-            if update_progress(20, "Processing carrier list..."):
-                return
-            try:
-                with open("carrier_list.json", "r", encoding="utf-8") as json_file:
-                    carrier_list = pd.DataFrame(json.load(json_file))
-
-                # Ensure required columns exist in carrier_list
-                required_columns = [
-                    "carrier_name",
-                    "list_status",
-                    "route_s",
-                    "hour_limit",
-                    "effective_date",
-                ]
-                if not all(col in carrier_list.columns for col in required_columns):
-                    raise ValueError(
-                        f"Carrier list missing required columns: {required_columns}"
-                    )
 
-                # Normalize carrier_name for robust comparison
-                carrier_list["carrier_name"] = (
-                    carrier_list["carrier_name"].str.strip().str.lower()
+        except ValueError as e:
+            if str(e) == "No date range selected":
+                progress.cancel()
+                CustomInfoDialog.information(
+                    self.main_app, "No Date Range", "Please select a date range first."
                 )
-                clock_ring_data["carrier_name"] = (
-                    clock_ring_data["carrier_name"].str.strip().str.lower()
+            else:
+                progress.cancel()
+                CustomInfoDialog.information(
+                    self.main_app, "Error", f"An unexpected error occurred: {str(e)}"
                 )
+            self.main_app.cleanup_progress_dialog(progress)
+            return
+        except Exception as e:
+            progress.cancel()
+            CustomInfoDialog.information(
+                self.main_app, "Error", f"An unexpected error occurred: {str(e)}"
+            )
+            self.main_app.cleanup_progress_dialog(progress)
+            return
 
-                # Drop existing list_status columns before merge if they exist
-                columns_to_drop = ["list_status", "list_status_x", "list_status_y"]
-                for col in columns_to_drop:
-                    if col in clock_ring_data.columns:
-                        clock_ring_data = clock_ring_data.drop(columns=[col])
-
-                # Filter and merge clock ring data with all carrier list columns
-                clock_ring_data = clock_ring_data[
-                    clock_ring_data["carrier_name"].isin(carrier_list["carrier_name"])
-                ]
-                clock_ring_data = clock_ring_data.merge(
-                    carrier_list, on="carrier_name", how="left"  # Merge all columns
-                )
+        self._start_pipeline(start_date_str, end_date_str, carrier_list, progress)
 
-            except FileNotFoundError:
-                CustomInfoDialog.information(
-                    self.main_app,
-                    "Missing Carrier List",
-                    "Please configure and save the Carrier List before proceeding.",
+    def _start_pipeline(
+        self,
+        start_date,
+        end_date,
+        carrier_list,
+        progress,
+        date_maximized_status=None,
+    ):
+        """Start processing a date range on the thread pool.
+
+        Args:
+            start_date (str): First date of the range, YYYY-MM-DD
+            end_date (str): Last date of the range, YYYY-MM-DD
+            carrier_list (pd.DataFrame): Normalized carrier list
+            progress (CustomProgressDialog): Dialog showing the run's progress,
+                or None to run silently
+            date_maximized_status (dict, optional): OTDL status to keep for
+                dates it holds; other dates start as not maximized
+        """
+        # Fetch and detect on a pool thread; only the tab model swaps run on
+        # the UI thread, when the result arrives
+        pipeline = PipelineRunnable(
+            [],
+            state={
+                "start_date": start_date,
+                "end_date": end_date,
+                "params": ClockRingQueryParams(
+                    start_date=start_date,
+                    end_date=end_date,
+                    db_path=self.main_app.eightbox_db_path,
+                    carrier_list_path="carrier_list.json",
+                ),
+                "carrier_list": carrier_list,
+                "violation_types": get_violation_types(self._hidden_violation_codes()),
+                "date_maximized_status": date_maximized_status or {},
+            },
+        )
+        pipeline.stages = self._build_pipeline_stages(pipeline)
+        pipeline.signals.progress.connect(
+            lambda value, message: self._show_pipeline_progress(
+                pipeline, value, message
+            )
+        )
+        pipeline.signals.result.connect(
+            lambda state: self._finish_pipeline(pipeline, state)
+        )
+        pipeline.signals.error.connect(
+            lambda message: self._fail_pipeline(pipeline, message)
+        )
+        pipeline.signals.cancelled.connect(lambda: self._end_pipeline(pipeline))
+        if progress is not None and progress.cancel_button is not None:
+            progress.cancel_button.clicked.connect(pipeline.cancel)
+
+        self.pipeline = pipeline
+        self.pipeline_progress = progress
+        QThreadPool.globalInstance().start(pipeline)
+
+    def cancel_pipeline(self):
+        """Cancel the date range pipeline in progress, if any."""
+        if self.pipeline is not None:
+            self.pipeline.cancel()
+            self._end_pipeline(self.pipeline)
+
+    def _build_pipeline_stages(self, pipeline):
+        """Build the worker stages of date range processing.
+
+        The stages run on a pool thread and must not touch any widget.
+
+        Args:
+            pipeline (PipelineRunnable): Pipeline the stages will run in
+
+        Returns:
+            list: (progress, message, function) tuples for PipelineRunnable
+        """
+        return [
+            (10, "Fetching clock ring data...", self._fetch_stage),
+            (20, "Processing carrier list...", self._carrier_list_stage),
+            (30, "Preparing clock rings...", self._prepare_stage),
+            (
+                40,
+                "Processing violations...",
+                partial(self._detect_stage, pipeline),
+            ),
+            (90, "Finalizing violation summary...", self._remedies_stage),
+        ]
+
+    def _fetch_stage(self, state):
+        """Fetch the clock rings of the selected range."""
+        data, error = self.main_app.db_service.fetch_clock_ring_data(state["params"])
+        if error:
+            state["fetch_error"] = error.message
+            data = self.main_app.db_service.get_empty_clock_ring_frame()
+        state["clock_ring_data"] = data
+
+    def _carrier_list_stage(self, state):
+        """Merge the carrier list into the clock rings."""
+        clock_ring_data = state["clock_ring_data"]
+        try:
+            state["clock_ring_data"] = self._merge_carrier_list(
+                clock_ring_data, state["carrier_list"]
+            )
+        except Exception as e:
+            print(f"Error processing carrier list: {str(e)}")
+            clock_ring_data["list_status"] = "unknown"
+            clock_ring_data["hour_limit"] = ""
+            clock_ring_data["route_s"] = ""
+            clock_ring_data["effective_date"] = ""
+            state["carrier_list_error"] = str(e)
+
+    def _prepare_stage(self, state):
+        """Parse the clock rings once for all detectors.
+
+        Dates missing from the state's OTDL status start as not maximized.
+        """
+        clock_ring_data = state["clock_ring_data"]
+        state["violations"] = {}
+        if clock_ring_data.empty:
+            state["prepared_rings"] = None
+            state["date_maximized_status"] = {}
+            return
+
+        unique_dates = (
+            pd.to_datetime(clock_ring_data["rings_date"])
+            .dt.strftime("%Y-%m-%d")
+            .unique()
+        )
+        previous_status = state["date_maximized_status"]
+        state["date_maximized_status"] = {
+            date: previous_status.get(date, {"is_maximized": False})
+            for date in unique_dates
+        }
+        state["prepared_rings"] = PreparedRings(clock_ring_data)
+
+    def _detect_stage(self, pipeline, state):
+        """Run all detectors on the prepared clock rings."""
+        if state["prepared_rings"] is None:
+            state["detection_timings"] = {}
+            return
+
+        progress_per_detector = 50 / max(1, len(state["violation_types"]))
+        completed = []
+
+        def on_detected(key, seconds):
+            completed.append(key)
+            pipeline.report_progress(
+                int(40 + len(completed) * progress_per_detector),
+                f"Completed {key} violations ({seconds * 1000:.0f} ms)",
+            )
+
+        state["violations"], state["detection_timings"] = detect_all_violations(
+            state["prepared_rings"],
+            state["violation_types"],
+            dict(state["date_maximized_status"]),
+            on_detected=on_detected,
+        )
+
+    def _remedies_stage(self, state):
+        """Build the violation summary."""
+        if state["prepared_rings"] is None:
+            state["remedies"] = pd.DataFrame()
+            return
+        state["remedies"] = get_violation_remedies(
+            state["clock_ring_data"], state["violations"]
+        )
+
+    def _show_pipeline_progress(self, pipeline, value, message):
+        """Show a pipeline's progress if it is still the current run."""
+        if pipeline is self.pipeline and self.pipeline_progress is not None:
+            self.pipeline_progress.setValue(value)
+            self.pipeline_progress.setLabelText(message)
+
+    def _finish_pipeline(self, pipeline, state):
+        """Swap a finished pipeline's results into the tabs."""
+        if pipeline is not self.pipeline or pipeline.token.is_cancelled():
+            return
+
+        progress = self.pipeline_progress
+        try:
+            if state.get("fetch_error"):
+                CustomWarningDialog.warning(
+                    self.main_app, "Database Error", state["fetch_error"]
                 )
-                return
-            except Exception as e:
-                print(f"Error processing carrier list: {str(e)}")
-                clock_ring_data["list_status"] = "unknown"
-                clock_ring_data["hour_limit"] = ""
-                clock_ring_data["route_s"] = ""
-                clock_ring_data["effective_date"] = ""
+            if state.get("carrier_list_error"):
                 CustomInfoDialog.information(
                     self.main_app,
                     "Warning",
-                    f"Failed to process carrier list: {str(e)}\nProceeding with default values.",
+                    f"Failed to process carrier list: {state['carrier_list_error']}"
+                    "\nProceeding with default values.",
                 )
 
-            # Clear existing data (35%)
-            if update_progress(30, "Clearing existing data..."):
-                return
-            self.main_app.vio_85d_tab.refresh_data(pd.DataFrame())
-            self.main_app.vio_85f_tab.refresh_data(pd.DataFrame())
-            self.main_app.vio_85f_ns_tab.refresh_data(pd.DataFrame())
-            self.main_app.vio_85f_5th_tab.refresh_data(pd.DataFrame())
-            self.main_app.vio_85g_tab.refresh_data(pd.DataFrame())
-            self.main_app.vio_MAX12_tab.refresh_data(pd.DataFrame())
-            self.main_app.vio_MAX60_tab.refresh_data(pd.DataFrame())
-            self.main_app.remedies_tab.refresh_data(pd.DataFrame())
-
-            # Process violations (40-90%)
-            if update_progress(40, "Processing violations..."):
-                return
-            self.update_violations_and_remedies(clock_ring_data, update_progress)
-
-            # Update OTDL data (95%)
-            if update_progress(95, "Updating OTDL data..."):
-                return
+            # Update violation tabs (95%)
+            self._show_pipeline_progress(pipeline, 95, "Updating tabs...")
+            clock_ring_data = state["clock_ring_data"]
+            self.applied_range = (state["start_date"], state["end_date"])
+            if state["prepared_rings"] is not None:
+                self.clock_ring_data = clock_ring_data
+                self.prepared_rings = state["prepared_rings"]
+                self.date_maximized_status = state["date_maximized_status"]
+            self.violations = state["violations"]
+            self.detection_timings = state["detection_timings"]
+
+            for tab, key in self._violation_tabs():
+                tab.refresh_data(self.violations.get(key, pd.DataFrame()))
+            self.main_app.remedies_tab.refresh_data(state["remedies"])
+
+            # Update OTDL data
             if self.main_app.otdl_maximization_pane is None:
                 self.main_app.otdl_maximization_pane = OTDLMaximizationPane(
                     self.main_app
@@ -352,120 +560,160 @@ def update_progress(value, message):
             )
 
             # Complete (100%)
-            update_progress(100, "Complete")
+            self._show_pipeline_progress(pipeline, 100, "Complete")
             self.main_app.statusBar().showMessage(
                 "Date range processing complete", 5000
             )
-
-        except ValueError as e:
-            if str(e) == "No date range selected":
-                progress.cancel()
-                CustomInfoDialog.information(
-                    self.main_app, "No Date Range", "Please select a date range first."
-                )
-            else:
-                progress.cancel()
-                CustomInfoDialog.information(
-                    self.main_app, "Error", f"An unexpected error occurred: {str(e)}"
-                )
         except Exception as e:
-            progress.cancel()
+            if progress is not None:
+                progress.cancel()
             CustomInfoDialog.information(
                 self.main_app, "Error", f"An unexpected error occurred: {str(e)}"
             )
         finally:
-            self.main_app.cleanup_progress_dialog(progress)
+            self._end_pipeline(pipeline)
 
-    def update_otdl_violations(
-        self, clock_ring_data, progress_callback=None, date_maximized_status=None
-    ):
-        """Update only OTDL-related violations (8.5.D and 8.5.G) and their tabs.
+    def _fail_pipeline(self, pipeline, message):
+        """Report a pipeline that stopped with an error."""
+        if pipeline is not self.pipeline:
+            return
+        if self.pipeline_progress is None:
+            # Background runs only log their errors
+            self._end_pipeline(pipeline)
+            print(f"DateRangeManager: Reprocessing failed: {message}")
+            return
+        self.pipeline_progress.cancel()
+        self._end_pipeline(pipeline)
+        CustomInfoDialog.information(
+            self.main_app, "Error", f"An unexpected error occurred: {message}"
+        )
+
+    def _end_pipeline(self, pipeline):
+        """Close a pipeline's progress dialog and forget the pipeline."""
+        if pipeline is not self.pipeline:
+            return
+        if self.pipeline_progress is not None:
+            self.main_app.cleanup_progress_dialog(self.pipeline_progress)
+        self.pipeline = None
+        self.pipeline_progress = None
+
+    @staticmethod
+    def _merge_carrier_list(clock_ring_data, carrier_list):
+        """Keep the clock rings of listed carriers and add their list columns.
 
         Args:
-            clock_ring_data: DataFrame containing clock ring data
-            progress_callback: Function to update progress dialog
-            date_maximized_status: Dictionary of maximization status changes from OTDL pane
+            clock_ring_data (pd.DataFrame): Fetched clock rings
+            carrier_list (pd.DataFrame): Normalized carrier list
+
+        Returns:
+            pd.DataFrame: Clock rings merged with all carrier list columns
+
+        Raises:
+            ValueError: If the carrier list is missing required columns
         """
-        if clock_ring_data is None or clock_ring_data.empty:
-            return
+        # Ensure required columns exist in carrier_list
+        required_columns = [
+            "carrier_name",
+            "list_status",
+            "route_s",
+            "hour_limit",
+            "effective_date",
+        ]
+        if not all(col in carrier_list.columns for col in required_columns):
+            raise ValueError(
+                f"Carrier list missing required columns: {required_columns}"
+            )
 
-        # Define OTDL-specific violation types
-        violation_types = {
-            "8.5.D": "8.5.D Overtime Off Route",
-            "8.5.G": "8.5.G",
-        }
+        # Normalize carrier_name for robust comparison (the carrier
+        # list store already serves normalized names)
+        clock_ring_data["carrier_name"] = (
+            clock_ring_data["carrier_name"].str.strip().str.lower()
+        )
 
-        # Get unique dates and initialize maximization status if not provided
-        unique_dates = (
-            pd.to_datetime(clock_ring_data["rings_date"])
-            .dt.strftime("%Y-%m-%d")
-            .unique()
+        # Drop existing list_status columns before merge if they exist
+        columns_to_drop = ["list_status", "list_status_x", "list_status_y"]
+        for col in columns_to_drop:
+            if col in clock_ring_data.columns:
+                clock_ring_data = clock_ring_data.drop(columns=[col])
+
+        # Filter and merge clock ring data with all carrier list columns
+        clock_ring_data = clock_ring_data[
+            clock_ring_data["carrier_name"].isin(carrier_list["carrier_name"])
+        ]
+        return clock_ring_data.merge(
+            carrier_list, on="carrier_name", how="left"  # Merge all columns
         )
-        if date_maximized_status is None:
-            date_maximized_status = {
-                date: {"is_maximized": False} for date in unique_dates
-            }
 
-        # Calculate progress increments (40% for detection, 40% for tabs, 20% for summary)
-        current_progress = 0
+    def _violation_tabs(self):
+        """Get the violation tabs with the violation key each one shows.
 
-        try:
-            # Detect violations (40% of progress)
-            for key, violation_type in violation_types.items():
-                if progress_callback:
-                    if progress_callback(
-                        current_progress, f"Processing {key} violations..."
-                    ):
-                        return
+        Returns:
+            list: (tab, key) tuples
+        """
+        return [
+            (self.main_app.vio_85d_tab, "8.5.D"),
+            (self.main_app.vio_85f_tab, "8.5.F"),
+            (self.main_app.vio_85f_ns_tab, "8.5.F NS"),
+            (self.main_app.vio_85f_5th_tab, "8.5.F 5th"),
+            (self.main_app.vio_85g_tab, "8.5.G"),
+            (self.main_app.vio_MAX12_tab, "MAX12"),
+            (self.main_app.vio_MAX60_tab, "MAX60"),
+        ]
+
+    def _hidden_violation_codes(self):
+        """Get the codes of violations whose tabs are hidden.
+
+        Hidden violations are not detected and are left out of the summary.
+
+        Returns:
+            set: Violation codes
+        """
+        tab_widget = self.main_app.central_tab_widget
+        hidden = set()
+        for tab, key in self._violation_tabs():
+            index = tab_widget.indexOf(tab) if tab is not None else -1
+            if index >= 0 and not tab_widget.isTabVisible(index):
+                hidden.add(key)
+        return hidden
 
-                self.violations[key] = detect_violations(
-                    clock_ring_data, violation_type, date_maximized_status
-                )
-                current_progress += 20
-                if progress_callback:
-                    if progress_callback(
-                        current_progress, f"Completed {key} violations"
-                    ):
-                        return
-
-            # Update violation tabs (40% of progress)
-            tab_updates = [
-                (self.main_app.vio_85d_tab, "8.5.D", "8.5.D"),
-                (self.main_app.vio_85g_tab, "8.5.G", "8.5.G"),
-            ]
-
-            for tab, key, description in tab_updates:
-                if progress_callback:
-                    if progress_callback(
-                        current_progress, f"Updating {description} tab..."
-                    ):
-                        return
-                tab.refresh_data(self.violations[key])
-                current_progress += 20
-                if progress_callback:
-                    if progress_callback(
-                        current_progress, f"Updated {description} tab"
-                    ):
-                        return
-
-            # Update remedies (final 20%)
-            if progress_callback:
-                if progress_callback(80, "Updating violation summary..."):
-                    return
-
-            remedies_data = get_violation_remedies(clock_ring_data, self.violations)
-            self.main_app.remedies_tab.refresh_data(remedies_data)
+    def set_violation_tab_visible(self, key, visible):
+        """Show or hide a violation tab.
 
-            if progress_callback:
-                progress_callback(100, "OTDL maximization complete")
+        Hiding a tab drops its violations from the summary and skips its
+        detector until the tab is shown again. Showing it detects the
+        violation on the prepared rings of the shown range.
 
-        except Exception as e:
-            print(f"Error in update_otdl_violations: {str(e)}")
-            raise
+        Args:
+            key (str): Violation code, e.g. "8.5.D"
+            visible (bool): True to show the tab
+        """
+        tab = {code: tab for tab, code in self._violation_tabs()}[key]
+        tab_widget = self.main_app.central_tab_widget
+        tab_widget.setTabVisible(tab_widget.indexOf(tab), visible)
+        if not self.violations:
+            return
+
+        if not visible:
+            self.violations.pop(key, None)
+        elif key not in self.violations and self.prepared_rings is not None:
+            self.violations[key] = detect_violations(
+                self.prepared_rings,
+                get_violation_types()[key],
+                self.date_maximized_status,
+            )
+            tab.refresh_data(self.violations[key])
+        else:
+            return
+
+        remedies_data = get_violation_remedies(self.clock_ring_data, self.violations)
+        self.main_app.remedies_tab.refresh_data(remedies_data)
 
     def handle_maximized_status_change(self, date_str, changes):
         """Handle changes to OTDL maximization status"""
-        if "8.5.D" not in self.violations and "8.5.G" not in self.violations:
+        if not any(
+            key in self.violations
+            for key in invalidated_violation_types(OTDL_STATUS_CHANGE)
+        ):
             return
 
         # If it's not a batch update (old signal format), convert to batch format
@@ -479,189 +727,214 @@ def handle_maximized_status_change(self, date_str, changes):
                 }
             }
 
-        # Create and show progress dialog immediately
-        progress = CustomProgressDialog(
-            "Processing OTDL Changes...",
-            "Cancel",
-            0,
-            100,
-            self.main_app,
-            "OTDL Maximization",
-        )
-        progress.setWindowModality(Qt.ApplicationModal)
-        progress.show()
-        QApplication.processEvents()
+        # A running pipeline would replace the re-evaluated violations
+        if self.pipeline is not None:
+            self.rerun_pipeline(changes)
+            return
 
-        try:
-            # Get the selected date range from the date selection pane
-            if (
-                not hasattr(self.main_app, "date_selection_pane")
-                or self.main_app.date_selection_pane is None
-                or not hasattr(self.main_app.date_selection_pane, "selected_range")
-            ):
-                raise ValueError("No date range selected")
+        # Re-evaluate only the changed dates when the prepared rings are at hand
+        if self.prepared_rings is not None:
+            try:
+                self.update_otdl_violations_for_dates(changes)
+                return
+            except Exception as e:
+                print(f"Error updating OTDL violations by date: {str(e)}")
+                traceback.print_exc()
 
-            start_date, end_date = self.main_app.date_selection_pane.selected_range
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
+        # Otherwise process the range again on the thread pool
+        self.rerun_pipeline(changes)
 
-            # Load carrier list
-            with open("carrier_list.json", "r", encoding="utf-8") as json_file:
-                carrier_list = pd.DataFrame(json.load(json_file))
+    def update_otdl_violations_for_dates(self, changes):
+        """Recompute OTDL-dependent violations only for dates whose status changed.
 
-            # Fetch clock ring data
-            clock_ring_data = self.main_app.fetch_clock_ring_data(
-                start_date_str, end_date_str
-            )
-            if clock_ring_data.empty:
-                return
+        Works on the prepared rings kept from the last full processing run.
+        Day-scoped violations are detected on the affected dates only and
+        patch just those date sub-tabs and Summary columns; week-scoped ones
+        are detected again over the whole range.
 
-            # Update carrier list data in clock ring data
-            carrier_list["carrier_name"] = (
-                carrier_list["carrier_name"].str.strip().str.lower()
-            )
-            clock_ring_data["carrier_name"] = (
-                clock_ring_data["carrier_name"].str.strip().str.lower()
-            )
+        Args:
+            changes: Date-keyed dict of maximization status from the OTDL pane
+        """
+        affected_dates = [
+            date
+            for date in sorted(changes)
+            if date in self.date_maximized_status
+            and self._excusal_state(changes[date])
+            != self._excusal_state(self.date_maximized_status[date])
+        ]
+        if not affected_dates:
+            return
 
-            if "list_status" in clock_ring_data.columns:
-                clock_ring_data = clock_ring_data.drop(columns=["list_status"])
-            if "hour_limit" in clock_ring_data.columns:
-                clock_ring_data = clock_ring_data.drop(columns=["hour_limit"])
+        for date in affected_dates:
+            self.date_maximized_status[date] = changes[date]
+        date_maximized_status = {
+            date: self.date_maximized_status[date] for date in affected_dates
+        }
+        prepared_rings = self.prepared_rings.for_dates(affected_dates)
 
-            clock_ring_data = clock_ring_data.merge(
-                carrier_list[["carrier_name", "list_status", "hour_limit"]],
-                on="carrier_name",
-                how="left",
+        violation_types = {
+            key: violation_type
+            for key, violation_type in invalidated_violation_types(
+                OTDL_STATUS_CHANGE
+            ).items()
+            if key in self.violations
+        }
+        weekly_keys = [
+            key
+            for key, violation_type in violation_types.items()
+            if violation_detectors[violation_type].scope != SCOPE_DAY
+        ]
+        tabs = {code: tab for tab, code in self._violation_tabs()}
+        for key, violation_type in violation_types.items():
+            if key in weekly_keys:
+                self.violations[key] = detect_violations(
+                    self.prepared_rings, violation_type, self.date_maximized_status
+                )
+                tabs[key].refresh_data(self.violations[key])
+                continue
+
+            # Replace the affected dates' rows in the violation frame
+            violations = self.violations[key]
+            self.violations[key] = pd.concat(
+                [
+                    violations[~violations["date"].isin(affected_dates)],
+                    detect_violations(
+                        prepared_rings, violation_type, date_maximized_status
+                    ),
+                ],
+                ignore_index=True,
             )
+            tabs[key].refresh_dates(self.violations[key], affected_dates)
 
-            # Update maximization status for the date range
-            date_maximized_status = {}
-            for d in pd.date_range(start_date_str, end_date_str):
-                d_str = d.strftime("%Y-%m-%d")
-                if d_str in changes:
-                    date_maximized_status[d_str] = changes[d_str]
-                else:
-                    if hasattr(self.main_app.otdl_maximization_pane, "date_maximized"):
-                        existing_status = (
-                            self.main_app.otdl_maximization_pane.date_maximized.get(
-                                d_str, {}
-                            )
-                        )
-                        if isinstance(existing_status, dict):
-                            date_maximized_status[d_str] = existing_status
-                        else:
-                            date_maximized_status[d_str] = {"is_maximized": False}
-
-            # Create progress update function that uses our dialog
-            def progress_update(value, message):
-                progress.setValue(value)
-                progress.setLabelText(message)
-                QApplication.processEvents()
-                return progress.was_canceled()
-
-            # Use the optimized OTDL update function with maximization status
-            self.update_otdl_violations(
-                clock_ring_data, progress_update, date_maximized_status
+        remedies_data = get_violation_remedies(self.clock_ring_data, self.violations)
+        if weekly_keys:
+            self.main_app.remedies_tab.refresh_data(remedies_data)
+        else:
+            self.main_app.remedies_tab.refresh_dates(
+                remedies_data, affected_dates, list(violation_types)
             )
 
-        except Exception as e:
-            print(f"Error in handle_maximized_status_change: {str(e)}")
-            traceback.print_exc()
-        finally:
-            self.main_app.cleanup_progress_dialog(progress)
+    @staticmethod
+    def _excusal_state(status):
+        """Reduce a date's maximization status to the parts detectors read.
 
-    def update_violations_and_remedies(
-        self, clock_ring_data=None, progress_callback=None
-    ):
-        """Helper function to detect violations and update all tabs."""
-        if clock_ring_data is None or clock_ring_data.empty:
-            return
-
-        # Define violation types and their display names
-        violation_types = {
-            "8.5.D": "8.5.D Overtime Off Route",
-            "8.5.F": "8.5.F Overtime Over 10 Hours Off Route",
-            "8.5.F NS": "8.5.F NS Overtime On a Non-Scheduled Day",
-            "8.5.F 5th": "8.5.F 5th More Than 4 Days of Overtime in a Week",
-            "8.5.G": "8.5.G",
-            "MAX12": "MAX12 More Than 12 Hours Worked in a Day",
-            "MAX60": "MAX60 More Than 60 Hours Worked in a Week",
-        }
-
-        # Initialize violations dictionary
-        self.violations = {}
+        Args:
+            status: Maximization status for one date, a bool or a dict
 
-        # Get unique dates from clock ring data and initialize date_maximized_status
-        unique_dates = (
-            pd.to_datetime(clock_ring_data["rings_date"])
-            .dt.strftime("%Y-%m-%d")
-            .unique()
+        Returns:
+            tuple: (is_maximized, frozenset of excused carrier names)
+        """
+        if not isinstance(status, dict):
+            return bool(status), frozenset()
+
+        excused = {str(c).strip().lower() for c in status.get("excused_carriers", [])}
+        excused.update(
+            str(k).strip().lower()
+            for k, v in status.items()
+            if k not in ["is_maximized", "excused_carriers"] and v
         )
-        date_maximized_status = {date: {"is_maximized": False} for date in unique_dates}
+        return bool(status.get("is_maximized", False)), frozenset(excused)
 
-        # Calculate progress increments
-        total_steps = len(violation_types) * 2  # Detection and tab updates
-        progress_per_step = 90 / total_steps
-        current_progress = 0
+    def update_moves_for_carrier_days(self, cleaned_moves):
+        """Recompute the moves-dependent violations only for edited carrier-days.
 
-        try:
-            # Detect violations (45% of progress)
-            for key, violation_type in violation_types.items():
-                if progress_callback:
-                    if progress_callback(
-                        int(current_progress), f"Processing {key} violations..."
-                    ):
-                        return  # Cancel if requested
+        Patches the edited clock rings in the data kept from the last full
+        processing run, re-runs the violations that read moves (8.5.D, 8.5.F
+        and MAX12) on just those rows and refreshes only their table rows.
 
-                self.violations[key] = detect_violations(
-                    clock_ring_data,
-                    violation_type,
-                    date_maximized_status if key in ["8.5.D", "8.5.G"] else None,
-                )
-                current_progress += progress_per_step
-                if progress_callback:
-                    if progress_callback(
-                        int(current_progress), f"Completed {key} violations"
-                    ):
-                        return  # Cancel if requested
-
-            # Update violation tabs (45% of progress)
-            tab_updates = [
-                (self.main_app.vio_85d_tab, "8.5.D", "8.5.D"),
-                (self.main_app.vio_85f_tab, "8.5.F", "8.5.F"),
-                (self.main_app.vio_85f_ns_tab, "8.5.F NS", "8.5.F NS"),
-                (self.main_app.vio_85f_5th_tab, "8.5.F 5th", "8.5.F 5th"),
-                (self.main_app.vio_85g_tab, "8.5.G", "8.5.G"),
-                (self.main_app.vio_MAX12_tab, "MAX12", "MAX12"),
-                (self.main_app.vio_MAX60_tab, "MAX60", "MAX60"),
-            ]
-
-            for tab, key, description in tab_updates:
-                if progress_callback:
-                    if progress_callback(
-                        int(current_progress), f"Updating {description} tab..."
-                    ):
-                        return  # Cancel if requested
-                tab.refresh_data(self.violations[key])
-                current_progress += progress_per_step
-                if progress_callback:
-                    if progress_callback(
-                        int(current_progress), f"Updated {description} tab"
-                    ):
-                        return  # Cancel if requested
-
-            # Calculate and update remedies (final 10%)
-            if progress_callback:
-                if progress_callback(90, "Finalizing violation summary..."):
-                    return  # Cancel if requested
-
-            remedies_data = get_violation_remedies(clock_ring_data, self.violations)
-            self.main_app.remedies_tab.refresh_data(remedies_data)
+        Args:
+            cleaned_moves: Dictionary mapping (carrier_name, date) to cleaned
+                moves string
+
+        Returns:
+            bool: True if the edits were applied, or a running pipeline was
+                restarted to read them from the database. False, with nothing
+                changed, when they cannot be applied incrementally, e.g. no
+                date range was processed yet, an edited clock ring is not in
+                the processed data or a week-scoped violation reads moves.
+        """
+        # A running pipeline may have fetched the clock rings before the edit
+        if self.pipeline is not None:
+            self.rerun_pipeline()
+            return True
 
-            if progress_callback:
-                progress_callback(100, "OTDL maximization complete")
+        violation_types = {
+            key: violation_type
+            for key, violation_type in invalidated_violation_types(MOVES_EDIT).items()
+            if key in (self.violations or {})
+        }
+        if (
+            not cleaned_moves
+            or not self.violations
+            or self.prepared_rings is None
+            or any(
+                violation_detectors[violation_type].scope != SCOPE_DAY
+                for violation_type in violation_types.values()
+            )
+        ):
+            return False
 
-        except Exception as e:
-            print(f"Error in update_violations_and_remedies: {str(e)}")
-            raise
+        # Index the processed clock rings by carrier-day
+        clock_ring_data = self.clock_ring_data
+        ring_keys = pd.MultiIndex.from_arrays(
+            [clock_ring_data["carrier_name"], clock_ring_data["rings_date"]]
+        )
+        keys = [(str(carrier).strip().lower(), date) for carrier, date in cleaned_moves]
+        if not ring_keys.is_unique:
+            return False
+        positions = ring_keys.get_indexer(keys)
+        if (positions < 0).any():
+            return False
+
+        patched_rings = clock_ring_data.iloc[positions].copy()
+        patched_rings["moves"] = list(cleaned_moves.values())
+        prepared_rings = PreparedRings(patched_rings)
+
+        # Detect on the edited rows and locate them in each violation frame
+        violations = {}
+        for key, violation_type in violation_types.items():
+            detected = detect_violations(
+                prepared_rings, violation_type, self.date_maximized_status
+            )
+            current = self.violations[key]
+            violation_keys = pd.MultiIndex.from_arrays(
+                [current["carrier_name"], current["date"]]
+            )
+            if not violation_keys.is_unique:
+                return False
+            rows = violation_keys.get_indexer(
+                pd.MultiIndex.from_arrays([detected["carrier_name"], detected["date"]])
+            )
+            if (rows < 0).any():
+                return False
+
+            updated = current.copy()
+            for column in current.columns:
+                updated.iloc[rows, updated.columns.get_loc(column)] = detected[
+                    column
+                ].to_numpy()
+            violations[key] = updated
+
+        # Patch copies; frames are replaced, never modified, once processed
+        clock_ring_data = clock_ring_data.copy()
+        clock_ring_data.iloc[positions, clock_ring_data.columns.get_loc("moves")] = (
+            patched_rings["moves"].to_numpy()
+        )
+        frame = self.prepared_rings.frame.copy()
+        for column in frame.columns:
+            frame.iloc[positions, frame.columns.get_loc(column)] = prepared_rings.frame[
+                column
+            ].to_numpy()
+        self.clock_ring_data = clock_ring_data
+        # Drop the service week partitions built from the unpatched frame
+        self.prepared_rings = PreparedRings.from_frame(frame)
+        self.violations.update(violations)
+
+        edited = set(keys)
+        for tab, key in self._violation_tabs():
+            if key in violation_types:
+                tab.refresh_rows(self.violations[key], edited)
+
+        remedies_data = get_violation_remedies(self.clock_ring_data, self.violations)
+        self.main_app.remedies_tab.refresh_rows(remedies_data, edited)
+        return True
@@ -4,7 +4,6 @@
 that have data in the database.
 """
 
-import sqlite3
 from datetime import (
     datetime,
     timedelta,
@@ -29,6 +28,7 @@
 )
 
 from custom_widgets import CustomTitleBarWidget
+from database.connections import get_connection_pool
 from theme import (
     COLOR_BG_DARK,
     COLOR_BG_DARKER,
@@ -183,15 +183,12 @@ def __init__(self, db_path, parent=None):
         self.parent_main = parent
         self.db_path = db_path
         self.selected_range = None
-        self.active_processor = None  # Store reference to active processor
-        self.progress_dialog = None  # Store reference to active progress dialog
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
         self.setup_ui()
         self.load_data()
 
     def hideEvent(self, event):
-        """Handle hide event by cleaning up and unchecking button."""
-        self.cleanup_processor()
+        """Handle hide event by unchecking button."""
         if hasattr(self.parent_main, "date_selection_button"):
             self.parent_main.date_selection_button.setChecked(False)
         super().hideEvent(event)
@@ -279,54 +276,54 @@ def setup_ui(self):
     def load_data(self):
         """Load date ranges from the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT
-                        DATE(rings_date) as rings_date,
-                        COUNT(DISTINCT carrier_name) as carrier_count
-                    FROM rings3
-                    GROUP BY DATE(rings_date)
-                    ORDER BY rings_date DESC
+            conn = get_connection_pool().read(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
                 """
-                )
+                SELECT
+                    rings_date,
+                    COUNT(DISTINCT carrier_name) as carrier_count
+                FROM rings3
+                GROUP BY rings_date
+                ORDER BY rings_date DESC
+            """
+            )
 
-                # Process results into weekly ranges
-                date_ranges = []
-                current_start = None
-                current_carriers = 0
-
-                for row in cursor.fetchall():
-                    date_str, carrier_count = row
-                    date = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # If it's a Saturday, start a new range
-                    if date.weekday() == 5:  # 5 = Saturday
-                        if current_start:
-                            # Add the previous range
-                            date_ranges.append(
-                                (
-                                    current_start,
-                                    current_start + timedelta(days=6),
-                                    current_carriers,
-                                )
+            # Process results into weekly ranges
+            date_ranges = []
+            current_start = None
+            current_carriers = 0
+
+            for row in cursor.fetchall():
+                date_str, carrier_count = row
+                date = datetime.strptime(date_str, "%Y-%m-%d")
+
+                # If it's a Saturday, start a new range
+                if date.weekday() == 5:  # 5 = Saturday
+                    if current_start:
+                        # Add the previous range
+                        date_ranges.append(
+                            (
+                                current_start,
+                                current_start + timedelta(days=6),
+                                current_carriers,
                             )
-                        current_start = date
-                        current_carriers = carrier_count
-
-                # Add the last range if there is one
-                if current_start:
-                    date_ranges.append(
-                        (
-                            current_start,
-                            current_start + timedelta(days=6),
-                            current_carriers,
                         )
+                    current_start = date
+                    current_carriers = carrier_count
+
+            # Add the last range if there is one
+            if current_start:
+                date_ranges.append(
+                    (
+                        current_start,
+                        current_start + timedelta(days=6),
+                        current_carriers,
                     )
+                )
 
-                # Update the model
-                self.model.populate_data(date_ranges)
+            # Update the model
+            self.model.populate_data(date_ranges)
 
         except Exception as e:
             print(f"Error loading date ranges: {e}")
@@ -347,55 +344,15 @@ def handle_selection(self, index):
             self.selected_range = None
             self.apply_button.setEnabled(False)
 
-    def cleanup_processor(self):
-        """Clean up the active processor and progress dialog."""
-        if self.active_processor:
-            self.active_processor.cancel_all()
-            self.active_processor = None
-        if self.progress_dialog:
-            self.progress_dialog.close()
-            self.progress_dialog = None
-
     def apply_selection(self):
-        """Apply the selected date range using worker threads."""
-        if self.selected_range:
-            # Clean up any existing processor
-            self.cleanup_processor()
+        """Apply the selected date range.
 
+        The main window processes the range when date_range_selected is
+        emitted.
+        """
+        if self.selected_range:
             start_date, end_date = self.selected_range
 
-            # Create single progress dialog for entire process
-            self.progress_dialog = self.parent_main.create_progress_dialog(
-                "Processing Date Range", "Initializing..."
-            )
-
-            # Create processor instance
-            from violation_formulas.violation_worker import DateRangeProcessor
-
-            self.active_processor = DateRangeProcessor(self.parent_main)
-
-            # Set up callbacks
-            def update_progress(value, msg):
-                if self.progress_dialog:
-                    self.progress_dialog.setValue(value)
-                    self.progress_dialog.setLabelText(msg)
-
-            def handle_error(msg):
-                if self.progress_dialog:
-                    self.progress_dialog.setLabelText(f"Error: {msg}")
-
-            def handle_finished():
-                self.cleanup_processor()
-
-            self.active_processor.set_callbacks(
-                progress_cb=update_progress,
-                error_cb=handle_error,
-                finished_cb=handle_finished,
-            )
-
-            # Start processing
-            self.active_processor.process_date_range(start_date, end_date, self.db_path)
-
             # Emit signal for date range selection
             self.date_range_selected.emit(start_date, end_date)
 
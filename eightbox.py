@@ -4,6 +4,7 @@
 different panes and managing the overall application state and user interactions.
 """
 
+import multiprocessing
 import os
 import sys
 
@@ -39,6 +40,7 @@
     CustomSizeGrip,
     CustomWarningDialog,
 )
+from database.auto_sync import AutoSyncService
 from database.initializer import DatabaseInitializer
 from database.models import ClockRingQueryParams
 from database.path_manager import DatabasePathManager
@@ -71,6 +73,7 @@
     TOP_BUTTON_ROW_STYLE,
     apply_material_dark_theme,
 )
+from violation_detection import shutdown_process_pool
 
 VERSION = "2024.1.6.6"  # Updated by release.py
 BUILD_TIME = "2024-12-31 11:17"  # Updated by release.py
@@ -266,6 +269,14 @@ def __init__(self):
         # Initialize database
         self._init_database()
 
+        # Keep the working database in sync with Klusterbox in the background
+        self.auto_sync_service = AutoSyncService(
+            self.mandates_db_path, self.eightbox_db_path, self.db_service, parent=self
+        )
+        self.auto_sync_service.sync_completed.connect(self.on_auto_sync_completed)
+        self.auto_sync_service.sync_failed.connect(self.on_auto_sync_failed)
+        self.auto_sync_service.start()
+
         # Show database configuration dialog only if path is not found
         if not self.mandates_db_path:
             self.open_settings_dialog()
@@ -778,30 +789,29 @@ def apply_date_range(self):
         """Apply the selected date range and process violations."""
         self.date_range_manager.apply_date_range()
 
-    def update_otdl_violations(
-        self, clock_ring_data, progress_callback=None, date_maximized_status=None
-    ):
-        """Update only OTDL-related violations (8.5.D and 8.5.G) and their tabs."""
-        self.date_range_manager.update_otdl_violations(
-            clock_ring_data, progress_callback, date_maximized_status
-        )
-
     def handle_maximized_status_change(self, date_str, changes):
         """Handle changes to OTDL maximization status"""
         self.date_range_manager.handle_maximized_status_change(date_str, changes)
 
-    def update_violations_and_remedies(
-        self, clock_ring_data=None, progress_callback=None
-    ):
-        """Helper function to detect violations and update all tabs."""
-        self.date_range_manager.update_violations_and_remedies(
-            clock_ring_data, progress_callback
-        )
-
     def on_carrier_data_updated(self, updated_carrier_data):
         """Handle updates to the carrier list and refresh all tabs."""
         self.date_range_manager.on_carrier_data_updated(updated_carrier_data)
 
+    def on_auto_sync_completed(self, stats):
+        """Handle new Klusterbox data synced in the background."""
+        self.date_range_manager.on_source_synced(stats)
+
+    def on_auto_sync_failed(self, message):
+        """Log a failed background sync; it is retried at the next poll."""
+        print(f"Background sync failed: {message}")
+
+    def closeEvent(self, event):
+        """Stop background work before the window closes."""
+        self.auto_sync_service.stop()
+        self.date_range_manager.cancel_pipeline()
+        shutdown_process_pool()
+        super().closeEvent(event)
+
     # This query generates the base dataframe for the entire program.
     # The resulting dataframe will be modified by subsequent methods.
     def fetch_clock_ring_data(self, start_date=None, end_date=None):
@@ -1383,6 +1393,9 @@ def on_carrier_list_updated(self, updated_carrier_data):
 
 
 if __name__ == "__main__":
+    # Let detection worker processes start from the frozen executable
+    multiprocessing.freeze_support()
+
     # Run the application
     app = QApplication(sys.argv)
     main_window = MainApp()
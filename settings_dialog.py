@@ -9,7 +9,6 @@
 import os
 import sqlite3
 
-import pandas as pd
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QDialog,
@@ -25,6 +24,7 @@
     CustomTitleBarWidget,
     CustomWarningDialog,
 )
+from database.initializer import DatabaseInitializer
 from theme import (
     COLOR_TEXT_DIM,
     SECTION_FRAME_STYLE,
@@ -178,13 +178,13 @@ def __init__(self, current_path, parent=None):
         button_layout.setContentsMargins(16, 16, 16, 16)
 
         # Add sync button (without icon)
-        sync_button = QPushButton("Sync Database")
-        sync_button.setStyleSheet(SETTINGS_SYNC_BUTTON_STYLE)
-        sync_button.setToolTip(
+        self.sync_button = QPushButton("Sync Database")
+        self.sync_button.setStyleSheet(SETTINGS_SYNC_BUTTON_STYLE)
+        self.sync_button.setToolTip(
             "Synchronize data between Klusterbox and Eightbox databases"
         )
-        sync_button.clicked.connect(self.sync_database)
-        button_layout.addWidget(sync_button)
+        self.sync_button.clicked.connect(self.sync_database)
+        button_layout.addWidget(self.sync_button)
 
         # Add close button (without icon)
         close_button = QPushButton("Close")
@@ -339,336 +339,75 @@ def update_eightbox_status(self, message, error=False):
             self.eightbox_status.setStyleSheet(SETTINGS_STATUS_STYLE)
 
     def sync_database(self):
-        """Synchronize the working database with the source database."""
+        """Synchronize the working database with the source database.
+
+        The sync runs through the main window's background sync service, so
+        it never overlaps a background sync and the loaded date range is
+        updated with the synced changes. The result is shown when it ends.
+        """
         try:
             # Get target database path
             target_path = os.path.join(
                 os.path.dirname(os.path.abspath(__file__)), "eightbox.sqlite"
             )
-            source_path = self.mandates_db_path
-
-            print("Starting sync process...")
-            print(f"Source: {source_path}")
-            print(f"Target: {target_path}")
 
             # Check if target database exists and is initialized
             if not os.path.exists(target_path):
                 print("Target database does not exist. Creating and initializing...")
-                conn = sqlite3.connect(target_path)
-                cursor = conn.cursor()
-
-                # Create required tables
-                cursor.execute(
-                    """
-                    CREATE TABLE carriers (
-                        effective_date date,
-                        carrier_name varchar,
-                        list_status varchar,
-                        ns_day varchar,
-                        route_s varchar,
-                        station varchar
-                    )
-                """
-                )
-
-                cursor.execute(
-                    """
-                    CREATE TABLE rings3 (
-                        rings_date date,
-                        carrier_name varchar,
-                        total varchar,
-                        rs varchar,
-                        code varchar,
-                        moves varchar,
-                        leave_type varchar,
-                        leave_time varchar,
-                        refusals varchar,
-                        bt varchar,
-                        et varchar
+                if not DatabaseInitializer(target_path).initialize():
+                    raise sqlite3.DatabaseError(
+                        f"Could not initialize database: {target_path}"
                     )
-                """
-                )
-
-                cursor.execute(
-                    """
-                    CREATE TABLE sync_log (
-                        sync_date TEXT NOT NULL,
-                        rows_added_rings3 INTEGER,
-                        rows_added_carriers INTEGER,
-                        backup_path TEXT
-                    )
-                """
-                )
-
-                # Create recommended indexes
-                cursor.execute("CREATE INDEX idx_rings3_date ON rings3(rings_date)")
-                cursor.execute(
-                    "CREATE INDEX idx_carrier_name ON carriers(carrier_name)"
-                )
-                cursor.execute(
-                    "CREATE INDEX idx_rings3_carrier_date ON rings3(carrier_name, rings_date)"
-                )
-
-                conn.commit()
-                conn.close()
                 print("Database initialized successfully.")
-
-            # Connect to both databases
-            source_conn = sqlite3.connect(source_path)
-            target_conn = sqlite3.connect(target_path)
-
-            try:
-                # Start transaction
-                target_conn.execute("BEGIN TRANSACTION")
-
-                # Add diagnostic queries
-                print("\nDiagnostic Information:")
-
-                # Get total counts from both databases
-                source_cursor = source_conn.cursor()
-                target_cursor = target_conn.cursor()
-
-                source_cursor.execute("SELECT COUNT(*) FROM rings3")
-                target_cursor.execute("SELECT COUNT(*) FROM rings3")
-                source_count = source_cursor.fetchone()[0]
-                target_count = target_cursor.fetchone()[0]
-                print(f"Total records in source rings3: {source_count}")
-                print(f"Total records in target rings3: {target_count}")
-
-                # Get the latest records from both databases
-                print("\nLatest records in source rings3:")
-                source_cursor.execute(
-                    """
-                    SELECT rings_date, carrier_name, total
-                    FROM rings3
-                    ORDER BY rings_date DESC, carrier_name
-                    LIMIT 5
-                """
-                )
-                for row in source_cursor.fetchall():
-                    print(f"Date: {row[0]}, Carrier: {row[1]}, Total: {row[2]}")
-
-                print("\nLatest records in target rings3:")
-                target_cursor.execute(
-                    """
-                    SELECT rings_date, carrier_name, total
-                    FROM rings3
-                    ORDER BY rings_date DESC, carrier_name
-                    LIMIT 5
-                """
-                )
-                for row in target_cursor.fetchall():
-                    print(f"Date: {row[0]}, Carrier: {row[1]}, Total: {row[2]}")
-
-                stats = {"rings3_added": 0, "carriers_added": 0, "carriers_modified": 0}
-
-                # Get only new records that don't exist in the target
-                print("Checking for new records...")
-
-                # Get all records from source
-                source_cursor.execute(
-                    """
-                    SELECT DISTINCT s.*
-                    FROM rings3 s
-                    ORDER BY s.rings_date DESC, s.carrier_name
-                """
-                )
-                source_records = source_cursor.fetchall()
-
-                # Check each source record against target
-                new_records = []
-                for record in source_records:
-                    rings_date, carrier_name = record[0], record[1]
-                    target_cursor.execute(
-                        """
-                        SELECT 1 FROM rings3
-                        WHERE rings_date = ?
-                        AND carrier_name = ?
-                    """,
-                        (rings_date, carrier_name),
-                    )
-
-                    if not target_cursor.fetchone():
-                        new_records.append(record)
-                        print(
-                            f"Found new record: Date: {rings_date}, "
-                            f"Carrier: {carrier_name}"
-                        )
-
-                if new_records:
-                    print(f"Preparing to add {len(new_records)} records:")
-                    for record in new_records[:5]:  # Show first 5 records
-                        print(record)
-
-                    # Insert new records directly
-                    target_conn.executemany(
-                        """
-                        INSERT INTO rings3 (
-                            rings_date, carrier_name, total, rs, code,
-                            moves, leave_type, leave_time, refusals, bt, et
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        new_records,
-                    )
-                    stats["rings3_added"] = len(new_records)
-
-                # Handle carriers table similarly - using direct SQL like rings3
-                print("Checking for new carrier records...")
-                source_cursor.execute(
-                    """
-                    SELECT DISTINCT s.*
-                    FROM carriers s
-                    ORDER BY s.effective_date DESC, s.carrier_name
-                """
-                )
-                source_carrier_records = source_cursor.fetchall()
-
-                # Check each source carrier record against target
-                new_carrier_records = []
-                for record in source_carrier_records:
-                    effective_date, carrier_name = record[0], record[1]
-                    target_cursor.execute(
-                        """
-                        SELECT 1 FROM carriers
-                        WHERE effective_date = ?
-                        AND carrier_name = ?
-                    """,
-                        (effective_date, carrier_name),
-                    )
-
-                    if not target_cursor.fetchone():
-                        new_carrier_records.append(record)
-                        print(
-                            f"Found new carrier record: Date: {effective_date}, "
-                            f"Carrier: {carrier_name}"
-                        )
-
-                if new_carrier_records:
-                    print(
-                        f"Preparing to add {len(new_carrier_records)} carrier records:"
-                    )
-                    for record in new_carrier_records[:5]:  # Show first 5 records
-                        print(record)
-
-                    # Insert new carrier records directly
-                    target_conn.executemany(
-                        """
-                        INSERT INTO carriers (
-                            effective_date, carrier_name, list_status,
-                            ns_day, route_s, station
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                        new_carrier_records,
-                    )
-                    stats["carriers_added"] = len(new_carrier_records)
-
-                # Check for modified carrier records
-                modified_carriers = pd.read_sql_query(
-                    """
-                    SELECT s.*
-                    FROM carriers s
-                    JOIN carriers t ON
-                        s.effective_date = t.effective_date AND
-                        s.carrier_name = t.carrier_name
-                    WHERE COALESCE(s.list_status,'') != COALESCE(t.list_status,'')
-                       OR COALESCE(s.ns_day,'') != COALESCE(t.ns_day,'')
-                       OR COALESCE(s.route_s,'') != COALESCE(t.route_s,'')
-                       OR COALESCE(s.station,'') != COALESCE(t.station,'')
-                """,
-                    source_conn,
-                )
-
-                if not modified_carriers.empty:
-                    print(f"Updating {len(modified_carriers)} modified carrier records")
-
-                    # Update modified records
-                    for _, record in modified_carriers.iterrows():
-                        target_conn.execute(
-                            """
-                            UPDATE carriers
-                            SET list_status = ?, ns_day = ?,
-                                route_s = ?, station = ?
-                            WHERE effective_date = ? AND carrier_name = ?
-                        """,
-                            (
-                                record["list_status"],
-                                record["ns_day"],
-                                record["route_s"],
-                                record["station"],
-                                record["effective_date"],
-                                record["carrier_name"],
-                            ),
-                        )
-                    stats["carriers_modified"] = len(modified_carriers)
-
-                # If we added any records, update the sync log
-                if (
-                    stats["rings3_added"] > 0
-                    or stats["carriers_added"] > 0
-                    or stats["carriers_modified"] > 0
-                ):
-                    from datetime import datetime
-
-                    now = datetime.now().isoformat()
-                    target_conn.execute(
-                        """
-                        INSERT INTO sync_log (
-                            sync_date,
-                            rows_added_rings3,
-                            rows_added_carriers
-                        ) VALUES (?, ?, ?)
-                    """,
-                        (now, stats["rings3_added"], stats["carriers_added"]),
-                    )
-
-                    target_conn.commit()
-                    print("Sync completed successfully!")
-                    message = (
-                        f"Sync completed successfully.\n"
-                        f"Added {stats['rings3_added']} new clock rings\n"
-                        f"Added {stats['carriers_added']} carrier records\n"
-                        f"Modified {stats['carriers_modified']} existing carrier records"
-                    )
-                    CustomInfoDialog.information(self, "Sync Complete", message)
-
-                    # Refresh both database status displays after successful sync
-                    self.validate_database(self.mandates_db_path)
-                    self.validate_eightbox_database()
-
-                    return True, message, stats
-                else:
-                    target_conn.rollback()
-                    print("No new records to add - databases are in sync")
-                    CustomInfoDialog.information(
-                        self, "Sync Complete", "No new records to sync"
-                    )
-
-                    # Still refresh status displays even if no changes were made
-                    self.validate_database(self.mandates_db_path)
-                    self.validate_eightbox_database()
-
-                    return False, "No new records to sync", stats
-
-            except Exception as e:
-                target_conn.rollback()
-                print(f"\nError during sync operation: {str(e)}")
-                print(f"Error type: {type(e).__name__}")
-                import traceback
-
-                traceback.print_exc()
-                raise e
-
-            finally:
-                source_conn.close()
-                target_conn.close()
-
         except Exception as e:
-            print(f"\nFatal sync error: {str(e)}")
-            print(f"Error type: {type(e).__name__}")
-            import traceback
-
-            traceback.print_exc()
             CustomWarningDialog.warning(
                 self, "Sync Error", f"An error occurred during sync:\n{str(e)}"
             )
-            return False, f"Sync failed: {str(e)}", None
+            return
+
+        service = self.parent.auto_sync_service
+        service.manual_sync_finished.connect(self._on_sync_finished)
+        service.manual_sync_failed.connect(self._on_sync_failed)
+        self.sync_button.setEnabled(False)
+        service.sync_now()
+
+    def _end_sync(self):
+        """Stop listening for the manual sync and refresh the status displays."""
+        service = self.parent.auto_sync_service
+        service.manual_sync_finished.disconnect(self._on_sync_finished)
+        service.manual_sync_failed.disconnect(self._on_sync_failed)
+        self.sync_button.setEnabled(True)
+        self.validate_database(self.mandates_db_path)
+        self.validate_eightbox_database()
+
+    def _on_sync_finished(self, stats):
+        """Show the result of a finished manual sync.
+
+        Args:
+            stats (dict): Sync statistics from sync_databases
+        """
+        self._end_sync()
+        if any(stats.values()):
+            message = (
+                f"Sync completed successfully.\n"
+                f"Added {stats['rings3_added']} new clock rings\n"
+                f"Modified {stats['rings3_modified']} existing clock rings\n"
+                f"Added {stats['carriers_added']} carrier records\n"
+                f"Modified {stats['carriers_modified']} existing carrier records"
+            )
+            CustomInfoDialog.information(self, "Sync Complete", message)
+        else:
+            CustomInfoDialog.information(
+                self, "Sync Complete", "No new records to sync"
+            )
+
+    def _on_sync_failed(self, message):
+        """Report a failed manual sync.
+
+        Args:
+            message (str): Error message from the sync
+        """
+        self._end_sync()
+        CustomWarningDialog.warning(
+            self, "Sync Error", f"An error occurred during sync:\n{message}"
+        )
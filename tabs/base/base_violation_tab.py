@@ -614,6 +614,180 @@ def refresh_data(self, violation_data):
         # After creating/updating all tabs, update the stats
         self.update_stats()
 
+    def refresh_dates(self, violation_data, dates):
+        """Rebuild only the given date sub-tabs and their Summary columns.
+
+        Falls back to refresh_data when the tab layout would change, e.g. when
+        a date has no sub-tab yet or the set of carriers differs.
+
+        Args:
+            violation_data: Violation data for all dates, already updated for
+                the changed dates
+            dates: Dates (YYYY-MM-DD) whose sub-tabs need rebuilding
+        """
+        date_column = "rings_date" if "rings_date" in violation_data.columns else "date"
+        tab_indexes = {
+            self.date_tabs.tabText(i): i for i in range(self.date_tabs.count())
+        }
+        if (
+            self.showing_no_data
+            or violation_data.empty
+            or self.summary_proxy_model is None
+            or any(str(date) not in tab_indexes for date in dates)
+        ):
+            self.refresh_data(violation_data)
+            return
+
+        summary_model = self.summary_proxy_model.sourceModel()
+        summary_data = self.build_summary_data(violation_data)
+        display_data = self._rename_columns(summary_data)
+        if not display_data.columns.equals(summary_model.df.columns) or not (
+            display_data["Carrier Name"].equals(summary_model.df["Carrier Name"])
+        ):
+            self.refresh_data(violation_data)
+            return
+
+        current_index = self.date_tabs.currentIndex()
+        for date in dates:
+            index = tab_indexes[str(date)]
+            self.date_tabs.removeTab(index)
+            date_data = violation_data[violation_data[date_column] == date]
+            self.create_tab_for_date(date, date_data, index)
+
+        # Patch only the affected Summary columns
+        summary_model.update_columns(
+            display_data, [str(date) for date in dates] + ["Weekly Remedy Total"]
+        )
+        self._update_summary_header(summary_data, self.date_tabs.count() - 1)
+
+        self.date_tabs.setCurrentIndex(current_index)
+        self.update_stats()
+
+    def refresh_rows(self, violation_data, keys):
+        """Patch only the given carriers' rows in their date sub-tabs and Summary.
+
+        Falls back to refresh_dates when a patched table no longer holds the
+        same carriers as its model, e.g. when a carrier was added or removed.
+
+        Args:
+            violation_data: Violation data for all dates, already updated for
+                the changed rows
+            keys: (carrier_name, date) pairs whose rows changed
+        """
+        dates = sorted({date for _, date in keys})
+        if (
+            self.showing_no_data
+            or violation_data.empty
+            or self.summary_proxy_model is None
+            or any(date not in self.models for date in dates)
+        ):
+            self.refresh_dates(violation_data, dates)
+            return
+
+        # Match every table to its model before patching any of them
+        display_columns = self.get_display_columns()
+        patches = []
+        for date in dates:
+            formatted_data = self.format_display_data(
+                self._build_date_data(violation_data, date)
+            )
+            if display_columns:
+                formatted_data = formatted_data[display_columns]
+            carriers = {carrier for carrier, key_date in keys if key_date == date}
+            patches.append((self.models[date], formatted_data, carriers))
+
+        summary_data = self.build_summary_data(violation_data)
+        summary_model = self.summary_proxy_model.sourceModel()
+        summary_carriers = {carrier for carrier, _ in keys}
+
+        aligned = [
+            self._align_to_model(formatted_data, entry["model"])
+            for entry, formatted_data, _ in patches
+        ]
+        aligned_summary = self._align_to_model(summary_data, summary_model)
+        if aligned_summary is None or any(data is None for data in aligned):
+            self.refresh_dates(violation_data, dates)
+            return
+
+        for (entry, formatted_data, carriers), display_data in zip(patches, aligned):
+            model = entry["model"]
+            model.update_rows(display_data, self._carrier_rows(model, carriers))
+            total_violations, header_text = self._build_date_header(formatted_data)
+            self.update_violation_header(
+                self.date_tabs,
+                self.date_tabs.indexOf(entry["tab"]),
+                total_violations,
+                header_text,
+            )
+
+        summary_model.update_rows(
+            aligned_summary, self._carrier_rows(summary_model, summary_carriers)
+        )
+        self._update_summary_header(summary_data, self.date_tabs.count() - 1)
+        self.update_stats()
+
+    def _build_date_data(self, violation_data, date):
+        """Get the violation data shown in a date sub-tab.
+
+        Args:
+            violation_data: Violation data for all dates
+            date: Date of the sub-tab
+
+        Returns:
+            DataFrame: Rows of violation_data for the date
+        """
+        date_column = "rings_date" if "rings_date" in violation_data.columns else "date"
+        return violation_data[violation_data[date_column] == date]
+
+    def _align_to_model(self, data, model):
+        """Rename and order rows of new table data like a model's current rows.
+
+        Rows are matched by carrier name, since sorting a view reorders its
+        model.
+
+        Args:
+            data: New table data before renaming for display
+            model: ViolationModel currently showing the table
+
+        Returns:
+            DataFrame: Display data in the model's row order, or None if the
+                columns or carriers differ from the model's
+        """
+        display_data = self._rename_columns(data)
+        if (
+            not display_data.columns.equals(model.df.columns)
+            or "Carrier Name" not in display_data.columns
+        ):
+            return None
+
+        carriers = model.df["Carrier Name"]
+        indexed = display_data.set_index("Carrier Name", drop=False)
+        if (
+            not indexed.index.is_unique
+            or not carriers.is_unique
+            or len(indexed) != len(carriers)
+            or not carriers.isin(indexed.index).all()
+        ):
+            return None
+
+        aligned = indexed.loc[carriers.to_numpy()]
+        aligned.index = model.df.index
+        return aligned
+
+    @staticmethod
+    def _carrier_rows(model, carriers):
+        """Get the positions of the given carriers' rows in a model.
+
+        Args:
+            model: ViolationModel with a Carrier Name column
+            carriers: Carrier names to find
+
+        Returns:
+            list: Row positions in the model
+        """
+        names = model.df["Carrier Name"].astype(str).str.strip().str.lower()
+        return [row for row, name in enumerate(names) if name in carriers]
+
     def restore_tab_selection(self, current_tab_name):
         """Restore the previously selected tab."""
         if current_tab_name == "Summary":
@@ -624,8 +798,14 @@ def restore_tab_selection(self, current_tab_name):
                     self.date_tabs.setCurrentIndex(i)
                     break
 
-    def create_tab_for_date(self, date, date_data):
-        """Create a new tab for the given date with the provided data."""
+    def create_tab_for_date(self, date, date_data, index=None):
+        """Create a new tab for the given date with the provided data.
+
+        Args:
+            date: Date shown as the tab title
+            date_data: Violation data for the date
+            index: Position to insert the tab at, appended when None
+        """
         # Format data for display
         formatted_data = self.format_display_data(date_data)
 
@@ -642,9 +822,29 @@ def create_tab_for_date(self, date, date_data):
 
         # Store models and add tab
         self.models[date] = {"model": model, "proxy": proxy_model, "tab": view}
-        tab_index = self.date_tabs.addTab(view, str(date))
+        if index is None:
+            tab_index = self.date_tabs.addTab(view, str(date))
+        else:
+            tab_index = self.date_tabs.insertTab(index, view, str(date))
         self.configure_tab_view(view, model)
 
+        # Update header
+        total_violations, header_text = self._build_date_header(formatted_data)
+        self.update_violation_header(
+            self.date_tabs, tab_index, total_violations, header_text
+        )
+
+        return view
+
+    def _build_date_header(self, formatted_data):
+        """Count a date sub-tab's violations by list status.
+
+        Args:
+            formatted_data: Display data of the sub-tab before renaming
+
+        Returns:
+            tuple: (total violations, header text)
+        """
         # Calculate violation counts
         total_violations = 0
         wal_violations = 0
@@ -677,15 +877,18 @@ def create_tab_for_date(self, date, date_data):
             f"PTF: {ptf_violations}"
         )
 
-        # Update header
-        self.update_violation_header(
-            self.date_tabs, tab_index, total_violations, header_text
-        )
+        return total_violations, header_text
 
-        return view
+    def build_summary_data(self, data):
+        """Build the weekly violation totals shown in the Summary tab.
 
-    def add_summary_tab(self, data):
-        """Create or update the summary tab with weekly violation totals."""
+        Args:
+            data: DataFrame containing violation data for all dates
+
+        Returns:
+            DataFrame: One row per carrier with list status, weekly remedy
+                total and one column per date
+        """
         carrier_status = data.groupby("carrier_name")["list_status"].first()
         date_column = "rings_date" if "rings_date" in data.columns else "date"
 
@@ -766,15 +969,28 @@ def add_summary_tab(self, data):
             if col not in ["carrier_name", "list_status"]:
                 summary_data[col] = summary_data[col].round(2)
 
+        return summary_data
+
+    def add_summary_tab(self, data):
+        """Create or update the summary tab with weekly violation totals."""
+        summary_data = self.build_summary_data(data)
+
         model = ViolationModel(summary_data, tab_type=self.tab_type, is_summary=True)
         proxy_model = ViolationFilterProxyModel()
         proxy_model.setSourceModel(model)
         view = self.create_table_view(model, proxy_model)
 
         self.summary_proxy_model = proxy_model
-        self.date_tabs.addTab(view, "Summary")
+        tab_index = self.date_tabs.addTab(view, "Summary")
+        self._update_summary_header(summary_data, tab_index)
+
+    def _update_summary_header(self, summary_data, tab_index):
+        """Update the violation count header of the Summary tab.
 
-        # Add violation count header for summary tab
+        Args:
+            summary_data: Weekly totals from build_summary_data
+            tab_index: Index of the Summary tab
+        """
         violations = self._calculate_violation_count(summary_data)
         if "list_status" in summary_data.columns:
             # Calculate violations for each list status using the same logic
@@ -799,11 +1015,11 @@ def add_summary_tab(self, data):
                 f"PTF: {ptf_violations}"
             )
             self.update_violation_header(
-                self.date_tabs, self.date_tabs.count() - 1, violations, header_text
+                self.date_tabs, tab_index, violations, header_text
             )
         else:
             self.update_violation_header(
-                self.date_tabs, self.date_tabs.count() - 1, violations
+                self.date_tabs, tab_index, violations
             )
 
     def create_summary_model(self, summary_data: pd.DataFrame):
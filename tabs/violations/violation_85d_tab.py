@@ -8,7 +8,7 @@
 import pandas as pd
 
 from tabs.base import BaseViolationTab
-from utils import set_display
+from utils import get_display_indicators
 from violation_types import ViolationType
 
 
@@ -65,9 +65,7 @@ def format_display_data(self, date_data: pd.DataFrame) -> pd.DataFrame:
 
         # Add display indicator if not present
         if "display_indicator" not in formatted_data.columns:
-            formatted_data["display_indicator"] = formatted_data.apply(
-                set_display, axis=1
-            )
+            formatted_data["display_indicator"] = get_display_indicators(formatted_data)
 
         # Format total hours with indicator
         formatted_data["total_hours"] = formatted_data.apply(
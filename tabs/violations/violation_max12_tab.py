@@ -8,7 +8,6 @@
 import pandas as pd
 
 from tabs.base import BaseViolationTab
-from violation_model import ViolationModel
 from violation_types import ViolationType
 
 
@@ -52,12 +51,17 @@ def format_display_data(self, date_data: pd.DataFrame) -> pd.DataFrame:
         """Format data for display in violation tab."""
         return date_data.copy()
 
-    def add_summary_tab(self, data):
-        """Create or update the summary tab with weekly violation totals.
+    def build_summary_data(self, data):
+        """Build the weekly totals shown in the Summary tab.
+
         Shows total hours for daily columns but keeps Weekly Remedy Total.
 
         Args:
             data: DataFrame containing violation data
+
+        Returns:
+            DataFrame: One row per carrier with list status, weekly remedy
+                total and the total hours of each date
         """
         carrier_status = data.groupby("carrier_name")["list_status"].first()
         date_column = "rings_date" if "rings_date" in data.columns else "date"
@@ -89,41 +93,4 @@ def add_summary_tab(self, data):
             if col not in ["carrier_name", "list_status"]:
                 summary_data.loc[:, col] = summary_data[col].round(2)
 
-        # Create model and view
-        model = ViolationModel(summary_data, tab_type=self.tab_type, is_summary=True)
-        proxy_model = self.create_summary_proxy_model(model)
-        view = self.create_table_view(model, proxy_model)
-
-        self.summary_proxy_model = proxy_model
-        self.date_tabs.addTab(view, "Summary")
-
-        # Add violation count header
-        violations = self._calculate_violation_count(summary_data)
-        if "list_status" in summary_data.columns:
-            ptf_violations = self._calculate_list_status_violation_count(
-                summary_data, "ptf"
-            )
-            wal_violations = self._calculate_list_status_violation_count(
-                summary_data, "wal"
-            )
-            nl_violations = self._calculate_list_status_violation_count(
-                summary_data, "nl"
-            )
-            otdl_violations = self._calculate_list_status_violation_count(
-                summary_data, "otdl"
-            )
-
-            header_text = (
-                f"Total Violations: {violations}  |  "
-                f"WAL: {wal_violations}  |  "
-                f"NL: {nl_violations}  |  "
-                f"OTDL: {otdl_violations}  |  "
-                f"PTF: {ptf_violations}"
-            )
-            self.update_violation_header(
-                self.date_tabs, self.date_tabs.count() - 1, violations, header_text
-            )
-        else:
-            self.update_violation_header(
-                self.date_tabs, self.date_tabs.count() - 1, violations
-            )
+        return summary_data
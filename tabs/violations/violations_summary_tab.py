@@ -3,6 +3,7 @@
 This module provides a summary view of all violations across different types,
 allowing for quick analysis and comparison of violation patterns.
 """
+
 import traceback
 
 import pandas as pd
@@ -109,81 +110,14 @@ def refresh_data(self, violation_data):
             self.models.clear()
             self.showing_no_data = False
 
-            # Get all unique dates from column names
-            all_dates = sorted(
-                set(
-                    col.split("_")[0]
-                    for col in violation_data.columns
-                    if "_" in col and col not in ["carrier_name", "list_status"]
-                )
-            )
-
             # Process each date
-            for date in all_dates:
-                date_data = pd.DataFrame()
-
-                # Start with carrier info
-                date_data["carrier_name"] = violation_data["carrier_name"]
-                date_data["list_status"] = violation_data["list_status"]
-
-                # Add each violation type's remedy total for this date
-                for violation_type in self.VIOLATION_ORDER:
-                    # Find the column for this date and violation type
-                    col_name = next(
-                        (
-                            col
-                            for col in violation_data.columns
-                            if col.startswith(f"{date}_{violation_type}")
-                            and not col.startswith(f"{date}_No Violation")
-                        ),
-                        None,
-                    )
-                    if col_name:
-                        date_data[violation_type] = violation_data[col_name]
-                    else:
-                        date_data[violation_type] = 0
-
-                # Add daily remedy total
-                violation_columns = [
-                    col for col in date_data.columns if col in self.VIOLATION_ORDER
-                ]
-                date_data["Remedy Total"] = (
-                    date_data[violation_columns].sum(axis=1).round(2)
+            for date in self._get_dates(violation_data):
+                self.create_tab_for_date(
+                    date, self._build_date_data(violation_data, date)
                 )
 
-                self.create_tab_for_date(date, date_data)
-
             # Create summary data
-            summary_data = pd.DataFrame()
-
-            # Start with carrier info
-            summary_data["carrier_name"] = violation_data["carrier_name"]
-            summary_data["list_status"] = violation_data["list_status"]
-
-            # For each violation type, sum up all dates
-            for violation_type in self.VIOLATION_ORDER:
-                # Find all columns for this violation type
-                violation_cols = [
-                    col
-                    for col in violation_data.columns
-                    if "_" in col
-                    and col.split("_", 1)[1].startswith(violation_type)
-                    and not col.split("_", 1)[1].startswith("No Violation")
-                ]
-                if violation_cols:
-                    summary_data[violation_type] = (
-                        violation_data[violation_cols].sum(axis=1).round(2)
-                    )
-                else:
-                    summary_data[violation_type] = 0
-
-            # Add Weekly Remedy Total
-            violation_columns = [
-                col for col in summary_data.columns if col in self.VIOLATION_ORDER
-            ]
-            summary_data["Weekly Remedy Total"] = (
-                summary_data[violation_columns].sum(axis=1).round(2)
-            )
+            summary_data = self._build_summary_data(violation_data)
 
             # Add summary tab
             self.add_summary_tab(summary_data)
@@ -197,6 +131,177 @@ def refresh_data(self, violation_data):
             self.init_no_data_tab()
             return
 
+    def refresh_dates(self, violation_data, dates, violation_types=None):
+        """Rebuild only the given date sub-tabs and Summary columns.
+
+        Falls back to refresh_data when the tab layout would change.
+
+        Args:
+            violation_data (pd.DataFrame): Remedy data for all dates from
+                get_violation_remedies
+            dates (list): Dates (YYYY-MM-DD) whose sub-tabs need rebuilding
+            violation_types (list, optional): Short violation types that
+                changed. Defaults to all types in VIOLATION_ORDER.
+        """
+        if violation_types is None:
+            violation_types = self.VIOLATION_ORDER
+
+        tab_indexes = {
+            self.date_tabs.tabText(i): i for i in range(self.date_tabs.count())
+        }
+        if (
+            self.showing_no_data
+            or not isinstance(violation_data, pd.DataFrame)
+            or violation_data.empty
+            or self.summary_proxy_model is None
+            or any(date not in tab_indexes for date in dates)
+        ):
+            self.refresh_data(violation_data)
+            return
+
+        try:
+            summary_model = self.summary_proxy_model.sourceModel()
+            summary_data = self._build_summary_data(violation_data)
+            display_data = self._rename_columns(summary_data)
+            if not display_data.columns.equals(summary_model.df.columns) or not (
+                display_data["Carrier Name"].equals(summary_model.df["Carrier Name"])
+            ):
+                self.refresh_data(violation_data)
+                return
+
+            current_tab_index = self.date_tabs.currentIndex()
+            for date in dates:
+                index = tab_indexes[date]
+                self.date_tabs.removeTab(index)
+                self.create_tab_for_date(
+                    date, self._build_date_data(violation_data, date), index
+                )
+
+            # Patch only the affected Summary columns and refresh the header
+            summary_model.update_columns(
+                display_data, list(violation_types) + ["Weekly Remedy Total"]
+            )
+            self._update_summary_header(summary_data, self.date_tabs.count() - 1)
+
+            self.date_tabs.setCurrentIndex(current_tab_index)
+
+        except Exception:
+            traceback.print_exc()
+            self.refresh_data(violation_data)
+
+    def _get_dates(self, violation_data):
+        """Get all unique dates from the date_violation_type column names.
+
+        Args:
+            violation_data (pd.DataFrame): Remedy data from get_violation_remedies
+
+        Returns:
+            list: Sorted dates
+        """
+        return sorted(
+            set(
+                col.split("_")[0]
+                for col in violation_data.columns
+                if "_" in col and col not in ["carrier_name", "list_status"]
+            )
+        )
+
+    def _build_date_data(self, violation_data, date):
+        """Build the per-violation-type remedy totals for a single date.
+
+        Args:
+            violation_data (pd.DataFrame): Remedy data from get_violation_remedies
+            date (str): Date to build the sub-tab data for
+
+        Returns:
+            pd.DataFrame: Carrier info, one column per violation type and the
+                daily Remedy Total
+        """
+        date_data = pd.DataFrame()
+
+        # Start with carrier info
+        date_data["carrier_name"] = violation_data["carrier_name"]
+        date_data["list_status"] = violation_data["list_status"]
+
+        # Add each violation type's remedy total for this date
+        for violation_type in self.VIOLATION_ORDER:
+            # Find the column for this date and violation type
+            col_name = next(
+                (
+                    col
+                    for col in violation_data.columns
+                    if col.startswith(f"{date}_{violation_type}")
+                    and not col.startswith(f"{date}_No Violation")
+                ),
+                None,
+            )
+            if col_name:
+                date_data[violation_type] = violation_data[col_name]
+            else:
+                date_data[violation_type] = 0
+
+        # Add daily remedy total
+        violation_columns = [
+            col for col in date_data.columns if col in self.VIOLATION_ORDER
+        ]
+        date_data["Remedy Total"] = date_data[violation_columns].sum(axis=1).round(2)
+
+        return date_data
+
+    def build_summary_data(self, data):
+        """Build the Summary tab data, see _build_summary_data.
+
+        Args:
+            data (pd.DataFrame): Remedy data from get_violation_remedies
+
+        Returns:
+            pd.DataFrame: Weekly totals per violation type
+        """
+        return self._build_summary_data(data)
+
+    def _build_summary_data(self, violation_data):
+        """Build the weekly totals per violation type for the Summary tab.
+
+        Args:
+            violation_data (pd.DataFrame): Remedy data from get_violation_remedies
+
+        Returns:
+            pd.DataFrame: Carrier info, one column per violation type and the
+                Weekly Remedy Total
+        """
+        summary_data = pd.DataFrame()
+
+        # Start with carrier info
+        summary_data["carrier_name"] = violation_data["carrier_name"]
+        summary_data["list_status"] = violation_data["list_status"]
+
+        # For each violation type, sum up all dates
+        for violation_type in self.VIOLATION_ORDER:
+            # Find all columns for this violation type
+            violation_cols = [
+                col
+                for col in violation_data.columns
+                if "_" in col
+                and col.split("_", 1)[1].startswith(violation_type)
+                and not col.split("_", 1)[1].startswith("No Violation")
+            ]
+            if violation_cols:
+                summary_data[violation_type] = (
+                    violation_data[violation_cols].sum(axis=1).round(2)
+                )
+            else:
+                summary_data[violation_type] = 0
+
+        # Add Weekly Remedy Total
+        violation_columns = [
+            col for col in summary_data.columns if col in self.VIOLATION_ORDER
+        ]
+        summary_data["Weekly Remedy Total"] = (
+            summary_data[violation_columns].sum(axis=1).round(2)
+        )
+
+        return summary_data
+
     def add_summary_tab(self, data):
         """Create a summary tab showing weekly totals for all violation types.
 
@@ -209,7 +314,19 @@ def add_summary_tab(self, data):
 
             # Add the tab
             tab_index = self.date_tabs.addTab(view, "Summary")
+            self._update_summary_header(data, tab_index)
+
+        except Exception:
+            traceback.print_exc()
+
+    def _update_summary_header(self, data, tab_index):
+        """Update the carrier and violation count header of the Summary tab.
 
+        Args:
+            data (pd.DataFrame): DataFrame with weekly violation totals
+            tab_index (int): Index of the Summary tab
+        """
+        try:
             # Calculate total violations for each list status
             carriers_with_violations = data[data["Weekly Remedy Total"] > 0]
             list_status_violations = (
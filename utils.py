@@ -5,10 +5,13 @@
 and handle common tasks like formatting display indicators for various carrier statuses.
 """
 
+import copy
 import json
 import os
 import sys
+from types import MappingProxyType
 
+import numpy as np
 import pandas as pd
 
 
@@ -68,33 +71,182 @@ def set_display(row):
     return ""
 
 
-def load_exclusion_periods():
-    """Load exclusion periods from configuration file.
+# (code, leave_type) pairs with a display indicator, mirroring set_display.
+# Both values are compared after str(), strip() and lower().
+DISPLAY_INDICATOR_TABLE = pd.Series(
+    {
+        ("annual", "none"): "(NS protect)",
+        ("annual", "annual"): "(annual)",
+        ("none", "annual"): "(annual)",
+        ("none", "guaranteed"): "(guaranteed)",
+        ("none", "holiday"): "(holiday)",
+        ("ns day", "none"): "(NS day)",
+        ("sick", "sick"): "(sick)",
+        ("none", "sick"): "(sick)",
+        ("no call", "none"): "(no call)",
+    }
+)
+
+
+def _normalize_indicator_column(data, column):
+    """Normalize a code/leave_type column the same way set_display does.
+
+    Only the distinct values are stripped and lowercased, so the cost is
+    proportional to the number of unique codes rather than the number of rows.
+
+    Args:
+        data (pd.DataFrame): Source data
+        column (str): Column name; a missing column is treated as ""
 
     Returns:
-        tuple: (dict, pd.DatetimeIndex) containing:
-            - dict: Raw exclusion periods from config
-            - pd.DatetimeIndex: Pre-calculated date range for vectorized comparison
+        np.ndarray: Normalized string values aligned with data's rows
     """
-    try:
+    if column not in data.columns:
+        return np.full(len(data), "", dtype=object)
+    codes, uniques = pd.factorize(data[column].astype(str))
+    normalized = pd.Index(uniques).str.strip().str.lower().to_numpy(dtype=object)
+    return normalized[codes]
+
+
+def get_display_indicators(data):
+    """Vectorized equivalent of applying set_display to every row.
+
+    Args:
+        data (pd.DataFrame): Data with 'code' and 'leave_type' columns. Missing
+            columns are handled the same way set_display handles them.
+
+    Returns:
+        pd.Series: Display indicator for each row, indexed like data
+    """
+    if len(data) == 0:
+        return pd.Series(dtype="object", index=data.index)
+
+    keys = pd.MultiIndex.from_arrays(
+        [
+            _normalize_indicator_column(data, "code"),
+            _normalize_indicator_column(data, "leave_type"),
+        ]
+    )
+    indicators = DISPLAY_INDICATOR_TABLE.reindex(keys).fillna("").to_numpy()
+    return pd.Series(indicators, index=data.index, dtype="object")
+
+
+class ExclusionCalendar:
+    """Immutable calendar of December exclusion periods.
+
+    Periods are stored as merged, sorted day intervals so membership checks
+    for a whole column of dates are a single binary search.
+
+    Attributes:
+        periods (MappingProxyType): Read-only raw exclusion periods from config
+        dates (pd.DatetimeIndex): Every excluded date
+    """
+
+    def __init__(self, periods=None):
+        """Build the calendar from raw exclusion periods.
+
+        Args:
+            periods (dict, optional): Year-keyed exclusion periods as stored in
+                exclusion_periods.json
+        """
+        periods = copy.deepcopy(periods or {})
+        intervals = []
+        for _, year_data in periods.items():
+            if "december_exclusion" in year_data:
+                period = year_data["december_exclusion"]
+                intervals.append(
+                    (
+                        np.datetime64(pd.to_datetime(period["start"]).date(), "D"),
+                        np.datetime64(pd.to_datetime(period["end"]).date(), "D"),
+                    )
+                )
+
+        # Merge overlapping intervals so each date falls in at most one
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1] + np.timedelta64(1, "D"):
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        self._starts = np.array([start for start, _ in merged], dtype="datetime64[D]")
+        self._ends = np.array([end for _, end in merged], dtype="datetime64[D]")
+        self._starts.flags.writeable = False
+        self._ends.flags.writeable = False
+        self.periods = MappingProxyType(periods)
+        self.dates = pd.DatetimeIndex(
+            [date for start, end in merged for date in pd.date_range(start, end)]
+        )
+
+    def is_excluded(self, dates):
+        """Check which dates fall inside an exclusion period.
+
+        Args:
+            dates (pd.Series): Datetime values to check
+
+        Returns:
+            np.ndarray: Boolean mask aligned with dates
+        """
+        days = pd.to_datetime(dates).to_numpy().astype("datetime64[D]")
+        if len(self._starts) == 0:
+            return np.zeros(len(days), dtype=bool)
+        period = np.searchsorted(self._starts, days, side="right") - 1
+        return (period >= 0) & (days <= self._ends[period.clip(min=0)])
+
+
+_exclusion_calendar_cache = {}
+
+
+def get_exclusion_calendar(config_path=None):
+    """Get the exclusion calendar, reloading only when the config file changes.
+
+    Args:
+        config_path (str, optional): Path to exclusion_periods.json. Defaults to
+            the file next to this module.
+
+    Returns:
+        ExclusionCalendar: Shared calendar for the current file contents
+    """
+    if config_path is None:
         config_path = os.path.join(os.path.dirname(__file__), "exclusion_periods.json")
-        if os.path.exists(config_path):
+
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        mtime = None
+
+    cached = _exclusion_calendar_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    periods = {}
+    if mtime is not None:
+        try:
             with open(config_path, "r", encoding="utf-8") as f:
                 periods = json.load(f)
+        except Exception as e:
+            print(f"Error loading exclusion periods: {e}")
 
-            # Create a list of all exclusion dates for vectorized comparison
-            all_dates = []
-            for _, year_data in periods.items():
-                if "december_exclusion" in year_data:
-                    period = year_data["december_exclusion"]
-                    start = pd.to_datetime(period["start"])
-                    end = pd.to_datetime(period["end"])
-                    all_dates.extend(pd.date_range(start, end))
-
-            return periods, pd.DatetimeIndex(all_dates)
+    try:
+        calendar = ExclusionCalendar(periods)
     except Exception as e:
         print(f"Error loading exclusion periods: {e}")
-    return {}, pd.DatetimeIndex([])
+        calendar = ExclusionCalendar()
+
+    _exclusion_calendar_cache[config_path] = (mtime, calendar)
+    return calendar
+
+
+def load_exclusion_periods():
+    """Load exclusion periods from configuration file.
+
+    Returns:
+        tuple: (dict, pd.DatetimeIndex) containing:
+            - dict: Raw exclusion periods from config
+            - pd.DatetimeIndex: Pre-calculated date range for vectorized comparison
+    """
+    calendar = get_exclusion_calendar()
+    return copy.deepcopy(dict(calendar.periods)), calendar.dates
 
 
 def get_resource_path(relative_path):
@@ -32,7 +32,10 @@
   Daily (12-hour) and weekly (60-hour) limits
 
 Features:
-- Centralized violation registration system
+- Centralized violation registration, with the inputs and scope of each
+  detector so only invalidated violations are recomputed after an edit
+- Concurrent detection of independent violation types, in threads or
+  worker processes sharing the prepared data
 - Vectorized move processing
 - Flexible remedy aggregation
 - Standardized data preparation
@@ -44,10 +47,27 @@
 maintainability and testing. This module now focuses on coordination
 and shared utilities."""
 
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack
+from dataclasses import dataclass
 from typing import (
     Callable,
     Dict,
+    FrozenSet,
+    Iterable,
+    List,
     Optional,
+    Tuple,
+    Union,
 )
 
 import pandas as pd
@@ -59,42 +79,357 @@
 from violation_formulas.article_85g import detect_85g_violations
 from violation_formulas.max12 import detect_MAX_12
 from violation_formulas.max60 import detect_MAX_60
+from violation_formulas.prepared_rings import PreparedRings
+from violation_formulas.shared_rings import (
+    SharedPreparedRings,
+    run_shared_detector,
+)
 
 # Type alias for violation detection function
-ViolationFunc = Callable[[pd.DataFrame, Optional[dict]], pd.DataFrame]
+ViolationFunc = Callable[
+    [Union[PreparedRings, pd.DataFrame], Optional[dict]], pd.DataFrame
+]
 
 # Registry for violation detection functions
 registered_violations: Dict[str, ViolationFunc] = {}
 violation_registry: Dict[str, ViolationFunc] = {}
 
+# Scopes of the rows a detector evaluates together
+SCOPE_DAY = "day"
+SCOPE_WEEK = "week"
+
+# Input name for the date-keyed OTDL maximization status
+OTDL_STATUS = "date_maximized_status"
+
+# Inputs changed by each kind of edit, for invalidated_violation_types()
+MOVES_EDIT = frozenset({"moves"})
+OTDL_STATUS_CHANGE = frozenset({OTDL_STATUS})
+CARRIER_STATUS_CHANGE = frozenset({"list_status", "hour_limit"})
+
+# Prepared frames with at least this many rows are detected in worker processes
+PROCESS_POOL_MIN_ROWS = 50_000
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ViolationDetector:
+    """A registered violation detector and what its results depend on.
+
+    Attributes:
+        violation_type: Type the detector is registered under
+        code: Short key the violation is shown under in tabs and the summary
+        func: The detection function
+        columns: Prepared columns the detector reads, or None if unknown
+        scope: SCOPE_DAY if every date is evaluated on its own, SCOPE_WEEK if
+            every Saturday-to-Friday service week is
+        uses_otdl_status: The detector reads the OTDL maximization status
+        uses_excusals: The detector reads excused carriers from the status, so
+            it receives the status dicts instead of plain booleans
+    """
+
+    violation_type: str
+    code: str
+    func: ViolationFunc
+    columns: Optional[FrozenSet[str]] = None
+    scope: str = SCOPE_DAY
+    uses_otdl_status: bool = False
+    uses_excusals: bool = False
+
+    @property
+    def inputs(self) -> Optional[FrozenSet[str]]:
+        """Input columns, plus OTDL_STATUS, the results depend on.
+
+        None if the detector did not declare its columns.
+        """
+        if self.columns is None:
+            return None
+        inputs = set(PreparedRings.source_columns(self.columns))
+        if self.uses_otdl_status or self.uses_excusals:
+            inputs.add(OTDL_STATUS)
+        return frozenset(inputs)
+
+    @property
+    def uses_moves(self) -> bool:
+        """True if the results depend on the moves column."""
+        return self.inputs is None or "moves" in self.inputs
+
+    def depends_on(self, changed_inputs) -> bool:
+        """Check whether a change to some inputs can change the results.
+
+        Args:
+            changed_inputs (Iterable[str]): Changed input columns or OTDL_STATUS
+
+        Returns:
+            bool: True if the detector must run again
+        """
+        return self.inputs is None or not self.inputs.isdisjoint(changed_inputs)
+
+
+# Registered detectors with their metadata, in registration order
+violation_detectors: Dict[str, ViolationDetector] = {}
+
 
-def register_violation(violation_type: str) -> Callable[[ViolationFunc], ViolationFunc]:
-    """Register a violation detection function for a specific violation type."""
+def add_violation_detector(detector: ViolationDetector):
+    """Register a detector with its metadata.
+
+    Args:
+        detector (ViolationDetector): The detector to register
+    """
+    violation_registry[detector.violation_type] = detector.func
+    violation_detectors[detector.violation_type] = detector
+
+
+def register_violation(
+    violation_type: str,
+    code: Optional[str] = None,
+    columns: Optional[Iterable[str]] = None,
+    scope: str = SCOPE_DAY,
+    uses_otdl_status: bool = False,
+    uses_excusals: bool = False,
+) -> Callable[[ViolationFunc], ViolationFunc]:
+    """Register a violation detection function for a specific violation type.
+
+    Args:
+        violation_type (str): Type the function detects
+        code (str, optional): Short key for the violation. Defaults to
+            violation_type.
+        columns (Iterable[str], optional): Prepared columns the function
+            reads. When omitted the function is rerun after any change.
+        scope (str): SCOPE_DAY or SCOPE_WEEK. Data spanning several service
+            weeks is split by week for SCOPE_WEEK functions and each week is
+            detected separately.
+        uses_otdl_status (bool): The function reads the OTDL maximization status
+        uses_excusals (bool): The function reads excused carriers from the
+            maximization status
+    """
 
     def decorator(func: ViolationFunc) -> ViolationFunc:
-        violation_registry[violation_type] = func
+        add_violation_detector(
+            ViolationDetector(
+                violation_type=violation_type,
+                code=code or violation_type,
+                func=func,
+                columns=None if columns is None else frozenset(columns),
+                scope=scope,
+                uses_otdl_status=uses_otdl_status,
+                uses_excusals=uses_excusals,
+            )
+        )
         return func
 
     return decorator
 
 
 # Register the violation detection functions
-register_violation("8.5.D Overtime Off Route")(detect_85d_violations)
-register_violation("8.5.F Overtime Over 10 Hours Off Route")(detect_85f_violations)
-register_violation("8.5.F NS Overtime On a Non-Scheduled Day")(detect_85f_ns_violations)
-register_violation("8.5.F 5th More Than 4 Days of Overtime in a Week")(
-    detect_85f_5th_violations
-)
-register_violation("8.5.G")(detect_85g_violations)
-register_violation("MAX12 More Than 12 Hours Worked in a Day")(detect_MAX_12)
-register_violation("MAX60 More Than 60 Hours Worked in a Week")(detect_MAX_60)
+register_violation(
+    "8.5.D Overtime Off Route",
+    code="8.5.D",
+    columns=[
+        "carrier_name",
+        "rings_date",
+        "moves",
+        "display_indicator",
+        "list_status",
+        "is_wal_nl",
+        "total_hours",
+        "is_ns_day",
+        "own_route_hours",
+        "off_route_hours",
+        "formatted_moves",
+    ],
+    uses_otdl_status=True,
+)(detect_85d_violations)
+register_violation(
+    "8.5.F Overtime Over 10 Hours Off Route",
+    code="8.5.F",
+    columns=[
+        "carrier_name",
+        "rings_date",
+        "moves",
+        "display_indicator",
+        "list_status",
+        "is_wal_nl",
+        "total_hours",
+        "date_dt",
+        "own_route_hours",
+        "off_route_hours",
+        "formatted_moves",
+    ],
+)(detect_85f_violations)
+register_violation(
+    "8.5.F NS Overtime On a Non-Scheduled Day",
+    code="8.5.F NS",
+    columns=[
+        "carrier_name",
+        "rings_date",
+        "display_indicator",
+        "list_status",
+        "total_hours",
+        "date_dt",
+        "is_ns_day",
+    ],
+)(detect_85f_ns_violations)
+register_violation(
+    "8.5.F 5th More Than 4 Days of Overtime in a Week",
+    code="8.5.F 5th",
+    columns=[
+        "carrier_name",
+        "rings_date",
+        "leave_type",
+        "display_indicator",
+        "list_status",
+        "total_hours",
+        "leave_hours",
+        "date_dt",
+        "is_ns_day",
+    ],
+    scope=SCOPE_WEEK,
+)(detect_85f_5th_violations)
+register_violation(
+    "8.5.G",
+    code="8.5.G",
+    columns=[
+        "carrier_name",
+        "display_indicator",
+        "list_status",
+        "hour_limit",
+        "total_hours",
+        "date_dt",
+    ],
+    uses_otdl_status=True,
+    uses_excusals=True,
+)(detect_85g_violations)
+register_violation(
+    "MAX12 More Than 12 Hours Worked in a Day",
+    code="MAX12",
+    columns=[
+        "carrier_name",
+        "rings_date",
+        "moves",
+        "list_status",
+        "total_hours",
+        "date_dt",
+        "own_route_hours",
+        "off_route_hours",
+        "formatted_moves",
+    ],
+)(detect_MAX_12)
+register_violation(
+    "MAX60 More Than 60 Hours Worked in a Week",
+    code="MAX60",
+    columns=[
+        "carrier_name",
+        "rings_date",
+        "display_indicator",
+        "list_status",
+        "total_hours",
+        "leave_hours",
+        "date_dt",
+    ],
+    scope=SCOPE_WEEK,
+)(detect_MAX_60)
+
+
+def get_violation_types(skip_codes: Iterable[str] = ()) -> Dict[str, str]:
+    """Get the registered violation types keyed by their codes.
+
+    Args:
+        skip_codes (Iterable[str]): Codes to leave out, e.g. of hidden tabs
+
+    Returns:
+        dict: Code to violation type, in registration order
+    """
+    skip_codes = set(skip_codes)
+    return {
+        detector.code: violation_type
+        for violation_type, detector in violation_detectors.items()
+        if detector.code not in skip_codes
+    }
+
+
+def invalidated_violation_types(
+    changed_inputs: Iterable[str], skip_codes: Iterable[str] = ()
+) -> Dict[str, str]:
+    """Get the violation types whose results a change can affect.
+
+    Args:
+        changed_inputs (Iterable[str]): Changed input columns or OTDL_STATUS,
+            e.g. MOVES_EDIT, OTDL_STATUS_CHANGE or CARRIER_STATUS_CHANGE
+        skip_codes (Iterable[str]): Codes to leave out, e.g. of hidden tabs
+
+    Returns:
+        dict: Code to violation type, in registration order
+    """
+    changed_inputs = frozenset(changed_inputs)
+    return {
+        code: violation_type
+        for code, violation_type in get_violation_types(skip_codes).items()
+        if violation_detectors[violation_type].depends_on(changed_inputs)
+    }
+
+
+def get_violation_code(violation_type: str) -> str:
+    """Get the short code of a violation type.
+
+    Args:
+        violation_type (str): Registered violation type or code
+
+    Returns:
+        str: The registered code, or violation_type if it is not registered
+    """
+    detector = violation_detectors.get(violation_type)
+    return detector.code if detector else violation_type
+
+
+def _service_week_parts(prepared: PreparedRings, violation_type: str) -> List:
+    """Get the service weeks to detect separately for a violation type.
+
+    Args:
+        prepared (PreparedRings): The prepared clock ring data
+        violation_type (str): Registered violation type
+
+    Returns:
+        list: Weekly periods in week order, or [None] to detect the whole
+            frame at once because the type is not week-scoped, the data covers a
+            single week or some rows have no date
+    """
+    detector = violation_detectors[violation_type]
+    if detector.scope == SCOPE_WEEK and prepared.frame["date_dt"].notna().all():
+        weeks = list(prepared.split_by_service_week())
+        if len(weeks) > 1:
+            return weeks
+    return [None]
+
+
+def _merge_week_results(results: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the per-week results of a weekly detector.
+
+    Args:
+        results (list): Detector results in week order
+
+    Returns:
+        pd.DataFrame: Rows ordered by carrier name, then by week
+    """
+    if len(results) == 1:
+        return results[0]
+    merged = pd.concat(
+        [result for result in results if not result.empty] or results[:1],
+        ignore_index=True,
+    )
+    if "carrier_name" in merged.columns:
+        merged = merged.sort_values("carrier_name", kind="stable", ignore_index=True)
+    return merged
 
 
 def detect_violations(data, violation_type, date_maximized_status=None):
     """Dispatch violation detection to the appropriate registered function.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data to check for violations
+        data (Union[PreparedRings, pd.DataFrame]): Carrier work hour data to check
+            for violations. Pass a PreparedRings when running several detectors
+            over the same data so the shared columns are only computed once.
         violation_type (str): Type of violation to detect (e.g., "8.5.F NS", "MAX60")
         date_maximized_status (dict, optional): Date-keyed dict of OTDL maximization status
 
@@ -103,13 +438,14 @@ def detect_violations(data, violation_type, date_maximized_status=None):
 
     Note:
         Uses the violation registry populated by @register_violation decorator
-        to route detection to the appropriate specialized function.
+        to route detection to the appropriate specialized function. Week-scoped
+        types are detected one service week at a time.
     """
     if date_maximized_status is None:
         date_maximized_status = {}
 
     # For violations that don't need excusal data, convert to simple boolean
-    if violation_type not in ["8.5.G", "8.5.G OTDL Not Maximized"]:
+    if not violation_detectors[violation_type].uses_excusals:
         # Convert date_maximized_status values to simple boolean if needed
         if any(isinstance(v, dict) for v in date_maximized_status.values()):
             date_maximized_status = {
@@ -118,7 +454,166 @@ def detect_violations(data, violation_type, date_maximized_status=None):
             }
 
     violation_function = violation_registry[violation_type]
-    return violation_function(data, date_maximized_status)
+    prepared = PreparedRings.ensure(data)
+    weeks = _service_week_parts(prepared, violation_type)
+    if weeks == [None]:
+        return violation_function(prepared, date_maximized_status)
+
+    parts = prepared.split_by_service_week()
+    return _merge_week_results(
+        [violation_function(parts[week], date_maximized_status) for week in weeks]
+    )
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the process pool for detecting violations, creating it on first use.
+
+    Workers are spawned rather than forked on every platform, so they never
+    inherit the Qt event loop or database connections, and they stay alive
+    between refreshes so only the first large refresh pays for starting them.
+
+    Returns:
+        ProcessPoolExecutor: Pool with one worker per CPU
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def shutdown_process_pool():
+    """Stop the detection worker processes, if they were started."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def _finish_futures(futures):
+    """Cancel detectors that have not started and wait for the others."""
+    for future in futures:
+        future.cancel()
+    wait(futures)
+
+
+def detect_all_violations(
+    data: Union[PreparedRings, pd.DataFrame],
+    violation_types: Optional[Dict[str, str]] = None,
+    date_maximized_status: Optional[dict] = None,
+    max_workers: Optional[int] = None,
+    on_detected: Optional[Callable[[str, float], None]] = None,
+    use_processes: Optional[bool] = None,
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, float]]:
+    """Run independent violation detectors concurrently on shared data.
+
+    The data is prepared once and every detector reads the same prepared
+    frame. By default detectors run on a thread pool; they treat the frame
+    as read-only and spend most of their time in pandas and NumPy kernels,
+    many of which release the GIL. Large frames are detected in worker
+    processes instead: the prepared columns are copied once into shared
+    memory (see SharedPreparedRings) and each worker attaches to them rather
+    than receiving a pickled copy per detector. Weekly detectors are split
+    into one task per service week, so long ranges spread across workers.
+
+    Args:
+        data (Union[PreparedRings, pd.DataFrame]): Carrier work hour data
+        violation_types (dict, optional): Result key to registered violation
+            type. Defaults to every registered type, keyed by its code.
+        date_maximized_status (dict, optional): Date-keyed dict of OTDL
+            maximization status, passed to every detector; detectors that do
+            not use it ignore it
+        max_workers (int, optional): Number of threads. Defaults to the CPU
+            count, capped at the number of tasks. The process pool always
+            has one worker per CPU.
+        on_detected (callable, optional): Called on the calling thread as
+            on_detected(key, seconds) as each detector finishes. If it raises,
+            detectors that have not started are cancelled and the exception
+            propagates.
+        use_processes (bool, optional): Run detectors in worker processes.
+            Defaults to True when more than one worker is available and the
+            prepared frame has at least PROCESS_POOL_MIN_ROWS rows. Detectors
+            must be importable module-level functions to run in processes.
+
+    Returns:
+        tuple: (violations, timings), both keyed like violation_types.
+            violations holds each detector's result in violation_types order
+            and timings its detection time in seconds, summed over weeks.
+    """
+    prepared = PreparedRings.ensure(data)
+    if violation_types is None:
+        violation_types = get_violation_types()
+
+    # Week-scoped detectors run once per service week, each week as its own task
+    weeks = {
+        key: _service_week_parts(prepared, violation_type)
+        for key, violation_type in violation_types.items()
+    }
+    tasks = [
+        (key, violation_type, week)
+        for key, violation_type in violation_types.items()
+        for week in weeks[key]
+    ]
+    if max_workers is None:
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+    if use_processes is None:
+        use_processes = max_workers > 1 and len(prepared.frame) >= PROCESS_POOL_MIN_ROWS
+
+    def run_detector(violation_type, week):
+        start = time.perf_counter()
+        part = prepared if week is None else prepared.split_by_service_week()[week]
+        result = detect_violations(part, violation_type, date_maximized_status)
+        return result, time.perf_counter() - start
+
+    parts = {key: {} for key in violation_types}
+    violations = {}
+    timings = {}
+    with ExitStack() as stack:
+        if use_processes:
+            shared = stack.enter_context(SharedPreparedRings(prepared))
+            executor = get_process_pool()
+
+            def submit(violation_type, week):
+                return executor.submit(
+                    run_shared_detector,
+                    shared.spec,
+                    violation_detectors[violation_type],
+                    date_maximized_status,
+                    week,
+                )
+
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, max_workers),
+                thread_name_prefix="violation-detector",
+            )
+            stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+
+            def submit(violation_type, week):
+                return executor.submit(run_detector, violation_type, week)
+
+        futures = {
+            submit(violation_type, week): (key, week)
+            for key, violation_type, week in tasks
+        }
+        # Workers must be done with the shared block before it is removed
+        stack.callback(_finish_futures, futures)
+        for future in as_completed(futures):
+            key, week = futures[future]
+            parts[key][week] = future.result()
+            if len(parts[key]) < len(weeks[key]):
+                continue
+            results = [parts[key][week][0] for week in weeks[key]]
+            violations[key] = _merge_week_results(results)
+            timings[key] = sum(seconds for _, seconds in parts[key].values())
+            if on_detected:
+                on_detected(key, timings[key])
+
+    return {key: violations[key] for key in violation_types}, timings
 
 
 def get_violation_remedies(data, violations):
@@ -156,19 +651,8 @@ def get_violation_remedies(data, violations):
             # Ensure violation_type is properly set in the data
             violation_data = violation_data.copy()
 
-            # Map full violation types to short types
-            violation_type_map = {
-                "8.5.D Overtime Off Route": "8.5.D",
-                "8.5.F Overtime Over 10 Hours Off Route": "8.5.F",
-                "8.5.F NS Overtime On a Non-Scheduled Day": "8.5.F NS",
-                "8.5.F 5th More Than 4 Days of Overtime in a Week": "8.5.F 5th",
-                "8.5.G OTDL Not Maximized": "8.5.G",
-                "MAX12 More Than 12 Hours Worked in a Day": "MAX12",
-                "MAX60 More Than 60 Hours Worked in a Week": "MAX60",
-            }
-
-            # Use the short type if it's a full type, otherwise use as is
-            short_type = violation_type_map.get(violation_type, violation_type)
+            # Use the short code if it's a full type, otherwise use as is
+            short_type = get_violation_code(violation_type)
 
             # Select only necessary columns
             columns_to_keep = [
@@ -10,6 +10,9 @@
 - Article 8.5.G: OTDL carriers not maximized
 - MAX12: Exceeding 12-hour daily limit
 - MAX60: Exceeding 60-hour weekly limit
+
+Clock ring data is prepared once with PreparedRings and shared read-only
+by all detectors.
 """
 
 from .article_85d import detect_85d_violations
@@ -19,8 +22,10 @@
 from .article_85g import detect_85g_violations
 from .max12 import detect_MAX_12
 from .max60 import detect_MAX_60
+from .prepared_rings import PreparedRings
 
 __all__ = [
+    "PreparedRings",
     "detect_85d_violations",
     "detect_85f_violations",
     "detect_85f_ns_violations",
@@ -7,8 +7,8 @@
 import numpy as np
 import pandas as pd
 
-from utils import set_display
 from violation_formulas.formula_utils import prepare_data_for_violations
+from violation_formulas.prepared_rings import PreparedRings
 
 
 def detect_85d_violations(
@@ -17,18 +17,13 @@ def detect_85d_violations(
     """Detect Article 8.5.D violations for working off bid assignment.
 
     Args:
-        data: DataFrame containing carrier clock rings and moves
+        data: PreparedRings (or raw DataFrame) of carrier clock rings and moves
         date_maximized_status: Dictionary of violation detection settings
 
     Returns:
         DataFrame containing detected violations with remedy calculations
     """
-    result_df = prepare_data_for_violations(data)
-
-    # Check for NS day in code
-    result_df["is_ns_day"] = (
-        result_df["code"].str.strip().str.lower().str.contains("ns day", na=False)
-    )
+    result_df = prepare_data_for_violations(PreparedRings.ensure(data).copy())
 
     # Initialize violation_type column with "No Violation"
     result_df["violation_type"] = "No Violation"
@@ -43,9 +38,6 @@ def detect_85d_violations(
     # Set "No Violation (OTDL Maxed)" for maximized dates
     result_df.loc[maximized_dates, "violation_type"] = "No Violation (OTDL Maxed)"
 
-    # Add display indicator
-    result_df["display_indicator"] = result_df.apply(set_display, axis=1)
-
     # Check for valid moves (not empty, none, or no moves)
     has_valid_moves = (
         result_df["moves"].notna()
@@ -4,14 +4,12 @@
 more than 10 hours on a regularly scheduled day.
 """
 
-import json
-import os
-
 import numpy as np
 import pandas as pd
 
-from utils import set_display
+from utils import get_exclusion_calendar
 from violation_formulas.formula_utils import prepare_data_for_violations
+from violation_formulas.prepared_rings import PreparedRings
 
 
 def detect_85f_violations(
@@ -20,7 +18,7 @@ def detect_85f_violations(
     """Detect Article 8.5.F violations for work over 10 hours off assignment.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data containing:
+        data (PreparedRings): Prepared carrier work hour data containing:
             - carrier_name: Name of the carrier
             - list_status: WAL/NL/OTDL status
             - total_hours: Total hours worked
@@ -40,16 +38,12 @@ def detect_85f_violations(
         - Not during December exclusion period
     """
     # Use the same data preparation as 8.5.D
-    result_df = prepare_data_for_violations(data)
-
-    # Convert dates to datetime for comparison
-    result_df["date_dt"] = pd.to_datetime(result_df["rings_date"])
-
-    # Load exclusion periods and get pre-calculated date range
-    _, exclusion_dates = load_exclusion_periods()
+    result_df = prepare_data_for_violations(PreparedRings.ensure(data).copy())
 
-    # Vectorized exclusion period check
-    result_df["is_excluded"] = result_df["date_dt"].isin(exclusion_dates)
+    # Vectorized exclusion period check against the shared calendar
+    result_df["is_excluded"] = get_exclusion_calendar().is_excluded(
+        result_df["date_dt"]
+    )
 
     # Set exclusion period entries
     result_df.loc[
@@ -78,9 +72,6 @@ def detect_85f_violations(
         violation_mask & (result_df["remedy_total"] > 0), "violation_type"
     ] = "8.5.F Overtime Over 10 Hours Off Route"
 
-    # Add display indicator
-    result_df["display_indicator"] = result_df.apply(set_display, axis=1)
-
     return result_df[
         [
             "carrier_name",
@@ -95,34 +86,3 @@ def detect_85f_violations(
             "display_indicator",
         ]
     ].rename(columns={"rings_date": "date", "formatted_moves": "off_route_hours"})
-
-
-def load_exclusion_periods():
-    """Load exclusion periods from configuration file.
-
-    Returns:
-        tuple: (dict, pd.DatetimeIndex) containing:
-            - dict: Raw exclusion periods from config
-            - pd.DatetimeIndex: Pre-calculated date range for vectorized comparison
-    """
-    try:
-        config_path = os.path.join(
-            os.path.dirname(__file__), "..", "exclusion_periods.json"
-        )
-        if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                periods = json.load(f)
-
-            # Create a list of all exclusion dates for vectorized comparison
-            all_dates = []
-            for year, year_data in periods.items():
-                if "december_exclusion" in year_data:
-                    period = year_data["december_exclusion"]
-                    start = pd.to_datetime(period["start"])
-                    end = pd.to_datetime(period["end"])
-                    all_dates.extend(pd.date_range(start, end))
-
-            return periods, pd.DatetimeIndex(all_dates)
-    except Exception as e:
-        print(f"Error loading exclusion periods: {e}")
-    return {}, pd.DatetimeIndex([])
@@ -7,8 +7,20 @@
 import numpy as np
 import pandas as pd
 
-from utils import set_display
-from violation_formulas.article_85f import load_exclusion_periods
+from utils import get_exclusion_calendar
+from violation_formulas.formula_utils import get_service_week
+from violation_formulas.prepared_rings import PreparedRings
+
+RESULT_COLUMNS = [
+    "carrier_name",
+    "list_status",
+    "violation_type",
+    "date",
+    "remedy_total",
+    "total_hours",
+    "display_indicator",
+    "85F_5th_date",
+]
 
 
 def detect_85f_5th_violations(
@@ -17,7 +29,7 @@ def detect_85f_5th_violations(
     """Detect Article 8.5.F violations for fifth overtime day in a week.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data containing:
+        data (PreparedRings): Prepared carrier work hour data containing:
             - carrier_name: Name of the carrier
             - list_status: WAL/NL/OTDL status
             - total_hours: Total hours worked
@@ -33,165 +45,90 @@ def detect_85f_5th_violations(
     Note:
         Violation occurs when:
         - Carrier is WAL or NL
-        - Worked overtime on 5 scheduled days in a week
+        - Worked overtime on 5 scheduled days in a service week
+          (Saturday to Friday, evaluated separately for each week in the range)
+        - Did not work an 8-hour day that week
         - Not during December exclusion period
     """
     # Keep all carriers but only process violations for WAL/NL
-    result_df = data.copy()
-
-    # Convert numeric columns safely
-    result_df["total_hours"] = pd.to_numeric(
-        result_df["total"], errors="coerce"
-    ).fillna(0)
-    result_df["leave_time"] = pd.to_numeric(
-        result_df.get("leave_time", 0), errors="coerce"
-    ).fillna(0)
-    result_df["leave_type"] = result_df["leave_type"].astype(str)
-    result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
+    result_df = PreparedRings.ensure(data).copy()
 
     # Calculate daily hours with holiday handling vectorized
-    holiday_mask = (result_df["leave_type"].str.lower() == "holiday") & (
-        result_df["leave_time"] == 8.00
+    holiday_mask = (result_df["leave_type"].astype(str).str.lower() == "holiday") & (
+        result_df["leave_hours"] == 8.00
     )
     result_df["daily_hours"] = np.where(
         holiday_mask,
         result_df["total_hours"],
         np.where(
-            result_df["leave_time"] <= result_df["total_hours"],
-            np.maximum(result_df["total_hours"], result_df["leave_time"]),
-            result_df["total_hours"] + result_df["leave_time"],
+            result_df["leave_hours"] <= result_df["total_hours"],
+            np.maximum(result_df["total_hours"], result_df["leave_hours"]),
+            result_df["total_hours"] + result_df["leave_hours"],
         ),
     )
 
-    # Add display indicators
-    result_df["display_indicator"] = result_df.apply(set_display, axis=1)
-
-    # Convert dates to datetime for comparison
-    result_df["date_dt"] = pd.to_datetime(result_df["rings_date"])
-
     # Create service week groups (Saturday to Friday)
-    result_df["service_week"] = result_df["date_dt"].dt.to_period("W-SAT")
+    result_df["service_week"] = get_service_week(result_df["date_dt"])
     result_df["day_of_week"] = result_df["date_dt"].dt.dayofweek  # Monday=0, Sunday=6
 
-    # Load exclusion periods and get pre-calculated date range
-    _, exclusion_dates = load_exclusion_periods()
-
-    # Vectorized exclusion period check
-    result_df["is_excluded"] = result_df["date_dt"].isin(exclusion_dates)
-
-    # Process all carriers but only calculate violations for WAL/NL
-    base_result = []
-    for carrier in result_df["carrier_name"].unique():
-        carrier_data = result_df[result_df["carrier_name"] == carrier].sort_values(
-            "date_dt"
-        )
-        list_status = carrier_data["list_status"].iloc[0]
-        is_eligible = list_status in ["wal", "nl"]
-
-        # Skip if not eligible or in exclusion period
-        if not is_eligible or carrier_data["is_excluded"].any():
-            for _, day in carrier_data.iterrows():
-                base_result.append(
-                    {
-                        "carrier_name": carrier,
-                        "date": day["rings_date"],
-                        "list_status": day["list_status"],
-                        "violation_type": (
-                            "No Violation (December Exclusion)"
-                            if day["is_excluded"]
-                            else "No Violation"
-                        ),
-                        "remedy_total": 0.0,
-                        "total_hours": day["daily_hours"],
-                        "display_indicator": day["display_indicator"],
-                        "85F_5th_date": "",
-                    }
-                )
-            continue
-
-        # Check for 8-hour days (excluding Sundays)
-        non_sunday_mask = carrier_data["day_of_week"] != 6
-        worked_day_mask = carrier_data["daily_hours"] > 0
-        had_eight_hour_day = (
-            carrier_data[non_sunday_mask & worked_day_mask]["daily_hours"]
-            .between(0.01, 8.00, inclusive="both")
-            .any()
-        )
-
-        if had_eight_hour_day:
-            # No violation if carrier had an 8-hour day
-            for _, day in carrier_data.iterrows():
-                base_result.append(
-                    {
-                        "carrier_name": carrier,
-                        "date": day["rings_date"],
-                        "list_status": day["list_status"],
-                        "violation_type": "No Violation",
-                        "remedy_total": 0.0,
-                        "total_hours": day["daily_hours"],
-                        "display_indicator": day["display_indicator"],
-                        "85F_5th_date": "",
-                    }
-                )
-            continue
-
-        # Find potential violation days
-        overtime_days = carrier_data[
-            (carrier_data["day_of_week"] != 6)  # Exclude Sundays
-            & (carrier_data["daily_hours"] > 8)
-            & (
-                ~carrier_data["code"].str.contains("ns day", case=False, na=False)
-            )  # Exclude non-scheduled days
-        ].sort_values("date_dt")
-
-        violation_date = None
-        if len(overtime_days) >= 5:
-            # Get the 5th overtime day in sequence
-            violation_date = overtime_days.iloc[4]["rings_date"]
-
-        # Add all days for this carrier
-        for _, day in carrier_data.iterrows():
-            # Extract just the date part for comparison by splitting on space
-            day_date = (
-                day["rings_date"].split(" ")[0]
-                if isinstance(day["rings_date"], str)
-                else day["rings_date"]
-            )
-            is_violation = day_date == violation_date
-
-            base_result.append(
-                {
-                    "carrier_name": carrier,
-                    "date": day["rings_date"],
-                    "list_status": day["list_status"],
-                    "violation_type": (
-                        "8.5.F 5th More Than 4 Days of Overtime in a Week"
-                        if is_violation
-                        else "No Violation"
-                    ),
-                    "remedy_total": (
-                        round(max(0, day["daily_hours"] - 8), 2)
-                        if is_violation
-                        else 0.0
-                    ),
-                    "total_hours": day["daily_hours"],
-                    "display_indicator": day["display_indicator"],
-                    "85F_5th_date": violation_date if is_violation else "",
-                }
-            )
-
-    # Convert to DataFrame and ensure all required columns are present
-    result_df = pd.DataFrame(base_result)
-    required_columns = [
-        "carrier_name",
-        "list_status",
-        "violation_type",
-        "date",
-        "remedy_total",
-        "total_hours",
-        "display_indicator",
-        "85F_5th_date",
-    ]
+    # Vectorized exclusion period check against the shared calendar
+    result_df["is_excluded"] = get_exclusion_calendar().is_excluded(
+        result_df["date_dt"]
+    )
+
+    # Order rows by carrier (first appearance) and date so each carrier's
+    # service week forms one contiguous, date-ordered block
+    result_df = result_df[result_df["carrier_name"].notna()]
+    if result_df.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    result_df["carrier_order"] = pd.factorize(result_df["carrier_name"])[0]
+    result_df = result_df.sort_values(
+        ["carrier_order", "date_dt"], kind="stable"
+    ).reset_index(drop=True)
+    week_groups = result_df.groupby(["carrier_order", "service_week"], sort=False)
+    group_id = week_groups.ngroup()
+
+    # Eligibility comes from the first day of the carrier's week
+    is_first_day = group_id.ne(group_id.shift())
+    first_status = result_df["list_status"][is_first_day]
+    first_status.index = group_id[is_first_day]
+    is_eligible = group_id.map(first_status).isin(["wal", "nl"])
+
+    # Skip weeks that are not eligible or touch the exclusion period
+    is_skipped = ~is_eligible | week_groups["is_excluded"].transform("any")
+
+    # No violation if the carrier had an 8-hour day (excluding Sundays)
+    non_sunday = result_df["day_of_week"] != 6
+    is_eight_hour_day = non_sunday & result_df["daily_hours"].between(
+        0.01, 8.00, inclusive="both"
+    )
+    had_eight_hour_day = is_eight_hour_day.groupby(group_id).transform("any")
+
+    # The 5th overtime day (excluding Sundays and non-scheduled days) in
+    # date order is the violation day
+    is_overtime_day = (
+        non_sunday & (result_df["daily_hours"] > 8) & ~result_df["is_ns_day"]
+    )
+    overtime_count = is_overtime_day.astype(int).groupby(group_id).cumsum()
+    is_violation = (
+        ~is_skipped & ~had_eight_hour_day & is_overtime_day & (overtime_count == 5)
+    )
+
+    result_df["violation_type"] = np.where(
+        is_violation,
+        "8.5.F 5th More Than 4 Days of Overtime in a Week",
+        np.where(
+            is_skipped & result_df["is_excluded"],
+            "No Violation (December Exclusion)",
+            "No Violation",
+        ),
+    )
+    result_df["remedy_total"] = np.where(
+        is_violation, (result_df["daily_hours"] - 8).clip(lower=0).round(2), 0.0
+    )
+    result_df["85F_5th_date"] = np.where(is_violation, result_df["rings_date"], "")
 
     # Return DataFrame with columns in the expected order
-    return result_df[required_columns]
+    return result_df.rename(
+        columns={"rings_date": "date", "total_hours": "raw_total_hours"}
+    ).rename(columns={"daily_hours": "total_hours"})[RESULT_COLUMNS]
@@ -6,8 +6,8 @@
 
 import pandas as pd
 
-from utils import set_display
-from violation_formulas.article_85f import load_exclusion_periods
+from utils import get_exclusion_calendar
+from violation_formulas.prepared_rings import PreparedRings
 
 
 def detect_85f_ns_violations(
@@ -16,7 +16,7 @@ def detect_85f_ns_violations(
     """Detect Article 8.5.F violations for overtime on non-scheduled days.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data containing:
+        data (PreparedRings): Prepared carrier work hour data containing:
             - carrier_name: Name of the carrier
             - list_status: WAL/NL/OTDL status
             - total_hours: Total hours worked
@@ -38,10 +38,8 @@ def detect_85f_ns_violations(
     # Set the pandas option to opt-in to the future behavior
     pd.set_option("future.no_silent_downcasting", True)
 
-    result_df = data.copy()
-
     # Handle empty DataFrame
-    if result_df.empty:
+    if data.empty:
         return pd.DataFrame(
             columns=[
                 "carrier_name",
@@ -54,29 +52,14 @@ def detect_85f_ns_violations(
             ]
         )
 
-    # Prepare data
-    result_df["total_hours"] = pd.to_numeric(
-        result_df["total"], errors="coerce"
-    ).fillna(0)
-    result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
-
-    # Update code column handling with the new pandas behavior
-    result_df["code"] = result_df["code"].fillna("").astype(str)
+    # Work on a copy of the shared prepared data
+    result_df = PreparedRings.ensure(data).copy()
 
-    # Check for NS day in code
-    result_df["is_ns_day"] = (
-        result_df["code"].str.strip().str.lower().str.contains("ns day", na=False)
+    # Vectorized exclusion period check against the shared calendar
+    result_df["is_excluded"] = get_exclusion_calendar().is_excluded(
+        result_df["date_dt"]
     )
 
-    # Convert dates to datetime for comparison
-    result_df["date_dt"] = pd.to_datetime(result_df["rings_date"])
-
-    # Load exclusion periods and get pre-calculated date range
-    _, exclusion_dates = load_exclusion_periods()
-
-    # Vectorized exclusion period check
-    result_df["is_excluded"] = result_df["date_dt"].isin(exclusion_dates)
-
     # Set exclusion period entries first
     result_df.loc[
         result_df["is_excluded"], "violation_type"
@@ -103,9 +86,6 @@ def detect_85f_ns_violations(
         violation_mask & (result_df["remedy_total"] > 0), "violation_type"
     ] = "8.5.F NS Overtime On a Non-Scheduled Day"
 
-    # Add display indicator
-    result_df["display_indicator"] = result_df.apply(set_display, axis=1)
-
     return result_df[
         [
             "carrier_name",
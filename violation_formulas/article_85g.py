@@ -4,16 +4,92 @@
 while non-OTDL carriers are working overtime.
 """
 
+import re
+
+import numpy as np
 import pandas as pd
 
-from utils import set_display
+from violation_formulas.prepared_rings import PreparedRings
+
+# Display indicators that automatically excuse an OTDL carrier
+AUTO_EXCUSAL_INDICATORS = [
+    "(sick)",
+    "(NS protect)",
+    "(holiday)",
+    "(guaranteed)",
+    "(annual)",
+]
+
+RESULT_COLUMNS = [
+    "carrier_name",
+    "date",
+    "violation_type",
+    "remedy_total",
+    "total_hours",
+    "hour_limit",
+    "list_status",
+    "trigger_carrier",
+    "trigger_hours",
+    "off_route_hours",
+    "display_indicator",
+]
+
+
+def normalize_maximized_status(date_maximized_status):
+    """Flatten OTDL maximization status into lookup tables.
+
+    Args:
+        date_maximized_status (dict, optional): Date-keyed dict of OTDL
+            maximization status. Values are either a bool or a dict holding
+            "is_maximized", an optional "excused_carriers" list and per-carrier
+            excusal flags keyed by carrier name.
+
+    Returns:
+        tuple: (status_df, excusal_df) where
+            - status_df is indexed by date with an is_maximized column
+            - excusal_df has date, carrier_key and excused columns, one row
+              per (date, carrier_key), with carrier_key stripped and lowercased
+    """
+    status_records = []
+    excusal_records = []
+    for date_str, status in (date_maximized_status or {}).items():
+        date = pd.to_datetime(date_str)
+        if not isinstance(status, dict):
+            status_records.append((date, bool(status)))
+            continue
+
+        status_records.append((date, status.get("is_maximized", False)))
+        carrier_excusals = {
+            str(k).strip().lower(): bool(v)
+            for k, v in status.items()
+            if k not in ["is_maximized", "excused_carriers"]
+        }
+        for carrier in status.get("excused_carriers", []):
+            carrier_excusals[str(carrier).strip().lower()] = True
+        excusal_records.extend(
+            (date, carrier, excused) for carrier, excused in carrier_excusals.items()
+        )
+
+    status_df = (
+        pd.DataFrame(status_records, columns=["date", "is_maximized"])
+        .astype({"date": "datetime64[ns]"})
+        .drop_duplicates("date", keep="last")
+        .set_index("date")
+    )
+    excusal_df = pd.DataFrame(
+        excusal_records, columns=["date", "carrier_key", "excused"]
+    ).astype({"date": "datetime64[ns]", "carrier_key": str, "excused": bool})
+    excusal_df = excusal_df.groupby(["date", "carrier_key"], as_index=False)[
+        "excused"
+    ].any()
+    return status_df, excusal_df
 
 
 def detect_85g_violations(data, date_maximized_status=None):
     """Detect Article 8.5.G violations for OTDL carriers not maximized.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data containing:
+        data (PreparedRings): Prepared carrier work hour data containing:
             - carrier_name: Name of the carrier
             - list_status: WAL/NL/OTDL status
             - total_hours: Total hours worked
@@ -34,250 +110,116 @@ def detect_85g_violations(data, date_maximized_status=None):
         - Not a Sunday
     """
 
-    # First prepare the basic data
-    result_df = data.copy()
-    result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
-
-    # Convert numeric columns for all carriers
-    result_df["total_hours"] = pd.to_numeric(
-        result_df["total"], errors="coerce"
-    ).fillna(0)
-    result_df["hour_limit"] = pd.to_numeric(
-        result_df["hour_limit"], errors="coerce"
-    ).fillna(12.00)
-
-    # Add display indicators for excusal checking
-    result_df["display_indicator"] = result_df.apply(set_display, axis=1)
-
-    # Convert dates to datetime for vectorized operations
-    result_df["date_dt"] = pd.to_datetime(result_df["rings_date"])
-    result_df["day_of_week"] = result_df["date_dt"].dt.strftime("%A")
+    # Start from the shared prepared data
+    result_df = PreparedRings.ensure(data).copy().reset_index(drop=True)
+    result_df = result_df[result_df["date_dt"].notna()].reset_index(drop=True)
+    if result_df.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
 
     # Vectorized checks for auto-excusal indicators
-    auto_excusal_indicators = [
-        "(sick)",
-        "(NS protect)",
-        "(holiday)",
-        "(guaranteed)",
-        "(annual)",
-    ]
-    result_df["is_auto_excused"] = result_df["display_indicator"].apply(
-        lambda x: any(indicator in str(x) for indicator in auto_excusal_indicators)
+    result_df["is_auto_excused"] = (
+        result_df["display_indicator"]
+        .astype(str)
+        .str.contains("|".join(map(re.escape, AUTO_EXCUSAL_INDICATORS)))
     )
-    result_df["is_sunday"] = result_df["day_of_week"].astype(str) == "Sunday"
-
-    # Create maximized status DataFrame for vectorized lookup
-    max_status_df = pd.DataFrame()
-    if date_maximized_status:
-        max_status_records = []
-        for date_str, status in date_maximized_status.items():
-            if isinstance(status, dict):
-                is_maximized = status.get("is_maximized", False)
-                excused_carriers = {
-                    str(c).strip().lower() for c in status.get("excused_carriers", [])
-                }
-                carrier_excusals = {
-                    str(k).strip().lower(): v
-                    for k, v in status.items()
-                    if k not in ["is_maximized", "excused_carriers"]
-                }
-                max_status_records.append(
-                    {
-                        "date": pd.to_datetime(date_str),
-                        "is_maximized": is_maximized,
-                        "excused_carriers": excused_carriers,
-                        "carrier_excusals": carrier_excusals,
-                    }
-                )
-            else:
-                max_status_records.append(
-                    {
-                        "date": pd.to_datetime(date_str),
-                        "is_maximized": bool(status),
-                        "excused_carriers": set(),
-                        "carrier_excusals": {},
-                    }
-                )
-        max_status_df = pd.DataFrame(max_status_records)
-
-    # Merge maximized status with result_df
-    if not max_status_df.empty:
-        result_df = pd.merge(
-            result_df, max_status_df, left_on="date_dt", right_on="date", how="left"
-        )
-    else:
-        result_df["is_maximized"] = False
-        result_df["excused_carriers"] = None
-        result_df["carrier_excusals"] = None
-
-    # Vectorized check for manually excused carriers
-    def check_manual_excusal(row):
-        if pd.isna(row["excused_carriers"]) and pd.isna(row["carrier_excusals"]):
-            return False
-        carrier_str = str(row["carrier_name"]).strip().lower()
-        excused_carriers = (
-            row["excused_carriers"]
-            if isinstance(row["excused_carriers"], set)
-            else set()
-        )
-        carrier_excusals = (
-            row["carrier_excusals"] if isinstance(row["carrier_excusals"], dict) else {}
-        )
-
-        return carrier_str in excused_carriers or carrier_excusals.get(
-            carrier_str, False
-        )
+    result_df["is_sunday"] = result_df["date_dt"].dt.dayofweek == 6
 
-    result_df["is_manually_excused"] = result_df.apply(check_manual_excusal, axis=1)
-
-    # Process each date group separately to match original implementation
-    final_results = []
-    for date, day_data in result_df.groupby("date_dt"):
-        date_str = date.strftime("%Y-%m-%d")
-        is_maximized = day_data["is_maximized"].iloc[0]
-
-        if is_maximized:
-            # Handle maximized case
-            for _, carrier_data in day_data.iterrows():
-                violation_type = (
-                    "No Violation (Auto Excused)"
-                    if carrier_data["is_auto_excused"] or carrier_data["is_sunday"]
-                    else (
-                        "No Violation (Manually Excused)"
-                        if carrier_data["is_manually_excused"]
-                        else (
-                            "No Violation (Maximized)"
-                            if carrier_data["total_hours"] >= carrier_data["hour_limit"]
-                            else "No Violation"
-                        )
-                    )
-                )
-
-                final_results.append(
-                    {
-                        "carrier_name": carrier_data["carrier_name"],
-                        "date": date_str,
-                        "violation_type": violation_type,
-                        "remedy_total": 0.0,
-                        "total_hours": carrier_data["total_hours"],
-                        "hour_limit": carrier_data["hour_limit"],
-                        "list_status": carrier_data["list_status"],
-                        "trigger_carrier": "",
-                        "trigger_hours": 0,
-                        "off_route_hours": 0,
-                        "display_indicator": carrier_data["display_indicator"],
-                    }
-                )
-            continue
-
-        # Find WAL/NL carriers working overtime
-        wal_nl_overtime = day_data[
-            (day_data["list_status"].isin(["wal", "nl"]))
-            & (day_data["total_hours"] > 8)
-        ]
-
-        if not wal_nl_overtime.empty:
-            # Get trigger carrier info
-            trigger_carrier = wal_nl_overtime.loc[
-                wal_nl_overtime["total_hours"].idxmax()
-            ]
-
-            # Process OTDL carriers
-            otdl_carriers = day_data[day_data["list_status"] == "otdl"]
-            for _, otdl in otdl_carriers.iterrows():
-                # Get display indicator
-                display_indicators = str(otdl["display_indicator"]).strip()
-
-                # Check for automatic excusal conditions
-                is_auto_excused = any(
-                    indicator in display_indicators
-                    for indicator in auto_excusal_indicators
-                )
-
-                violation_type = (
-                    "No Violation (Auto Excused)"
-                    if is_auto_excused or otdl["is_sunday"]
-                    else (
-                        "No Violation (Manually Excused)"
-                        if otdl["is_manually_excused"]
-                        else (
-                            "No Violation (Maximized)"
-                            if otdl["total_hours"] >= otdl["hour_limit"]
-                            else "8.5.G OTDL Not Maximized"
-                        )
-                    )
-                )
-
-                remedy_total = (
-                    max(0, round(otdl["hour_limit"] - otdl["total_hours"], 2))
-                    if violation_type == "8.5.G OTDL Not Maximized"
-                    else 0.0
-                )
-
-                final_results.append(
-                    {
-                        "carrier_name": otdl["carrier_name"],
-                        "date": date_str,
-                        "violation_type": violation_type,
-                        "remedy_total": remedy_total,
-                        "total_hours": otdl["total_hours"],
-                        "hour_limit": otdl["hour_limit"],
-                        "list_status": "otdl",
-                        "trigger_carrier": str(trigger_carrier["carrier_name"]),
-                        "trigger_hours": float(trigger_carrier["total_hours"]),
-                        "off_route_hours": float(
-                            trigger_carrier.get("off_route_hours", 0)
-                        ),
-                        "display_indicator": otdl["display_indicator"],
-                    }
-                )
-
-        # Add remaining carriers
-        processed_carriers = {
-            r["carrier_name"] for r in final_results if r["date"] == date_str
+    # Look up maximized dates and manual excusals with flat table joins
+    status_df, excusal_df = normalize_maximized_status(date_maximized_status)
+    result_df["carrier_key"] = (
+        result_df["carrier_name"].astype(str).str.strip().str.lower()
+    )
+    result_df["is_maximized"] = result_df["date_dt"].map(status_df["is_maximized"])
+    result_df = result_df.merge(
+        excusal_df.rename(columns={"date": "date_dt"}),
+        on=["date_dt", "carrier_key"],
+        how="left",
+        validate="many_to_one",
+    )
+    result_df["is_manually_excused"] = result_df["excused"].fillna(False).astype(bool)
+
+    # Dates missing from the status map are not maximized
+    is_maximized = result_df["is_maximized"].fillna(False).astype(bool)
+    is_otdl = result_df["list_status"] == "otdl"
+
+    # Trigger carrier per date: the WAL/NL carrier with the most hours over 8
+    # on a date that is not maximized (first one wins on ties)
+    overtime = result_df[
+        ~is_maximized
+        & result_df["list_status"].isin(["wal", "nl"])
+        & (result_df["total_hours"] > 8)
+    ]
+    trigger_rows = overtime.groupby("date_dt")["total_hours"].idxmax()
+    triggers = result_df.loc[trigger_rows.to_numpy(), ["carrier_name", "total_hours"]]
+    triggers.index = trigger_rows.index
+    has_trigger = result_df["date_dt"].isin(triggers.index)
+
+    # OTDL carriers on triggered dates are the only ones that can be in violation
+    is_checked = has_trigger & ~is_maximized & is_otdl
+
+    excusal_type = np.select(
+        [
+            result_df["is_auto_excused"] | result_df["is_sunday"],
+            result_df["is_manually_excused"],
+            result_df["total_hours"] >= result_df["hour_limit"],
+        ],
+        [
+            "No Violation (Auto Excused)",
+            "No Violation (Manually Excused)",
+            "No Violation (Maximized)",
+        ],
+        default="",
+    )
+    violation_type = np.where(
+        excusal_type != "",
+        excusal_type,
+        np.where(is_checked, "8.5.G OTDL Not Maximized", "No Violation"),
+    )
+    violation_type = np.where(
+        ~is_maximized & ~is_checked & ~is_otdl,
+        "No Violation (Non OTDL)",
+        violation_type,
+    )
+    is_violation = violation_type == "8.5.G OTDL Not Maximized"
+
+    trigger_carrier = result_df["date_dt"].map(triggers["carrier_name"])
+    trigger_hours = result_df["date_dt"].map(triggers["total_hours"])
+
+    final_results = pd.DataFrame(
+        {
+            "carrier_name": result_df["carrier_name"],
+            "date": result_df["date_dt"].dt.strftime("%Y-%m-%d"),
+            "violation_type": violation_type,
+            "remedy_total": np.where(
+                is_violation,
+                (result_df["hour_limit"] - result_df["total_hours"])
+                .round(2)
+                .clip(lower=0),
+                0.0,
+            ),
+            "total_hours": result_df["total_hours"],
+            "hour_limit": result_df["hour_limit"],
+            "list_status": result_df["list_status"],
+            "trigger_carrier": np.where(is_checked, trigger_carrier.astype(str), ""),
+            "trigger_hours": np.where(is_checked, trigger_hours, 0.0),
+            # Trigger off-route hours are not tracked for 8.5.G
+            "off_route_hours": 0.0,
+            "display_indicator": result_df["display_indicator"],
         }
-        remaining_carriers = day_data[
-            ~day_data["carrier_name"].isin(processed_carriers)
-        ]
-
-        for _, carrier_data in remaining_carriers.iterrows():
-            # For non-OTDL carriers, always use "No Violation (Non OTDL)"
-            violation_type = (
-                "No Violation (Non OTDL)"
-                if carrier_data["list_status"] != "otdl"
-                else (
-                    "No Violation (Auto Excused)"
-                    if carrier_data["is_auto_excused"] or carrier_data["is_sunday"]
-                    else (
-                        "No Violation (Manually Excused)"
-                        if carrier_data["is_manually_excused"]
-                        else (
-                            "No Violation (Maximized)"
-                            if carrier_data["total_hours"] >= carrier_data["hour_limit"]
-                            else "No Violation"
-                        )
-                    )
-                )
-            )
+    )
 
-            final_results.append(
-                {
-                    "carrier_name": carrier_data["carrier_name"],
-                    "date": date_str,
-                    "violation_type": violation_type,
-                    "remedy_total": 0.0,
-                    "total_hours": carrier_data["total_hours"],
-                    "hour_limit": carrier_data["hour_limit"],
-                    "list_status": carrier_data["list_status"],
-                    "trigger_carrier": "",
-                    "trigger_hours": 0,
-                    "off_route_hours": 0,
-                    "display_indicator": carrier_data["display_indicator"],
-                }
+    # Keep the date-by-date row order (checked OTDL carriers first on triggered
+    # dates) before the final sort by carrier name
+    final_results = final_results.iloc[
+        np.lexsort(
+            (
+                np.arange(len(final_results)),
+                ~is_checked.to_numpy(),
+                result_df["date_dt"].to_numpy(),
             )
+        )
+    ]
 
-    return (
-        pd.DataFrame(final_results)
-        .sort_values("carrier_name", ascending=True)
-        .reset_index(drop=True)
+    return final_results.sort_values("carrier_name", ascending=True).reset_index(
+        drop=True
     )
@@ -4,8 +4,27 @@
 formula modules for data preparation, move processing, and calculations.
 """
 
+import numpy as np
 import pandas as pd
 
+MOVES_COLUMNS = ["own_route_hours", "off_route_hours", "formatted_moves"]
+EMPTY_MOVES_VALUES = {"none", "", "no moves"}
+
+# Service weeks run Saturday through Friday, i.e. weekly periods ending Friday
+SERVICE_WEEK_FREQ = "W-FRI"
+
+
+def get_service_week(dates):
+    """Map dates to their Saturday-to-Friday service week.
+
+    Args:
+        dates (pd.Series): Datetime values
+
+    Returns:
+        pd.Series: Weekly periods ending on Friday, aligned with dates
+    """
+    return dates.dt.to_period(SERVICE_WEEK_FREQ)
+
 
 def process_moves_vectorized(moves_str, code):
     """Process carrier route moves and calculate hours by assignment.
@@ -24,7 +43,7 @@ def process_moves_vectorized(moves_str, code):
         - Handles empty/invalid move strings gracefully
         - Returns 0 hours and "No Moves" for invalid input
         - Rounds hours to 2 decimal places
-        - Used by prepare_data_for_violations for move processing
+        - Single-string reference for process_moves_columns
     """
     if not isinstance(moves_str, str) or moves_str.strip().lower() in [
         "none",
@@ -76,33 +95,137 @@ def process_moves_vectorized(moves_str, code):
         )
 
 
-def prepare_data_for_violations(data):
-    """Prepare and standardize carrier data for violation detection.
+def explode_moves(moves):
+    """Explode a column of moves strings into a flat table of individual moves.
+
+    Each moves string is split once and reshaped into (start, end, route)
+    triples. Rows whose string is empty, malformed (not a multiple of three
+    fields) or holds a non-numeric time are dropped entirely, matching the
+    all-or-nothing behavior of process_moves_vectorized.
 
     Args:
-        data (pd.DataFrame): Raw carrier work hour data
+        moves (pd.Series): Comma-separated moves strings ("start,end,route,...")
 
     Returns:
-        pd.DataFrame: Standardized data with consistent column names and types
+        pd.DataFrame: One row per move with columns:
+            - row_id (int): Position of the source row in ``moves``
+            - start (float): Move start time
+            - end (float): Move end time
+            - route (str): Route the carrier moved to
+            - hours (float): Hours on the move, clipped at zero
     """
-    result_df = data.copy()
+    empty = pd.DataFrame(
+        {
+            "row_id": pd.Series(dtype="int64"),
+            "start": pd.Series(dtype="float64"),
+            "end": pd.Series(dtype="float64"),
+            "route": pd.Series(dtype="object"),
+            "hours": pd.Series(dtype="float64"),
+        }
+    )
+    if len(moves) == 0:
+        return empty
+
+    values = pd.Series(moves).reset_index(drop=True)
+    is_text = values.map(lambda x: isinstance(x, str)).astype(bool)
+    text = values.where(is_text, "").astype(str).str.strip()
+    has_moves = is_text & ~text.str.lower().isin(EMPTY_MOVES_VALUES)
+    if not has_moves.any():
+        return empty
+
+    tokens = text[has_moves].str.split(",")
+    counts = tokens.str.len()
+    tokens = tokens[counts % 3 == 0]
+    if tokens.empty:
+        return empty
+    counts = counts[tokens.index].to_numpy()
+
+    # Flatten every token once; each source row occupies a contiguous block
+    flat = pd.Series(np.concatenate(tokens.to_numpy())).str.strip()
+    row_ids = np.repeat(tokens.index.to_numpy(), counts)[0::3]
+    start = pd.to_numeric(flat.iloc[0::3], errors="coerce").to_numpy()
+    end = pd.to_numeric(flat.iloc[1::3], errors="coerce").to_numpy()
+    route = flat.iloc[2::3].to_numpy()
+
+    # A single unparseable time invalidates the whole moves string
+    bad_rows = np.unique(row_ids[np.isnan(start) | np.isnan(end)])
+    keep = ~np.isin(row_ids, bad_rows)
+
+    return pd.DataFrame(
+        {
+            "row_id": row_ids[keep],
+            "start": start[keep],
+            "end": end[keep],
+            "route": route[keep],
+            "hours": np.clip(end[keep] - start[keep], 0, None),
+        }
+    )
+
+
+def process_moves_columns(moves, codes):
+    """Columnar equivalent of process_moves_vectorized for whole DataFrames.
 
-    # Convert list_status to lowercase and strip
-    result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
+    Splits the full moves column once, explodes it into individual moves and
+    aggregates off-route hours and formatted move text per row with grouped
+    reductions instead of building DataFrames row by row.
 
-    # Create mask for WAL/NL carriers
-    result_df["is_wal_nl"] = result_df["list_status"].isin(["wal", "nl"])
+    Args:
+        moves (pd.Series): Comma-separated moves strings
+        codes (pd.Series): Carrier code for each row, aligned with ``moves``
+
+    Returns:
+        pd.DataFrame: Indexed like ``moves`` with columns:
+            - own_route_hours (float): Always 0.0, derived by the caller
+            - off_route_hours (float): Hours worked on routes other than code
+            - formatted_moves (str): Per-route hours summary or "No Moves"
+    """
+    n_rows = len(moves)
+    result = pd.DataFrame(
+        {
+            "own_route_hours": np.zeros(n_rows),
+            "off_route_hours": np.zeros(n_rows),
+            "formatted_moves": np.full(n_rows, "No Moves", dtype=object),
+        },
+        index=moves.index,
+    )
 
-    # Ensure numeric columns
-    result_df["total_hours"] = pd.to_numeric(
-        result_df["total"], errors="coerce"
-    ).fillna(0)
+    exploded = explode_moves(moves)
+    if exploded.empty:
+        return result
+
+    row_ids = exploded["row_id"].to_numpy()
+    code_lower = codes.fillna("").astype(str).str.lower().to_numpy()
+    is_off_route = exploded["route"].str.lower().to_numpy() != code_lower[row_ids]
+    result["off_route_hours"] = np.bincount(
+        row_ids,
+        weights=np.where(is_off_route, exploded["hours"].to_numpy(), 0.0),
+        minlength=n_rows,
+    )
 
-    # Process moves for each row
-    moves_data = result_df.apply(
-        lambda x: process_moves_vectorized(x.get("moves", "none"), x["code"]), axis=1
+    route_hours = (
+        exploded.groupby(["row_id", "route"])["hours"].sum().round(2).reset_index()
     )
-    result_df[["own_route_hours", "off_route_hours", "formatted_moves"]] = moves_data
+    lines = "rt" + route_hours["route"] + " " + route_hours["hours"].astype(str)
+    formatted = lines.groupby(route_hours["row_id"]).agg("\n".join)
+    formatted_moves = result["formatted_moves"].to_numpy()
+    formatted_moves[formatted.index.to_numpy()] = formatted.to_numpy()
+    result["formatted_moves"] = formatted_moves
+
+    return result
+
+
+def prepare_data_for_violations(data):
+    """Split carrier hours into own-route and off-route hours.
+
+    Args:
+        data (pd.DataFrame): Working copy of a PreparedRings frame (see
+            violation_formulas.prepared_rings), modified in place
+
+    Returns:
+        pd.DataFrame: The same frame with own_route_hours, off_route_hours and
+            formatted_moves adjusted for the carrier's list status
+    """
+    result_df = data
 
     # Calculate own_route_hours as total_hours - off_route_hours
     result_df["own_route_hours"] = (
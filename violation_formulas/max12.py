@@ -6,17 +6,16 @@
 """
 
 import numpy as np
-import pandas as pd
 
-from utils import load_exclusion_periods
-from violation_formulas.formula_utils import process_moves_vectorized
+from utils import get_exclusion_calendar
+from violation_formulas.prepared_rings import PreparedRings
 
 
 def detect_MAX_12(data, date_maximized_status=None):
     """Detect violations of maximum daily work hour limits.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data containing:
+        data (PreparedRings): Prepared carrier work hour data containing:
             - carrier_name: Name of the carrier
             - list_status: WAL/NL/OTDL/PTF status
             - total: Total hours worked
@@ -56,31 +55,13 @@ def detect_MAX_12(data, date_maximized_status=None):
     if "list_status" not in data.columns:
         raise ValueError("The 'list_status' column is missing from the data")
 
-    # Prepare data
-    result_df = data.copy()
-    result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
-    result_df["total_hours"] = pd.to_numeric(
-        result_df["total"], errors="coerce"
-    ).fillna(0)
-
-    # Process moves vectorized
-    moves_result = result_df.apply(
-        lambda x: process_moves_vectorized(x.get("moves", "none"), x["code"]), axis=1
-    )
-    result_df = pd.concat([result_df, moves_result], axis=1)
-
-    # Convert dates to datetime for comparison
-    result_df["date_dt"] = pd.to_datetime(result_df["rings_date"])
-
-    # Load exclusion periods
-    exclusion_periods, all_dates = load_exclusion_periods()
-
-    # Check for exclusion period
-    def is_in_exclusion_period(date):
-        return date in all_dates
+    # Work on a copy of the shared prepared data
+    result_df = PreparedRings.ensure(data).copy()
 
     # Mark exclusion periods
-    result_df["is_excluded"] = result_df["date_dt"].apply(is_in_exclusion_period)
+    result_df["is_excluded"] = get_exclusion_calendar().is_excluded(
+        result_df["date_dt"]
+    )
 
     # Determine if WAL carriers are working off assignment
     result_df["is_working_off_assignment"] = (
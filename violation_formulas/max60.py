@@ -5,19 +5,17 @@
 """
 
 import numpy as np
-import pandas as pd
 
-from utils import (
-    load_exclusion_periods,
-    set_display,
-)
+from utils import get_exclusion_calendar
+from violation_formulas.formula_utils import get_service_week
+from violation_formulas.prepared_rings import PreparedRings
 
 
 def detect_MAX_60(data, date_maximized_status=None):
     """Detect violations of maximum weekly work hour limits.
 
     Args:
-        data (pd.DataFrame): Carrier work hour data containing:
+        data (PreparedRings): Prepared carrier work hour data containing:
             - carrier_name: Name of the carrier
             - list_status: WAL/NL/OTDL status
             - total_hours: Total hours worked
@@ -47,40 +45,27 @@ def detect_MAX_60(data, date_maximized_status=None):
 
         Processing:
         - Analyzes all carriers except PTFs
-        - Aggregates hours across entire service week
+        - Aggregates hours across each Saturday-to-Friday service week, so
+          cumulative hours restart at every week boundary of the range
         - Considers all forms of paid time toward 60-hour limit
         - Maintains complete carrier roster for reporting consistency
         - Rounds remedy hours to 2 decimal places
         - December exclusion applies to all carriers
     """
     # Keep all carriers but mark eligible ones
-    result_df = data.copy()
-    result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
-
-    # Convert numeric columns for all carriers
-    numeric_cols = ["total", "leave_time"]
-    for col in numeric_cols:
-        result_df[col] = pd.to_numeric(result_df[col], errors="coerce").fillna(0)
+    result_df = PreparedRings.ensure(data).copy()
 
     # Calculate daily hours vectorized for all carriers
     result_df["daily_hours"] = np.where(
-        result_df["leave_time"] <= result_df["total"],
-        result_df[["total", "leave_time"]].max(axis=1),
-        result_df["total"] + result_df["leave_time"],
+        result_df["leave_hours"] <= result_df["total_hours"],
+        result_df[["total_hours", "leave_hours"]].max(axis=1),
+        result_df["total_hours"] + result_df["leave_hours"],
     )
 
-    # Convert dates to datetime for comparison
-    result_df["date_dt"] = pd.to_datetime(result_df["rings_date"])
-
-    # Load exclusion periods
-    exclusion_periods, all_dates = load_exclusion_periods()
-
-    # Check for exclusion period
-    def is_in_exclusion_period(date):
-        return date in all_dates
-
     # Mark exclusion periods
-    result_df["is_excluded"] = result_df["date_dt"].apply(is_in_exclusion_period)
+    result_df["is_excluded"] = get_exclusion_calendar().is_excluded(
+        result_df["date_dt"]
+    )
 
     # Group by carrier and date
     daily_totals = (
@@ -89,29 +74,22 @@ def is_in_exclusion_period(date):
             {
                 "daily_hours": "sum",
                 "list_status": "first",
-                "leave_type": "first",
-                "code": "first",
-                "total": "sum",
-                "leave_time": "sum",
+                "display_indicator": "first",
                 "is_excluded": "first",
             }
         )
         .reset_index()
     )
 
-    # Calculate display indicators vectorized
-    daily_totals["display_indicator"] = daily_totals.apply(set_display, axis=1)
-
-    # Calculate cumulative hours for all carriers
-    daily_totals["cumulative_hours"] = daily_totals.groupby("carrier_name")[
-        "daily_hours"
-    ].cumsum()
+    # Calculate cumulative hours for each carrier's service week
+    daily_totals["service_week"] = get_service_week(daily_totals["date_dt"])
+    grouped = daily_totals.groupby(["carrier_name", "service_week"])
+    daily_totals["cumulative_hours"] = grouped["daily_hours"].cumsum()
 
     # Initialize remedy_total
     daily_totals["remedy_total"] = 0.0
 
     # Calculate violations vectorized only for eligible carriers
-    grouped = daily_totals.groupby("carrier_name")
     last_day_mask = grouped["rings_date"].transform("max") == daily_totals["rings_date"]
     over_60_mask = daily_totals["cumulative_hours"] > 60.0
 
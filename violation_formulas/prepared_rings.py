@@ -0,0 +1,220 @@
+"""Shared clock ring preparation for violation detection.
+
+Every violation detector starts from the same clock ring data and derives
+the same handful of columns from it: normalized list status, numeric hours,
+parsed dates, display indicators and the parsed moves breakdown. This module
+computes those derived columns once per refresh so that all registered
+detectors can share a single prepared frame.
+"""
+
+import pandas as pd
+
+from utils import get_display_indicators
+from violation_formulas.formula_utils import (
+    MOVES_COLUMNS,
+    get_service_week,
+    process_moves_columns,
+)
+
+
+class PreparedRings:
+    """Clock ring data with the derived columns shared by all detectors.
+
+    The prepared frame keeps every original column and adds:
+        - list_status: Stripped and lowercased list status
+        - is_wal_nl (bool): Carrier is on the WAL or NL list
+        - total_hours (float): Numeric total hours, 0 when missing
+        - leave_hours (float): Numeric leave time, 0 when missing
+        - hour_limit (float): Numeric hour limit, 12.00 when missing
+          (only when the input has an hour_limit column)
+        - date_dt (datetime): Parsed rings_date
+        - is_ns_day (bool): Code marks a non-scheduled day
+        - display_indicator (str): Indicator from get_display_indicators
+        - own_route_hours, off_route_hours, formatted_moves: Raw moves
+          breakdown from process_moves_columns
+
+    Attributes:
+        frame (pd.DataFrame): The prepared data. Detectors must treat it as
+            read-only and work on copy() when they add their own columns.
+    """
+
+    # Clock ring and carrier list columns each prepared column is computed from
+    DERIVED_FROM = {
+        "list_status": ("list_status",),
+        "is_wal_nl": ("list_status",),
+        "total_hours": ("total",),
+        "leave_hours": ("leave_time",),
+        "hour_limit": ("hour_limit",),
+        "date_dt": ("rings_date",),
+        "is_ns_day": ("code",),
+        "display_indicator": ("code", "leave_type"),
+        "own_route_hours": ("moves", "code"),
+        "off_route_hours": ("moves", "code"),
+        "formatted_moves": ("moves", "code"),
+    }
+
+    # Partitions from split_by_service_week(), computed on first use
+    _service_weeks = None
+
+    def __init__(self, data):
+        """Prepare clock ring data for violation detection.
+
+        Args:
+            data (pd.DataFrame): Clock ring data merged with the carrier list
+        """
+        self.frame = self._prepare(data)
+
+    @classmethod
+    def ensure(cls, data):
+        """Return data as PreparedRings, preparing it only if needed.
+
+        Args:
+            data (Union[PreparedRings, pd.DataFrame]): Prepared or raw data
+
+        Returns:
+            PreparedRings: The prepared clock ring data
+        """
+        if isinstance(data, cls):
+            return data
+        return cls(data)
+
+    @classmethod
+    def from_frame(cls, frame):
+        """Wrap an already prepared frame without preparing it again.
+
+        Args:
+            frame (pd.DataFrame): Frame with the prepared columns
+
+        Returns:
+            PreparedRings: The prepared clock ring data
+        """
+        prepared = object.__new__(cls)
+        prepared.frame = frame
+        return prepared
+
+    @classmethod
+    def source_columns(cls, columns):
+        """Get the input columns that prepared columns are computed from.
+
+        Args:
+            columns (Iterable[str]): Prepared column names
+
+        Returns:
+            frozenset: Clock ring and carrier list column names; columns that
+                are not derived are their own source
+        """
+        sources = set()
+        for column in columns:
+            sources.update(cls.DERIVED_FROM.get(column, (column,)))
+        return frozenset(sources)
+
+    @property
+    def empty(self):
+        """bool: True if the prepared frame has no rows."""
+        return self.frame.empty
+
+    @property
+    def columns(self):
+        """pd.Index: Columns of the prepared frame."""
+        return self.frame.columns
+
+    def for_dates(self, dates):
+        """Return the prepared rows for the given dates without re-preparing.
+
+        Args:
+            dates (Iterable[str]): Dates to keep, as YYYY-MM-DD strings
+
+        Returns:
+            PreparedRings: Prepared data restricted to dates
+        """
+        return self.from_frame(
+            self.frame[self.frame["date_dt"].isin(pd.to_datetime(list(dates)))]
+        )
+
+    def split_by_service_week(self):
+        """Partition the prepared rows by Saturday-to-Friday service week.
+
+        Rows keep their order within each week. The partitions are computed
+        once and reused; rows without a date are not in any partition.
+
+        Returns:
+            dict: Weekly period to PreparedRings, in week order
+        """
+        if self._service_weeks is None:
+            weeks = get_service_week(self.frame["date_dt"])
+            self._service_weeks = {
+                week: self.from_frame(part)
+                for week, part in self.frame.groupby(weeks, sort=True)
+            }
+        return self._service_weeks
+
+    def copy(self):
+        """Return a working copy of the prepared frame for a single detector.
+
+        Returns:
+            pd.DataFrame: Copy of the prepared frame
+        """
+        return self.frame.copy()
+
+    @staticmethod
+    def _prepare(data):
+        """Compute the shared derived columns.
+
+        Args:
+            data (pd.DataFrame): Clock ring data merged with the carrier list
+
+        Returns:
+            pd.DataFrame: Copy of data with the derived columns added
+        """
+        result_df = data.copy()
+
+        if "list_status" in result_df.columns:
+            result_df["list_status"] = result_df["list_status"].str.strip().str.lower()
+            result_df["is_wal_nl"] = result_df["list_status"].isin(["wal", "nl"])
+        else:
+            result_df["is_wal_nl"] = False
+
+        result_df["total_hours"] = pd.to_numeric(
+            _column(result_df, "total", 0), errors="coerce"
+        ).fillna(0)
+        result_df["leave_hours"] = pd.to_numeric(
+            _column(result_df, "leave_time", 0), errors="coerce"
+        ).fillna(0)
+        if "hour_limit" in result_df.columns:
+            result_df["hour_limit"] = pd.to_numeric(
+                result_df["hour_limit"], errors="coerce"
+            ).fillna(12.00)
+
+        result_df["date_dt"] = pd.to_datetime(_column(result_df, "rings_date", None))
+
+        codes = _column(result_df, "code", "")
+        result_df["is_ns_day"] = (
+            codes.fillna("")
+            .astype(str)
+            .str.strip()
+            .str.lower()
+            .str.contains("ns day", na=False)
+        )
+
+        result_df["display_indicator"] = get_display_indicators(result_df)
+
+        moves_data = process_moves_columns(_column(result_df, "moves", "none"), codes)
+        result_df[MOVES_COLUMNS] = moves_data
+
+        return result_df
+
+
+def _column(data, name, default):
+    """Return a column of data, or a Series of default if it is missing.
+
+    Args:
+        data (pd.DataFrame): Source data
+        name (str): Column name
+        default: Fill value used when the column does not exist
+
+    Returns:
+        pd.Series: The column aligned with data's index
+    """
+    if name in data.columns:
+        return data[name]
+    return pd.Series(default, index=data.index, dtype=object)
@@ -0,0 +1,349 @@
+"""Prepared clock rings shared with worker processes.
+
+Detectors run in a process pool for large date ranges, where the prepared
+frame is too big to pickle once per detector. SharedPreparedRings copies the
+prepared columns into a single shared memory block once; worker processes
+attach to the block by name and rebuild the frame from views of it:
+
+    - Numeric, boolean and datetime columns are stored as raw arrays and
+      wrapped without copying.
+    - Text columns are stored Arrow-style as UTF-8 bytes, end offsets and a
+      null code per row, and decoded once per worker.
+    - Any other column falls back to being pickled with the description.
+
+The description passed to workers is small and picklable; the block is
+removed when the SharedPreparedRings is closed.
+"""
+
+import pickle
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from violation_formulas.prepared_rings import PreparedRings
+
+# Offsets of arrays in the shared block are aligned to this many bytes
+_ALIGNMENT = 64
+
+# Null codes stored for each row of a text column
+_TEXT_VALUE = 0
+_TEXT_NONE = 1
+_TEXT_NAN = 2
+
+# Largest rows x width text column decoded through a fixed-width array
+_MAX_TEXT_CELLS = 1 << 24
+
+# Prepared data attached by this worker process, keyed by block name
+_attached = {}
+
+# Released blocks that were still referenced when closed, retried on release
+_unclosed = []
+
+
+class SharedPreparedRings:
+    """PreparedRings columns copied into a shared memory block.
+
+    Use as a context manager, or call close() once every worker is done with
+    the block.
+
+    Attributes:
+        spec (dict): Picklable description of the block and its columns,
+            passed to attach_prepared_rings() in the workers
+    """
+
+    def __init__(self, prepared):
+        """Copy the prepared frame into shared memory.
+
+        Args:
+            prepared (PreparedRings): The prepared clock ring data
+        """
+        frame = prepared.frame
+        self._arrays = []
+        self._size = 0
+        columns = [(name, self._describe_column(frame[name])) for name in frame.columns]
+        index = self._describe_index(frame.index)
+
+        self._block = shared_memory.SharedMemory(create=True, size=max(self._size, 1))
+        for offset, array in self._arrays:
+            self._view(array.dtype.str, array.shape, offset)[...] = array
+        self._arrays = []
+
+        self.spec = {
+            "block": self._block.name,
+            "columns": columns,
+            "index": index,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Release and remove the shared memory block."""
+        if self._block is None:
+            return
+        self._block.close()
+        try:
+            self._block.unlink()
+        except FileNotFoundError:
+            pass
+        self._block = None
+
+    def _view(self, dtype, shape, offset):
+        """Get a writable array over part of the block."""
+        return np.ndarray(shape, dtype=dtype, buffer=self._block.buf, offset=offset)
+
+    def _add_array(self, array):
+        """Reserve space for an array and describe where it will be stored.
+
+        Args:
+            array (np.ndarray): Array to copy into the block
+
+        Returns:
+            dict: The dtype, shape and offset of the stored array
+        """
+        array = np.ascontiguousarray(array)
+        offset = -(-self._size // _ALIGNMENT) * _ALIGNMENT
+        self._arrays.append((offset, array))
+        self._size = offset + array.nbytes
+        return {"dtype": array.dtype.str, "shape": array.shape, "offset": offset}
+
+    def _describe_column(self, column):
+        """Describe how a column is stored.
+
+        Args:
+            column (pd.Series): Column of the prepared frame
+
+        Returns:
+            dict: Column description with its storage kind
+        """
+        values = column.to_numpy()
+        if isinstance(column.dtype, np.dtype) and column.dtype != object:
+            return {"kind": "array", "values": self._add_array(values)}
+
+        text = self._encode_text(values)
+        if text is not None:
+            codes, offsets, data = text
+            return {
+                "kind": "text",
+                "codes": self._add_array(codes),
+                "offsets": self._add_array(offsets),
+                "data": self._add_array(data),
+            }
+
+        return {"kind": "pickled", "values": pickle.dumps(column)}
+
+    def _describe_index(self, index):
+        """Describe how the frame index is stored.
+
+        Args:
+            index (pd.Index): Index of the prepared frame
+
+        Returns:
+            dict: Index description with its storage kind
+        """
+        if isinstance(index, pd.RangeIndex):
+            return {
+                "kind": "range",
+                "start": index.start,
+                "stop": index.stop,
+                "step": index.step,
+                "name": index.name,
+            }
+        if not isinstance(index, pd.MultiIndex) and index.dtype != object:
+            return {
+                "kind": "array",
+                "values": self._add_array(index.to_numpy()),
+                "name": index.name,
+            }
+        return {"kind": "pickled", "values": pickle.dumps(index)}
+
+    @staticmethod
+    def _encode_text(values):
+        """Encode an object column of strings and nulls as UTF-8 buffers.
+
+        Args:
+            values (np.ndarray): Object array
+
+        Returns:
+            tuple: (codes, offsets, data) arrays, or None if the column holds
+                anything other than str, None and NaN
+        """
+        codes = np.full(len(values), _TEXT_VALUE, dtype=np.uint8)
+        encoded = []
+        for i, value in enumerate(values):
+            if isinstance(value, str):
+                encoded.append(value.encode("utf-8", "surrogatepass"))
+                continue
+            if value is None:
+                codes[i] = _TEXT_NONE
+            elif isinstance(value, float) and value != value:
+                codes[i] = _TEXT_NAN
+            else:
+                return None
+            encoded.append(b"")
+
+        offsets = np.cumsum([len(item) for item in encoded], dtype=np.int64)
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return codes, offsets, data
+
+
+def _attached_array(buf, description):
+    """Get a read-only array over part of an attached block.
+
+    np.frombuffer keeps the block's buffer exported while the array is alive,
+    so the block cannot be closed under it.
+    """
+    shape = description["shape"]
+    array = np.frombuffer(
+        buf,
+        dtype=description["dtype"],
+        count=int(np.prod(shape)),
+        offset=description["offset"],
+    ).reshape(shape)
+    array.flags.writeable = False
+    return array
+
+
+def _decode_text(buf, description):
+    """Decode a text column stored by SharedPreparedRings._encode_text.
+
+    The data is decoded once and split into rows by offsets with numpy,
+    through a fixed-width unicode array when it stays small enough.
+    """
+    codes = _attached_array(buf, description["codes"])
+    offsets = _attached_array(buf, description["offsets"])
+    data = _attached_array(buf, description["data"])
+
+    # Convert byte offsets to character offsets by skipping continuation bytes
+    ends = offsets
+    if (data >= 0x80).any():
+        continuation = np.concatenate(([0], np.cumsum((data & 0xC0) == 0x80)))
+        ends = offsets - continuation[offsets]
+    starts = np.concatenate(([0], ends[:-1]))
+    lengths = ends - starts
+
+    text = data.tobytes().decode("utf-8", "surrogatepass")
+    width = int(lengths.max()) if len(lengths) else 0
+    if width and len(lengths) * width <= _MAX_TEXT_CELLS and "\0" not in text:
+        chars = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), np.uint32)
+        # Position of each character in the flattened rows x width array
+        row_starts = np.arange(len(lengths)) * width - starts
+        positions = np.arange(len(chars)) + np.repeat(row_starts, lengths)
+        cells = np.zeros(len(lengths) * width, dtype=np.uint32)
+        cells[positions] = chars
+        values = cells.view(f"<U{width}").astype(object)
+    else:
+        values = np.array(
+            [text[start:end] for start, end in zip(starts.tolist(), ends.tolist())],
+            dtype=object,
+        )
+
+    values[codes == _TEXT_NONE] = None
+    values[codes == _TEXT_NAN] = np.nan
+    return values
+
+
+def attach_prepared_rings(spec):
+    """Rebuild PreparedRings from a shared memory block in a worker process.
+
+    The result is cached per process, so detectors that run in the same
+    worker attach and decode the block only once. Attaching to a new block
+    releases the previous one.
+
+    Args:
+        spec (dict): SharedPreparedRings.spec
+
+    Returns:
+        PreparedRings: Prepared data over views of the shared block
+    """
+    cached = _attached.get(spec["block"])
+    if cached is not None:
+        return cached[1]
+
+    _release_attached()
+    block = shared_memory.SharedMemory(name=spec["block"])
+    buf = block.buf
+
+    columns = {}
+    for name, description in spec["columns"]:
+        if description["kind"] == "array":
+            columns[name] = _attached_array(buf, description["values"])
+        elif description["kind"] == "text":
+            columns[name] = _decode_text(buf, description)
+        else:
+            columns[name] = pickle.loads(description["values"])
+
+    index = spec["index"]
+    if index["kind"] == "range":
+        index = pd.RangeIndex(
+            index["start"], index["stop"], index["step"], name=index["name"]
+        )
+    elif index["kind"] == "array":
+        index = pd.Index(_attached_array(buf, index["values"]), name=index["name"])
+    else:
+        index = pickle.loads(index["values"])
+
+    for name, values in columns.items():
+        if isinstance(values, pd.Series):
+            columns[name] = values.set_axis(index)
+    frame = pd.DataFrame(columns, index=index, copy=False)
+
+    prepared = PreparedRings.from_frame(frame)
+    _attached[spec["block"]] = (block, prepared)
+    return prepared
+
+
+def _release_attached():
+    """Drop the prepared data attached by this process and close its blocks.
+
+    Blocks still referenced by a result are kept in _unclosed and closed on a
+    later release, once the result has been sent back and dropped.
+    """
+    while _attached:
+        _, (block, prepared) = _attached.popitem()
+        del prepared
+        _unclosed.append(block)
+
+    still_open = []
+    for block in _unclosed:
+        try:
+            block.close()
+        except BufferError:
+            still_open.append(block)
+    _unclosed[:] = still_open
+
+
+def run_shared_detector(spec, detector, date_maximized_status, week=None):
+    """Run one registered detector in a worker process on shared data.
+
+    Args:
+        spec (dict): SharedPreparedRings.spec
+        detector (ViolationDetector): The registered detector, registered in
+            this process too if it is missing
+        date_maximized_status (dict): Date-keyed dict of OTDL maximization status
+        week (pd.Period, optional): Service week to detect, from
+            PreparedRings.split_by_service_week(); None for the whole frame
+
+    Returns:
+        tuple: (violations, seconds) for the detector
+    """
+    # Imported here because violation_detection imports this module
+    from violation_detection import (
+        add_violation_detector,
+        detect_violations,
+        violation_detectors,
+    )
+
+    if detector.violation_type not in violation_detectors:
+        add_violation_detector(detector)
+    start = time.perf_counter()
+    prepared = attach_prepared_rings(spec)
+    if week is not None:
+        prepared = prepared.split_by_service_week()[week]
+    result = detect_violations(prepared, detector.violation_type, date_maximized_status)
+    return result, time.perf_counter() - start
@@ -505,6 +505,46 @@ def setup_model(self):
                 item = QStandardItem(str(value) if pd.notna(value) else "")
                 self.setItem(row, col, item)
 
+    def update_columns(self, data, columns):
+        """Replace the values of the given columns without rebuilding the model.
+
+        Args:
+            data (pd.DataFrame): New data with the same rows and columns as df
+            columns (list): Names of the columns whose cells changed
+        """
+        self.df = data
+        for column in columns:
+            col = data.columns.get_loc(column)
+            for row, value in enumerate(data[column]):
+                item = QStandardItem(str(value) if pd.notna(value) else "")
+                self.setItem(row, col, item)
+
+    def update_rows(self, data, rows):
+        """Replace the values of the given rows without rebuilding the model.
+
+        Args:
+            data (pd.DataFrame): New data with the same rows and columns as df
+            rows (Iterable[int]): Positions of the rows whose cells changed
+        """
+        self.df = data
+        rows = list(rows)
+        if not rows:
+            return
+
+        # Notify views once, so a sorting proxy re-sorts once rather than per cell
+        self.blockSignals(True)
+        try:
+            for row in rows:
+                for col in range(len(data.columns)):
+                    value = data.iloc[row, col]
+                    item = QStandardItem(str(value) if pd.notna(value) else "")
+                    self.setItem(row, col, item)
+        finally:
+            self.blockSignals(False)
+        self.dataChanged.emit(
+            self.index(min(rows), 0), self.index(max(rows), len(data.columns) - 1)
+        )
+
     def get_violation_column(self):
         """Get the index of the violation_type column."""
         try: